@@ -1,67 +1,143 @@
 import boto3
 import json
 import os
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List
 
-dynamodb = boto3.resource('dynamodb')
-lambda_client = boto3.client('lambda')
+from botocore.config import Config
 
 COMPANIES_TABLE = os.environ.get('COMPANIES_TABLE', 'job_scraper_companies')
 SCRAPER_FUNCTION = os.environ.get('SCRAPER_FUNCTION', 'job-scraper-function')
+ENABLED_INDEX = os.environ.get('ENABLED_INDEX', 'enabled_index')
+
+# Number of scraper invokes in flight at once, and attempts per invoke
+DISPATCH_CONCURRENCY = int(os.environ.get('DISPATCH_CONCURRENCY', '16'))
+INVOKE_MAX_ATTEMPTS = int(os.environ.get('INVOKE_MAX_ATTEMPTS', '3'))
+
+# Companies packed into each scraper invocation (scraped concurrently by the worker)
+COMPANIES_PER_INVOKE = int(os.environ.get('COMPANIES_PER_INVOKE', '6'))
+
+dynamodb = boto3.resource('dynamodb')
+# One pooled connection per dispatch thread
+lambda_client = boto3.client('lambda', config=Config(max_pool_connections=DISPATCH_CONCURRENCY))
 
 def lambda_handler(event, context):
     """
     Orchestrator Lambda: Reads companies from DynamoDB and triggers scraper for each.
     """
-    print("Starting orchestrator...")
+    # Trace id of every scraper invocation of this run (scrapers/tracing.py)
+    run_id = uuid.uuid4().hex
+    print(f"Starting orchestrator run {run_id}...")
     
-    companies_table = dynamodb.Table(COMPANIES_TABLE)
+    companies = get_enabled_companies()
     
-    # Scan for companies where check == 'Yes'
-    response = companies_table.scan(
-        FilterExpression='#check = :yes',
-        ExpressionAttributeNames={'#check': 'check'},
-        ExpressionAttributeValues={':yes': 'Yes'}
-    )
+    print(f"Found {len(companies)} companies to scrape")
     
-    companies = response['Items']
+    payloads = [{'companies': batch, 'run_id': run_id} for batch in pack_companies(companies)]
+    print(f"Packed into {len(payloads)} scraper invocations")
     
-    # Handle pagination for large tables
-    while 'LastEvaluatedKey' in response:
-        response = companies_table.scan(
-            FilterExpression='#check = :yes',
-            ExpressionAttributeNames={'#check': 'check'},
-            ExpressionAttributeValues={':yes': 'Yes'},
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
-        companies.extend(response['Items'])
+    dispatch = dispatch_scrapers(payloads)
     
-    print(f"Found {len(companies)} companies to scrape")
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': f"Triggered scraping for {len(dispatch['invoked'])} companies",
+            'run_id': run_id,
+            'companies': [c['company_name'] for c in companies],
+            'failed': dispatch['failed'],
+            'dispatch_latency_ms': dispatch['latency_ms']
+        })
+    }
+
+
+def pack_companies(companies: List[Dict[str, Any]]) -> List[List[Dict[str, str]]]:
+    """Splits the companies into batches of COMPANIES_PER_INVOKE for the scraper's batch mode."""
+    entries = [
+        {
+            'company_name': company['company_name'],
+            'url': company['url']
+        }
+        for company in companies
+    ]
+    size = max(1, COMPANIES_PER_INVOKE)
+    return [entries[i:i + size] for i in range(0, len(entries), size)]
+
+
+def dispatch_scrapers(payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Invokes the scraper asynchronously for every batch payload, DISPATCH_CONCURRENCY at a time.
+    Returns the invoked/failed company names and the wall time until the last invoke was accepted.
+    """
+    started = time.monotonic()
+    invoked = []
+    failed = []
     
-    # Invoke scraper for each company
-    invoked = 0
-    for company in companies:
-        try:
-            payload = {
-                'company_name': company['company_name'],
-                'url': company['url']
-            }
+    if payloads:
+        with ThreadPoolExecutor(max_workers=min(DISPATCH_CONCURRENCY, len(payloads))) as executor:
+            futures = {executor.submit(invoke_scraper, payload): payload for payload in payloads}
             
+            for future in as_completed(futures):
+                names = [c['company_name'] for c in futures[future]['companies']]
+                try:
+                    future.result()
+                    print(f"Triggered scraper for: {', '.join(names)}")
+                    invoked.extend(names)
+                except Exception as e:
+                    print(f"Error invoking scraper for {', '.join(names)}: {str(e)}")
+                    failed.extend(names)
+    
+    latency_ms = int((time.monotonic() - started) * 1000)
+    print(f"Dispatched {len(invoked)} invokes ({len(failed)} failed) in {latency_ms} ms")
+    
+    return {'invoked': invoked, 'failed': failed, 'latency_ms': latency_ms}
+
+
+def invoke_scraper(payload: Dict[str, Any]) -> None:
+    """
+    Async-invokes the scraper once, retrying with jittered backoff up to INVOKE_MAX_ATTEMPTS.
+    dispatched_at (epoch seconds) lets the scraper's trace show how long the invoke took to start it.
+    """
+    for attempt in range(1, INVOKE_MAX_ATTEMPTS + 1):
+        try:
             lambda_client.invoke(
                 FunctionName=SCRAPER_FUNCTION,
                 InvocationType='Event',  # Async invocation
-                Payload=json.dumps(payload)
+                Payload=json.dumps({**payload, 'dispatched_at': time.time()})
             )
-            
-            print(f"Triggered scraper for: {company['company_name']}")
-            invoked += 1
-            
-        except Exception as e:
-            print(f"Error invoking scraper for {company['company_name']}: {str(e)}")
+            return
+        except Exception:
+            if attempt == INVOKE_MAX_ATTEMPTS:
+                raise
+            time.sleep(random.uniform(0, 0.2 * (2 ** attempt)))
+
+
+def get_enabled_companies():
+    """
+    Queries the sparse enabled_index, which only holds companies with check == 'Yes',
+    projecting just the fields needed to invoke the scraper.
+    """
+    companies_table = dynamodb.Table(COMPANIES_TABLE)
     
-    return {
-        'statusCode': 200,
-        'body': json.dumps({
-            'message': f'Triggered scraping for {invoked} companies',
-            'companies': [c['company_name'] for c in companies]
-        })
-    }
\ No newline at end of file
+    query_args = {
+        'IndexName': ENABLED_INDEX,
+        'KeyConditionExpression': '#enabled = :yes',
+        'ProjectionExpression': 'company_name, #url',
+        'ExpressionAttributeNames': {'#enabled': 'enabled', '#url': 'url'},
+        'ExpressionAttributeValues': {':yes': 'Yes'}
+    }
+    
+    response = companies_table.query(**query_args)
+    companies = response['Items']
+    
+    # Handle pagination for large tables
+    while 'LastEvaluatedKey' in response:
+        response = companies_table.query(
+            ExclusiveStartKey=response['LastEvaluatedKey'],
+            **query_args
+        )
+        companies.extend(response['Items'])
+    
+    return companies
@@ -0,0 +1,147 @@
+"""
+Compact per-company set of known jobs.
+
+Each company's state item ('company#{name}' in the state table) carries the
+64-bit hashes of every job URL recorded for it: sorted, delta-encoded, packed
+big-endian and zlib-compressed into one binary attribute. The handler then
+learns which scraped jobs are new from the single GetItem it already does
+for the fingerprint, instead of a BatchGetItem per 100 URLs against the
+jobs table.
+
+Sets too large for one item (400 KB) are split by the top bits of the hash
+into 2^k shards. Shard 0 stays on the state item and shards 1.. go to
+'company#{name}#known#{i}' items. The set only narrows the candidates, and
+the conditional insert into the jobs table still decides, so a stale or
+incomplete set costs extra writes, never a missed or duplicate job.
+"""
+
+import hashlib
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+from scrapers.collector import canonical_url
+
+# 40k hashes is 320 KB before compression, safely under the 400 KB item limit
+MAX_HASHES_PER_SHARD = 40000
+
+
+def job_hash(url: str) -> int:
+    """64-bit identity of a job URL (canonical form, so cosmetic differences collide on purpose)."""
+    return int.from_bytes(hashlib.blake2b(canonical_url(url).encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def encode_hashes(hashes: Iterable[int]) -> bytes:
+    """Sorted deltas as big-endian uint64, zlib-compressed (the deltas' zero high bytes compress well)."""
+    ordered = sorted(set(hashes))
+    deltas = [value - previous for previous, value in zip([0] + ordered, ordered)]
+    return zlib.compress(struct.pack(f'>{len(deltas)}Q', *deltas), 9)
+
+
+def decode_hashes(blob: bytes) -> List[int]:
+    raw = zlib.decompress(blob)
+    hashes = []
+    total = 0
+    for (delta,) in struct.iter_unpack('>Q', raw):
+        total += delta
+        hashes.append(total)
+    return hashes
+
+
+class KnownJobs:
+    """The known-job hash set of one company."""
+
+    def __init__(self, hashes: Iterable[int] = (), shards: int = 1):
+        self.hashes = set(hashes)
+        self.shards = shards
+        self.changed = False
+
+    def __contains__(self, url: str) -> bool:
+        return job_hash(url) in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def add(self, urls: Iterable[str]) -> int:
+        """Adds the URLs' hashes; returns how many were new."""
+        before = len(self.hashes)
+        self.hashes.update(job_hash(url) for url in urls)
+        added = len(self.hashes) - before
+        self.changed = self.changed or added > 0
+        return added
+
+    def shard(self) -> List[bytes]:
+        """Encoded shards, split on the top hash bits until each fits in one item."""
+        bits = 0
+        while True:
+            buckets: List[List[int]] = [[] for _ in range(1 << bits)]
+            for value in self.hashes:
+                buckets[value >> (64 - bits) if bits else 0].append(value)
+            if max(len(bucket) for bucket in buckets) <= MAX_HASHES_PER_SHARD:
+                self.shards = len(buckets)
+                return [encode_hashes(bucket) for bucket in buckets]
+            bits += 1
+
+
+def state_key(company_name: str) -> str:
+    return f"company#{company_name}"
+
+
+def shard_key(company_name: str, index: int) -> str:
+    return f"company#{company_name}#known#{index}"
+
+
+def read_known_jobs(client, table_name: str, company_name: str, item: Dict) -> Optional[KnownJobs]:
+    """
+    The set stored with a company's state item (already fetched), reading any
+    extra shards with one BatchGetItem. None when the company has no set yet
+    or a shard is missing.
+    """
+    if 'known_hashes' not in item:
+        return None
+
+    shards = int(item.get('known_shards', {}).get('N', '1'))
+    blobs = [item['known_hashes']['B']]
+
+    if shards > 1:
+        keys = [{'state_key': {'S': shard_key(company_name, i)}} for i in range(1, shards)]
+        found = {}
+        request_items = {table_name: {'Keys': keys}}
+        # Shard count is bounded by the 400 KB limit; one or two round trips in practice
+        for _ in range(5):
+            response = client.batch_get_item(RequestItems=request_items)
+            for shard_item in response.get('Responses', {}).get(table_name, []):
+                found[shard_item['state_key']['S']] = shard_item['known_hashes']['B']
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                break
+        if len(found) != shards - 1:
+            return None
+        blobs.extend(found[shard_key(company_name, i)] for i in range(1, shards))
+
+    hashes = set()
+    for blob in blobs:
+        hashes.update(decode_hashes(blob))
+    return KnownJobs(hashes, shards)
+
+
+def write_known_jobs(client, table_name: str, company_name: str, known: KnownJobs) -> Dict:
+    """
+    Writes shards 1.. as their own items (when the set changed) and returns the
+    attributes that carry shard 0 on the company's state item (written by the caller).
+    """
+    blobs = known.shard()
+    for index, blob in enumerate(blobs[1:] if known.changed else [], start=1):
+        client.put_item(
+            TableName=table_name,
+            Item={
+                'state_key': {'S': shard_key(company_name, index)},
+                'known_hashes': {'B': blob}
+            }
+        )
+
+    return {
+        'known_hashes': {'B': blobs[0]},
+        'known_shards': {'N': str(len(blobs))},
+        'known_count': {'N': str(len(known))}
+    }
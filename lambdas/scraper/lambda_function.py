@@ -1,23 +1,86 @@
 import boto3
+import contextvars
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 
-from scrapers import get_scraper, has_scraper
+from botocore.exceptions import ClientError
 
-dynamodb = boto3.resource('dynamodb')
+from known_jobs import KnownJobs, read_known_jobs, state_key, write_known_jobs
+from metrics import count_dynamodb_calls, emit_company_metrics
+from scrapers import get_platform, get_scraper, has_scraper
+from scrapers.collector import JobCollector
+from scrapers.conditional import BoardNotModified, commit_validators, use_dynamodb_client
+from scrapers.context import DeadlineExceeded, ScrapeContext, current_context, run_measured, scrape_context, use_context
+from scrapers.engine import run_async, scrape_many
+from scrapers.http_client import get_stats as get_http_stats
+from scrapers.rate_limit import get_stats as get_rate_stats
+from scrapers.token_cache import get_stats as get_token_stats
+from scrapers.tracing import flush as flush_spans, span, start_trace, trace_aws_calls
+
+# Low-level client throughout: companies and write batches run on worker threads,
+# and boto3 clients are thread-safe where resources are not
+dynamodb_client = boto3.client('dynamodb')
 sns = boto3.client('sns')
+# Each company's EMF record carries the DynamoDB calls made on its behalf
+count_dynamodb_calls(dynamodb_client)
+# and, with TRACE_EXPORT set, each call (and each publish) is a span
+trace_aws_calls(dynamodb_client, 'dynamodb')
+trace_aws_calls(sns, 'sns')
+# Validators for conditional GETs go through the same (counted, traced) client
+use_dynamodb_client(dynamodb_client)
 
 JOBS_TABLE = os.environ.get('JOBS_TABLE', 'job_scraper_jobs')
+STATE_TABLE = os.environ.get('STATE_TABLE', 'job_scraper_state')
 SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN', '')
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_SIZE = 100
+BATCH_GET_MAX_ATTEMPTS = 5
+
+# Conditional inserts are issued in batches spread over a small thread pool
+WRITE_BATCH_SIZE = 25
+WRITE_CONCURRENCY = int(os.environ.get('WRITE_CONCURRENCY', '8'))
+
+# Companies scraped in parallel when the event carries a batch
+SCRAPE_CONCURRENCY = int(os.environ.get('SCRAPE_CONCURRENCY', '8'))
+
+# Seconds kept back from the Lambda timeout to dedupe, store and notify what was scraped
+DEADLINE_MARGIN_SECONDS = float(os.environ.get('DEADLINE_MARGIN_SECONDS', '30'))
+
 
 def lambda_handler(event, context):
-    company_name = event['company_name']
-    url = event['url']
+    """
+    Scrapes one company ({'company_name', 'url'}) or a batch of companies
+    ({'companies': [{'company_name', 'url'}, ...]}) in a single invocation.
+    The orchestrator's run_id, if present, is the trace id of the invocation's spans.
+    """
+    deadline = scrape_deadline(context)
+    run_id = start_trace(event.get('run_id'))
     
-    print(f"Scraping jobs for {company_name} at {url}")
+    try:
+        with span('invoke', run_id=run_id, dispatch_delay_ms=dispatch_delay_ms(event)):
+            return handle_event(event, deadline)
+    finally:
+        flush_spans()
+
+
+def dispatch_delay_ms(event) -> Optional[float]:
+    """Milliseconds from the orchestrator's invoke call to this handler starting, if it stamped one."""
+    dispatched_at = event.get('dispatched_at')
+    if dispatched_at is None:
+        return None
+    return round((time.time() - dispatched_at) * 1000, 1)
+
+
+def handle_event(event, deadline: Optional[float] = None) -> Dict:
+    if 'companies' in event:
+        return handle_batch(event['companies'], deadline)
+    
+    company_name = event['company_name']
     
     if not has_scraper(company_name):
         print(f"No scraper implemented for {company_name}")
@@ -26,49 +89,419 @@ def lambda_handler(event, context):
             'body': json.dumps({'error': f'No scraper for {company_name}'})
         }
     
+    with scrape_context(company_name, deadline) as ctx:
+        try:
+            result = process_company(company_name, event['url'], ctx)
+        except Exception as e:
+            emit_company_metrics(ctx, {'company': company_name, 'error': str(e)}, get_platform(company_name))
+            raise
+    emit_company_metrics(ctx, result, get_platform(company_name))
+    log_http_stats()
+    log_conditional_stats([ctx])
+    log_truncated([ctx])
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps(result)
+    }
+
+
+def scrape_deadline(context) -> Optional[float]:
+    """
+    time.monotonic() by which scraping must stop: the invocation's remaining time
+    less DEADLINE_MARGIN_SECONDS. None without a Lambda context (local runs).
+    """
+    if context is None or not hasattr(context, 'get_remaining_time_in_millis'):
+        return None
+    remaining = context.get_remaining_time_in_millis() / 1000
+    print(f"Scrape deadline in {remaining - DEADLINE_MARGIN_SECONDS:.0f}s ({remaining:.0f}s left in the invocation)")
+    return time.monotonic() + remaining - DEADLINE_MARGIN_SECONDS
+
+
+def handle_batch(companies: List[Dict[str, str]], deadline: Optional[float] = None) -> Dict:
+    """
+    Scrapes every company in the batch on one event loop, SCRAPE_CONCURRENCY at a time,
+    then records each company's jobs. A failing company is reported in its own
+    result and never affects the others. Scraping stops at deadline, and
+    whatever was fetched by then is still recorded.
+    """
+    print(f"Batch of {len(companies)} companies")
+    
+    runnable = [(c['company_name'], c['url']) for c in companies if has_scraper(c['company_name'])]
+    for company_name, url in runnable:
+        print(f"Scraping jobs for {company_name} at {url}")
+    contexts = {company_name: ScrapeContext(company_name, deadline) for company_name, _ in runnable}
+    scraped = run_async(scrape_many(runnable, concurrency=SCRAPE_CONCURRENCY, contexts=contexts)) if runnable else {}
+    
+    results = []
+    if companies:
+        with ThreadPoolExecutor(max_workers=min(SCRAPE_CONCURRENCY, len(companies))) as executor:
+            # Each in a copy of the contextvars, so the record spans nest under the invocation
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _record_company_safely,
+                    company['company_name'],
+                    scraped.get(company['company_name']),
+                    contexts.get(company['company_name'])
+                )
+                for company in companies
+            ]
+            results = [future.result() for future in futures]
+    
+    for result in results:
+        name = result['company']
+        emit_company_metrics(contexts.get(name) or ScrapeContext(name), result, get_platform(name))
+    
+    failed = [r['company'] for r in results if 'error' in r]
+    print(f"Batch finished: {len(results) - len(failed)} succeeded, {len(failed)} failed")
+    log_http_stats()
+    log_conditional_stats(contexts.values())
+    log_truncated(contexts.values())
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'results': results, 'failed': failed})
+    }
+
+
+def _record_company_safely(company_name: str, scraped, ctx: ScrapeContext) -> Dict:
+    """Error boundary around record_jobs for batch mode; scraped is the job list or the exception."""
+    if not has_scraper(company_name):
+        print(f"No scraper implemented for {company_name}")
+        return {'company': company_name, 'error': f'No scraper for {company_name}'}
+    
+    # The company's DynamoDB calls and notification time are counted on its context
+    with use_context(ctx), span('record', company=company_name):
+        return _record_company(company_name, scraped, ctx)
+
+
+def _record_company(company_name: str, scraped, ctx: ScrapeContext) -> Dict:
+    try:
+        if isinstance(scraped, BoardNotModified) or ctx.not_modified:
+            return not_modified_result(company_name)
+        if isinstance(scraped, DeadlineExceeded):
+            return truncated_result(company_name, ctx)
+        if isinstance(scraped, Exception):
+            raise scraped
+        result = record_jobs(company_name, scraped, partial=ctx.partial)
+        # Only now is the document safely reflected in the jobs table
+        if not ctx.partial:
+            commit_validators(ctx)
+        if ctx.truncated:
+            result['truncated'] = True
+        return result
+    except Exception as e:
+        print(f"Error scraping {company_name}: {str(e)}")
+        return {'company': company_name, 'error': str(e)}
+
+
+def process_company(company_name: str, url: str, ctx: ScrapeContext) -> Dict:
+    """
+    Scrapes one company, records its new jobs and notifies. Raises on failure.
+    ctx must be the current scrape context.
+    """
+    print(f"Scraping jobs for {company_name} at {url}")
+    
     try:
         scrape_fn = get_scraper(company_name)
-        jobs = scrape_fn(url)
-        print(f"Found {len(jobs)} total jobs")
-        
-        jobs_table = dynamodb.Table(JOBS_TABLE)
-        new_jobs = []
+        started = time.monotonic()
+        try:
+            with span('scrape', company=company_name):
+                jobs = run_measured(ctx, scrape_fn, url)
+        except BoardNotModified:
+            return not_modified_result(company_name)
+        except DeadlineExceeded:
+            return truncated_result(company_name, ctx)
+        finally:
+            ctx.scrape_ms = (time.monotonic() - started) * 1000
+        if ctx.not_modified:
+            return not_modified_result(company_name)
         
-        for job in jobs:
-            response = jobs_table.get_item(Key={'job_url': job['url']})
-            
-            if 'Item' not in response:
-                new_jobs.append(job)
-                
-                jobs_table.put_item(Item={
-                    'job_url': job['url'],
-                    'company_name': company_name,
-                    'job_title': job['title'],
-                    'location': job.get('location', 'Not specified'),
-                    'discovered_at': datetime.utcnow().isoformat(),
-                    'notified': True
-                })
-                
-                print(f"New job found: {job['title']}")
-        
-        if new_jobs:
-            send_notification(company_name, new_jobs)
-            print(f"Sent notification for {len(new_jobs)} new jobs")
-        else:
-            print("No new jobs found")
+        with span('record', company=company_name):
+            result = record_jobs(company_name, jobs, partial=ctx.partial)
+        # Only now is the document safely reflected in the jobs table
+        if not ctx.partial:
+            commit_validators(ctx)
+        if ctx.truncated:
+            result['truncated'] = True
+        return result
         
+    except Exception as e:
+        print(f"Error scraping {company_name}: {str(e)}")
+        raise
+
+
+def record_jobs(company_name: str, jobs: List[Dict[str, str]], partial: bool = False) -> Dict:
+    """
+    Stores the jobs not seen before and notifies about them. Raises on failure.
+    partial means some requests failed for good, so jobs may not be the whole
+    board: its new jobs are still recorded, but the company state is left as is.
+    """
+    print(f"[{company_name}] Found {len(jobs)} total jobs{' (partial)' if partial else ''}")
+    
+    # Whatever the scraper returned, one job per canonical URL from here on
+    collector = JobCollector()
+    stats = collector.add_page(jobs)
+    if stats.duplicates:
+        print(f"[{company_name}] Dropped {stats.duplicates} duplicate jobs")
+    
+    # Same job set as the last fully recorded run: nothing can be new
+    fingerprint = collector.fingerprint()
+    state = get_company_state(company_name)
+    if state and state.get('fingerprint') == fingerprint:
+        print(f"[{company_name}] Job set unchanged since last run; skipping dedupe")
+        record_heartbeat(company_name)
         return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'company': company_name,
-                'total_jobs': len(jobs),
-                'new_jobs': len(new_jobs)
-            })
+            'company': company_name,
+            'total_jobs': len(jobs),
+            'new_jobs': 0,
+            'unchanged': True
+        }
+    
+    # The known-jobs set (or, without one, a batched read) narrows the candidates;
+    # the conditional write decides
+    urls = [job['url'] for job in collector]
+    known = state.get('known')
+    if known is not None:
+        existing_urls = {url for url in urls if url in known}
+    else:
+        existing_urls = find_existing_urls(urls)
+        known = KnownJobs()
+    print(f"[{company_name}] {len(existing_urls)} jobs already known")
+    
+    candidates = [job for job in collector if job['url'] not in existing_urls]
+    
+    new_jobs = insert_new_jobs(company_name, candidates)
+    for job in new_jobs:
+        print(f"[{company_name}] New job found: {job['title']}")
+    
+    if new_jobs:
+        started = time.monotonic()
+        send_notification(company_name, new_jobs)
+        ctx = current_context()
+        if ctx is not None:
+            ctx.notify_ms = (time.monotonic() - started) * 1000
+        print(f"[{company_name}] Sent notification for {len(new_jobs)} new jobs")
+    else:
+        print(f"[{company_name}] No new jobs found")
+    
+    result = {
+        'company': company_name,
+        'total_jobs': len(jobs),
+        'new_jobs': len(new_jobs)
+    }
+    
+    # An incomplete list must not become the fingerprint the next full scrape is compared to
+    if partial:
+        print(f"[{company_name}] Partial scrape; keeping the previous company state")
+        result['partial'] = True
+        return result
+    
+    # Every job is stored and notified by now, so the set may be trusted next run
+    known.add(urls)
+    put_company_state(company_name, fingerprint, len(collector), known)
+    
+    return result
+
+
+def not_modified_result(company_name: str) -> Dict:
+    """Result for a company whose job document is unchanged: nothing parsed, deduped or written."""
+    print(f"[{company_name}] Job document not modified since last run; skipping")
+    return {'company': company_name, 'total_jobs': None, 'new_jobs': 0, 'not_modified': True}
+
+
+def truncated_result(company_name: str, ctx: ScrapeContext) -> Dict:
+    """
+    Result for a scraper that ran into the deadline without returning its jobs:
+    nothing is recorded and, as the run is partial, the company state is left as is.
+    """
+    ctx.mark_truncated()
+    print(f"[{company_name}] Deadline reached before the scraper returned; no jobs recorded")
+    return {'company': company_name, 'total_jobs': 0, 'new_jobs': 0, 'truncated': True, 'partial': True}
+
+
+def log_conditional_stats(contexts) -> None:
+    """Logs what conditional GETs saved in this invocation."""
+    contexts = list(contexts)
+    skipped = [ctx for ctx in contexts if ctx.not_modified]
+    if not skipped:
+        return
+    kb_saved = sum(ctx.bytes_saved for ctx in skipped) / 1024
+    cpu_ms_saved = sum(ctx.cpu_ms_saved for ctx in skipped)
+    print(
+        f"Conditional GET: {len(skipped)} of {len(contexts)} companies not modified, "
+        f"{kb_saved:.0f} KB download and {cpu_ms_saved:.0f} ms parsing CPU saved"
+    )
+
+
+def log_truncated(contexts) -> None:
+    """Logs the companies whose scrape stopped at the deadline."""
+    truncated = [ctx.company_name for ctx in contexts if ctx is not None and ctx.truncated]
+    if truncated:
+        print(f"Deadline reached: {len(truncated)} companies truncated ({', '.join(truncated)})")
+
+
+def log_http_stats() -> None:
+    """Logs container-lifetime connection reuse from the shared HTTP pool, rate limiting and token cache hits."""
+    stats = get_http_stats()
+    rates = get_rate_stats()
+    tokens = get_token_stats()
+    print(
+        f"HTTP: {stats['requests']} requests, {stats['connections_opened']} connections opened, "
+        f"{stats['handshakes_saved']} handshakes saved, "
+        f"{stats['impersonated_sessions_reused']} impersonated sessions reused, "
+        f"{rates['throttled']} throttled, {rates['waited_s']}s rate-limit wait, "
+        f"token cache {tokens['hits']} hits / {tokens['misses']} misses"
+    )
+
+
+def find_existing_urls(urls: List[str]) -> Set[str]:
+    """
+    Returns the subset of urls already stored in the jobs table.
+    Looks keys up in chunks of BATCH_GET_SIZE with BatchGetItem (keys only)
+    and retries any UnprocessedKeys with exponential backoff.
+    """
+    # BatchGetItem rejects duplicate keys within a request
+    unique_urls = list(dict.fromkeys(urls))
+    existing = set()
+    
+    for start in range(0, len(unique_urls), BATCH_GET_SIZE):
+        chunk = unique_urls[start:start + BATCH_GET_SIZE]
+        request_items = {
+            JOBS_TABLE: {
+                'Keys': [{'job_url': {'S': url}} for url in chunk],
+                'ProjectionExpression': 'job_url'
+            }
         }
         
+        attempt = 0
+        while request_items:
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            
+            for item in response.get('Responses', {}).get(JOBS_TABLE, []):
+                existing.add(item['job_url']['S'])
+            
+            request_items = response.get('UnprocessedKeys') or {}
+            if request_items:
+                attempt += 1
+                if attempt >= BATCH_GET_MAX_ATTEMPTS:
+                    raise RuntimeError(
+                        f"BatchGetItem left keys unprocessed after {attempt} attempts"
+                    )
+                time.sleep(min(0.05 * (2 ** attempt), 1.0))
+    
+    return existing
+
+
+def get_company_state(company_name: str) -> Dict:
+    """
+    The company's 'company#{name}' state in one read: 'fingerprint' of the last
+    recorded job set and its 'known' jobs (KnownJobs), each present only if stored.
+    """
+    try:
+        item = dynamodb_client.get_item(
+            TableName=STATE_TABLE,
+            Key={'state_key': {'S': state_key(company_name)}}
+        ).get('Item') or {}
+    except ClientError as e:
+        # Without state the run simply does the full dedupe
+        print(f"[{company_name}] Failed to read state: {e}")
+        return {}
+    
+    state = {}
+    if 'fingerprint' in item:
+        state['fingerprint'] = item['fingerprint']['S']
+    try:
+        known = read_known_jobs(dynamodb_client, STATE_TABLE, company_name, item)
     except Exception as e:
-        print(f"Error scraping {company_name}: {str(e)}")
-        raise
+        print(f"[{company_name}] Failed to read known jobs: {e}")
+        known = None
+    if known is not None:
+        state['known'] = known
+    return state
+
+
+def put_company_state(company_name: str, fingerprint: str, job_count: int, known: KnownJobs) -> None:
+    """Stores the fingerprint and known-jobs set of a fully recorded job set."""
+    now = str(int(time.time()))
+    try:
+        dynamodb_client.put_item(
+            TableName=STATE_TABLE,
+            Item={
+                'state_key': {'S': state_key(company_name)},
+                'fingerprint': {'S': fingerprint},
+                'job_count': {'N': str(job_count)},
+                'changed_at': {'N': now},
+                'last_seen_at': {'N': now},
+                **write_known_jobs(dynamodb_client, STATE_TABLE, company_name, known)
+            }
+        )
+    except ClientError as e:
+        # Only costs a full dedupe next run
+        print(f"[{company_name}] Failed to store state: {e}")
+
+
+def record_heartbeat(company_name: str) -> None:
+    """Marks an unchanged company as scraped just now."""
+    try:
+        dynamodb_client.update_item(
+            TableName=STATE_TABLE,
+            Key={'state_key': {'S': state_key(company_name)}},
+            UpdateExpression='SET last_seen_at = :now',
+            ExpressionAttributeValues={':now': {'N': str(int(time.time()))}}
+        )
+    except ClientError as e:
+        print(f"[{company_name}] Failed to record heartbeat: {e}")
+
+
+def insert_new_jobs(company_name: str, jobs: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Records jobs with an attribute_not_exists(job_url) conditional put.
+    Returns only the jobs this call actually inserted, so a retried or
+    concurrent invocation can never report the same job as new twice.
+    """
+    if not jobs:
+        return []
+    
+    discovered_at = datetime.utcnow().isoformat()
+    batches = [jobs[i:i + WRITE_BATCH_SIZE] for i in range(0, len(jobs), WRITE_BATCH_SIZE)]
+    
+    with ThreadPoolExecutor(max_workers=min(WRITE_CONCURRENCY, len(batches))) as executor:
+        # Each batch runs in a copy of the caller's contextvars, so its writes count for the company
+        results = executor.map(
+            lambda batch, context: context.run(_insert_batch, company_name, batch, discovered_at),
+            batches,
+            [contextvars.copy_context() for _ in batches]
+        )
+        return [job for inserted in results for job in inserted]
+
+
+def _insert_batch(company_name: str, jobs: List[Dict[str, str]], discovered_at: str) -> List[Dict[str, str]]:
+    """Conditionally inserts one batch of jobs. Returns the jobs that were new."""
+    inserted = []
+    
+    for job in jobs:
+        try:
+            dynamodb_client.put_item(
+                TableName=JOBS_TABLE,
+                Item={
+                    'job_url': {'S': job['url']},
+                    'company_name': {'S': company_name},
+                    'job_title': {'S': job.get('title') or 'Unknown'},
+                    'location': {'S': job.get('location') or 'Not specified'},
+                    'discovered_at': {'S': discovered_at},
+                    'notified': {'BOOL': True}
+                },
+                ConditionExpression='attribute_not_exists(job_url)'
+            )
+            inserted.append(job)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+    
+    return inserted
+
 
 def send_notification(company_name: str, new_jobs: List[Dict[str, str]]) -> None:
     """Sends SNS notification for new job postings."""
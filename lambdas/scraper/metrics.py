@@ -0,0 +1,97 @@
+"""
+CloudWatch Embedded Metric Format (EMF) records for the scraper Lambda.
+
+emit_company_metrics() prints one JSON line per company run. CloudWatch Logs
+turns the metrics it declares into CloudWatch metrics, so dashboards (p50/p95
+scrape duration, per-company requests and DynamoDB calls) need no metrics
+service and no PutMetricData calls. Metrics come with two dimension sets:
+    company             per-company cost and latency
+    platform, outcome   e.g. p95 ScrapeDuration of Greenhouse boards that succeeded
+Locally the record is just a stdout line starting with '{"_aws"'; capture stdout
+(contextlib.redirect_stdout) and json.loads it.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from scrapers.context import ScrapeContext, current_context
+
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'JobScraper')
+
+DIMENSIONS = [['company'], ['platform', 'outcome']]
+
+# (metric name, unit); values come from company_metric_values()
+METRICS: List[Tuple[str, str]] = [
+    ('ScrapeDuration', 'Milliseconds'),
+    ('PagesFetched', 'Count'),
+    ('HttpRequests', 'Count'),
+    ('HttpRetries', 'Count'),
+    ('BytesDownloaded', 'Bytes'),
+    ('JobsFound', 'Count'),
+    ('NewJobs', 'Count'),
+    ('DynamoDBCalls', 'Count'),
+    ('NotificationLatency', 'Milliseconds'),
+]
+
+
+def outcome_of(result: Dict[str, Any]) -> str:
+    """One word for how the company's run ended, most severe first."""
+    for flag in ('error', 'truncated', 'partial', 'not_modified', 'unchanged'):
+        if result.get(flag):
+            return flag
+    return 'ok'
+
+
+def company_metric_values(ctx: ScrapeContext, result: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        'ScrapeDuration': round(ctx.scrape_ms, 1),
+        'PagesFetched': ctx.pages,
+        'HttpRequests': ctx.requests,
+        'HttpRetries': ctx.retries,
+        'BytesDownloaded': ctx.bytes_downloaded,
+        'JobsFound': result.get('total_jobs') or 0,
+        'NewJobs': result.get('new_jobs') or 0,
+        'DynamoDBCalls': ctx.dynamodb_calls,
+        'NotificationLatency': round(ctx.notify_ms, 1),
+    }
+
+
+def build_company_record(ctx: ScrapeContext, result: Dict[str, Any], platform: str,
+                         timestamp_ms: Optional[int] = None) -> Dict[str, Any]:
+    """The EMF record of one company run: the _aws metadata, its dimensions and its metric values."""
+    record: Dict[str, Any] = {
+        '_aws': {
+            'Timestamp': timestamp_ms if timestamp_ms is not None else int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': METRICS_NAMESPACE,
+                'Dimensions': DIMENSIONS,
+                'Metrics': [{'Name': name, 'Unit': unit} for name, unit in METRICS],
+            }],
+        },
+        'company': ctx.company_name,
+        'platform': platform,
+        'outcome': outcome_of(result),
+    }
+    record.update(company_metric_values(ctx, result))
+    # Searchable in Logs Insights, not metrics
+    if ctx.partial_reasons:
+        record['partial_reasons'] = ctx.partial_reasons[:5]
+    return record
+
+
+def emit_company_metrics(ctx: ScrapeContext, result: Dict[str, Any], platform: str) -> None:
+    """Print the company's EMF record as a single stdout line."""
+    print(json.dumps(build_company_record(ctx, result, platform)), flush=True)
+
+
+def count_dynamodb_calls(client) -> None:
+    """Count every API call of a boto3 DynamoDB client against the current company's context."""
+    client.meta.events.register('before-call.dynamodb', _count_call)
+
+
+def _count_call(**kwargs) -> None:
+    ctx = current_context()
+    if ctx is not None:
+        ctx.record_dynamodb_call()
@@ -1,7 +1,8 @@
 from typing import List, Dict, Set
 import re
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
+from .conditional import conditional_get
 
 
 def scrape_1x(
@@ -14,6 +15,7 @@ def scrape_1x(
     Returns: [{"title":..., "url":..., "location":..., "department":...}, ...]
     """
     print(f"1X Scraping: {url}")
+    session = get_session('1x')
     print(f"Filtering headings: {sorted(allowed_headings)}")
 
     headers = {
@@ -23,7 +25,7 @@ def scrape_1x(
         )
     }
 
-    resp = requests.get(url, headers=headers, timeout=20)
+    resp = conditional_get(session, url, headers=headers, timeout=20)
     if resp.status_code != 200:
         print(f"Error: Status {resp.status_code}")
         return []
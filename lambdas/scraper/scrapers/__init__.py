@@ -1,140 +1,117 @@
 """
-Simple registry mapping company names to scrape functions.
+Lazy registry mapping company names to scrape functions.
+
+Each entry names the module and function; the module is only imported the first
+time get_scraper() asks for it, so a cold start pays for one scraper's
+dependencies instead of all of them.
 """
 
-from typing import List, Dict, Callable
+import importlib
+import sys
+import threading
+from typing import List, Dict, Callable, Tuple
 
-from .anthropic import scrape_anthropic
-from .openai import scrape_openai
-from .deepmind import scrape_deepmind
-from .xai import scrape_xai
-from .jane_street import scrape_jane_street
-from .citadel import scrape_citadel
-from .two_sigma import scrape_two_sigma
-from .point72 import scrape_point72
-from .renaissance import scrape_rentech
-from .ssi import scrape_ssi
-from .thinking_machines import scrape_thinking_machines
-from .perplexity import scrape_perplexity
-from .mistral import scrape_mistral
-from .meta import scrape_meta
-from .google import scrape_google
-from .apple import scrape_apple
-from .microsoft import scrape_microsoft
-from .amazon import scrape_amazon
-from .nvidia import scrape_nvidia
-from .netflix import scrape_netflix
-from .reddit import scrape_reddit
-from .spotify import scrape_spotify
-from .tiktok import scrape_tiktok
-from .uber import scrape_uber
-from .waymo import scrape_waymo
-from .figureai import scrape_figureai
-from .togetherai import scrape_togetherai
-from .huggingface import scrape_huggingface
-from .cohere import scrape_cohere
-from .reflectionai import scrape_reflectionai
-from .jump import scrape_jump
-from .hrt import scrape_hrt
-from .imc import scrape_imc
-from .drw import scrape_drw
-from .tower import scrape_tower
-from .optiver import scrape_optiver
-from .deshaw import scrape_deshaw
-from .xtx import scrape_xtx
-from .magic import scrape_magic
-from .pi import scrape_pi
-from .liquid import scrape_liquid
-from .cartesia import scrape_cartesia
-from ._1x import scrape_1x
-from .luma import scrape_luma
-from .suno import scrape_suno
-from .exa import scrape_exa
-from .boston_dynamics import scrape_boston_dynamics
-from .covariant import scrape_covariant
-from .twelve_labs import scrape_twelve_labs
-from .phaidra import scrape_phaidra
-from .runway import scrape_runway
-from .isomorphic_labs import scrape_isomorphic_labs
-from .humans import scrape_humans
-from .coinbase import scrape_coinbase
-from .adobe import scrape_adobe
-from .world_labs import scrape_world_labs
-from .ami_labs import scrape_ami_labs
-from .robinhood import scrape_robinhood
-from .airbnb import scrape_airbnb
+ScrapeFn = Callable[[str], List[Dict[str, str]]]
 
 
-SCRAPERS: Dict[str, Callable[[str], List[Dict[str, str]]]] = {
-    'Anthropic': scrape_anthropic,
-    'OpenAI': scrape_openai,
-    'Deepmind': scrape_deepmind,
-    'xAI': scrape_xai,
-    'Jane Street': scrape_jane_street,
-    'Citadel': scrape_citadel,
-    'Two Sigma': scrape_two_sigma,
-    'Point72': scrape_point72,
-    'Renaissance Technologies': scrape_rentech,
-    'SSI': scrape_ssi,
-    'Thinking Machines': scrape_thinking_machines,
-    'Perplexity': scrape_perplexity,
-    'Mistral': scrape_mistral,
-    'Meta': scrape_meta,
-    'Google': scrape_google,
-    'Apple': scrape_apple,
-    'Microsoft': scrape_microsoft,
-    'Amazon': scrape_amazon,
-    'Nvidia': scrape_nvidia,
-    'Netflix': scrape_netflix,
-    'Reddit': scrape_reddit,
-    'Spotify': scrape_spotify,
-    'Tiktok': scrape_tiktok,
-    'Uber': scrape_uber,
-    'Waymo': scrape_waymo,
-    'FigureAI': scrape_figureai,
-    'TogetherAI': scrape_togetherai,
-    'HuggingFace': scrape_huggingface,
-    'Cohere': scrape_cohere,
-    'Reflection AI': scrape_reflectionai,
-    'Jump': scrape_jump,
-    'HRT': scrape_hrt,
-    'IMC': scrape_imc,
-    'DRW': scrape_drw,
-    'Tower': scrape_tower,
-    'Optiver': scrape_optiver,
-    'DE Shaw': scrape_deshaw,
-    'XTX': scrape_xtx,
-    'Magic': scrape_magic,
-    'Physical Intelligence': scrape_pi,
-    'Liquid': scrape_liquid,
-    'Cartesia': scrape_cartesia,
-    '1X': scrape_1x,
-    'Luma': scrape_luma,
-    'Suno': scrape_suno,
-    'Exa': scrape_exa,
-    'Boston Dynamics': scrape_boston_dynamics,
-    'Covariant': scrape_covariant,
-    'Twelve Labs': scrape_twelve_labs,
-    'Phaidra': scrape_phaidra,
-    'Runway': scrape_runway,
-    'Isomorphic Labs': scrape_isomorphic_labs,
-    'Humans&': scrape_humans,
-    'Coinbase': scrape_coinbase,
-    'Adobe': scrape_adobe,
-    'World Labs': scrape_world_labs,
-    'AMI Labs': scrape_ami_labs,
-    'Robinhood': scrape_robinhood,
-    'Airbnb': scrape_airbnb,
+SCRAPERS: Dict[str, Tuple[str, str]] = {
+    'Anthropic': ('anthropic', 'scrape_anthropic'),
+    'OpenAI': ('openai', 'scrape_openai'),
+    'Deepmind': ('deepmind', 'scrape_deepmind'),
+    'xAI': ('xai', 'scrape_xai'),
+    'Jane Street': ('jane_street', 'scrape_jane_street'),
+    'Citadel': ('citadel', 'scrape_citadel'),
+    'Two Sigma': ('two_sigma', 'scrape_two_sigma'),
+    'Point72': ('point72', 'scrape_point72'),
+    'Renaissance Technologies': ('renaissance', 'scrape_rentech'),
+    'SSI': ('ssi', 'scrape_ssi'),
+    'Thinking Machines': ('thinking_machines', 'scrape_thinking_machines'),
+    'Perplexity': ('perplexity', 'scrape_perplexity'),
+    'Mistral': ('mistral', 'scrape_mistral'),
+    'Meta': ('meta', 'scrape_meta'),
+    'Google': ('google', 'scrape_google'),
+    'Apple': ('apple', 'scrape_apple'),
+    'Microsoft': ('microsoft', 'scrape_microsoft'),
+    'Amazon': ('amazon', 'scrape_amazon'),
+    'Nvidia': ('workday', 'scrape_workday'),
+    'Netflix': ('netflix', 'scrape_netflix'),
+    'Reddit': ('reddit', 'scrape_reddit'),
+    'Spotify': ('spotify', 'scrape_spotify'),
+    'Tiktok': ('tiktok', 'scrape_tiktok'),
+    'Uber': ('uber', 'scrape_uber'),
+    'Waymo': ('waymo', 'scrape_waymo'),
+    'FigureAI': ('figureai', 'scrape_figureai'),
+    'TogetherAI': ('togetherai', 'scrape_togetherai'),
+    'HuggingFace': ('huggingface', 'scrape_huggingface'),
+    'Cohere': ('cohere', 'scrape_cohere'),
+    'Reflection AI': ('reflectionai', 'scrape_reflectionai'),
+    'Jump': ('jump', 'scrape_jump'),
+    'HRT': ('hrt', 'scrape_hrt'),
+    'IMC': ('imc', 'scrape_imc'),
+    'DRW': ('drw', 'scrape_drw'),
+    'Tower': ('tower', 'scrape_tower'),
+    'Optiver': ('optiver', 'scrape_optiver'),
+    'DE Shaw': ('deshaw', 'scrape_deshaw'),
+    'XTX': ('xtx', 'scrape_xtx'),
+    'Magic': ('magic', 'scrape_magic'),
+    'Physical Intelligence': ('pi', 'scrape_pi'),
+    'Liquid': ('liquid', 'scrape_liquid'),
+    'Cartesia': ('cartesia', 'scrape_cartesia'),
+    '1X': ('_1x', 'scrape_1x'),
+    'Luma': ('luma', 'scrape_luma'),
+    'Suno': ('suno', 'scrape_suno'),
+    'Exa': ('exa', 'scrape_exa'),
+    'Boston Dynamics': ('workday', 'scrape_workday'),
+    'Covariant': ('covariant', 'scrape_covariant'),
+    'Twelve Labs': ('twelve_labs', 'scrape_twelve_labs'),
+    'Phaidra': ('phaidra', 'scrape_phaidra'),
+    'Runway': ('runway', 'scrape_runway'),
+    'Isomorphic Labs': ('isomorphic_labs', 'scrape_isomorphic_labs'),
+    'Humans&': ('humans', 'scrape_humans'),
+    'Coinbase': ('coinbase', 'scrape_coinbase'),
+    'Adobe': ('adobe', 'scrape_adobe'),
+    'World Labs': ('world_labs', 'scrape_world_labs'),
+    'AMI Labs': ('ami_labs', 'scrape_ami_labs'),
+    'Robinhood': ('robinhood', 'scrape_robinhood'),
+    'Airbnb': ('airbnb', 'scrape_airbnb'),
 }
 
+_loaded: Dict[str, ScrapeFn] = {}
+_lock = threading.Lock()
+
 
-def get_scraper(company_name: str) -> Callable[[str], List[Dict[str, str]]]:
-    """Get scrape function for a company. Raises ValueError if not found."""
+def get_scraper(company_name: str) -> ScrapeFn:
+    """Get scrape function for a company, importing its module on first use. Raises ValueError if not found."""
     if company_name not in SCRAPERS:
         raise ValueError(f"No scraper for '{company_name}'")
-    return SCRAPERS[company_name]
+    
+    scrape_fn = _loaded.get(company_name)
+    if scrape_fn is None:
+        # Batch invocations resolve scrapers from worker threads
+        with _lock:
+            scrape_fn = _loaded.get(company_name)
+            if scrape_fn is None:
+                module_name, fn_name = SCRAPERS[company_name]
+                module = importlib.import_module(f"{__name__}.{module_name}")
+                scrape_fn = getattr(module, fn_name)
+                _loaded[company_name] = scrape_fn
+    return scrape_fn
 
 
 def has_scraper(company_name: str) -> bool:
-    """Check if scraper exists for company."""
-    return company_name in SCRAPERS
\ No newline at end of file
+    """Check if scraper exists for company. Imports nothing."""
+    return company_name in SCRAPERS
+
+
+# Shared engines; a company module built on one (e.g. openai.py on ashby.py) reports it as its platform
+PLATFORM_ENGINES = ('ashby', 'greenhouse', 'workday')
+
+
+def get_platform(company_name: str) -> str:
+    """The job board platform behind a company's scraper, else its module name. Imports nothing."""
+    module_name = SCRAPERS.get(company_name, ('unknown', ''))[0]
+    module = sys.modules.get(f"{__name__}.{module_name}")
+    for engine in PLATFORM_ENGINES:
+        if module_name == engine or hasattr(module, f"scrape_{engine}"):
+            return engine
+    return module_name
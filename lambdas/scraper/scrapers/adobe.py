@@ -1,8 +1,9 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import base64
 import json
-import time
-import requests
+from .context import DeadlineExceeded, deadline_reached
+from .http_client import get_session
+from .token_cache import get_token, invalidate_token, put_token, restore_cookies, session_cookies
 
 
 def _extract_csrf_from_play_session(cookie_val: str) -> str:
@@ -15,19 +16,34 @@ def _extract_csrf_from_play_session(cookie_val: str) -> str:
     return (payload.get("data") or {}).get("csrfToken", "") or ""
 
 
-def scrape_adobe(
-    url: str = "https://careers.adobe.com/widgets",
-    sleep_s: float = 0.2,
-    max_pages: Optional[int] = None,  # safety valve
-) -> List[Dict[str, str]]:
-    session = requests.Session()
+def _play_session_csrf(session, referer: str) -> Tuple[str, bool]:
+    """
+    The CSRF token from the PLAY_SESSION cookie, with the cookies loaded into the
+    session. Served from the token cache while valid; otherwise the referer page
+    is loaded for a fresh cookie. Returns (token, came_from_cache).
+    """
+    cached = get_token('adobe')
+    if cached is not None:
+        restore_cookies(session, cached)
+        return cached['csrf'], True
 
-    referer = "https://careers.adobe.com/us/en/c/research-jobs"
     session.get(referer, timeout=30)
 
     csrf_token = ""
     if "PLAY_SESSION" in session.cookies:
         csrf_token = _extract_csrf_from_play_session(session.cookies.get("PLAY_SESSION", ""))
+        put_token('adobe', '', {'csrf': csrf_token, 'cookies': session_cookies(session)})
+    return csrf_token, False
+
+
+def scrape_adobe(
+    url: str = "https://careers.adobe.com/widgets",
+    max_pages: Optional[int] = None,  # safety valve
+) -> List[Dict[str, str]]:
+    session = get_session('adobe')
+
+    referer = "https://careers.adobe.com/us/en/c/research-jobs"
+    csrf_token, token_cached = _play_session_csrf(session, referer)
 
     headers = {
         "User-Agent": (
@@ -95,6 +111,8 @@ def scrape_adobe(
     results: List[Dict[str, str]] = []
 
     while True:
+        if deadline_reached():
+            break
         page += 1
         if max_pages is not None and page > max_pages:
             break
@@ -102,7 +120,23 @@ def scrape_adobe(
         payload = dict(base_payload)
         payload["from"] = offset
 
-        resp = session.post(url, headers=headers, json=payload, timeout=30)
+        try:
+            resp = session.post(url, headers=headers, json=payload, timeout=30)
+
+            # Cached PLAY_SESSION expired early: load the page again once and retry
+            if resp.status_code in (401, 403) and token_cached:
+                print(f"Adobe API Error {resp.status_code}; refreshing PLAY_SESSION")
+                invalidate_token('adobe')
+                session.cookies.clear()
+                csrf_token, token_cached = _play_session_csrf(session, referer)
+                headers.pop("x-csrf-token", None)
+                if csrf_token:
+                    headers["x-csrf-token"] = csrf_token
+                resp = session.post(url, headers=headers, json=payload, timeout=30)
+        except DeadlineExceeded:
+            # Keep the pages fetched so far
+            break
+
         resp.raise_for_status()
         data = resp.json()
 
@@ -129,8 +163,6 @@ def scrape_adobe(
         if len(jobs) < size:
             break
 
-        time.sleep(sleep_s)
-
     # De-dupe by URL
     results = list({x["url"]: x for x in results if x.get("url")}.values())
     print(f"Scraped {len(results)} Adobe jobs.")
@@ -1,7 +1,8 @@
 from typing import List, Dict, Optional
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
+from .context import DeadlineExceeded, deadline_reached
+from .http_client import get_session
 
 
 def _set_paged(url: str, paged: int) -> str:
@@ -30,15 +31,22 @@ def scrape_airbnb(
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
+    session = get_session('airbnb')
     jobs: List[Dict[str, str]] = []
     page = 1
 
     while True:
+        if deadline_reached():
+            break
         if max_pages is not None and page > max_pages:
             break
 
         page_url = _set_paged(url, page)
-        resp = requests.get(page_url, headers=headers, timeout=30)
+        try:
+            resp = session.get(page_url, headers=headers, timeout=30)
+        except DeadlineExceeded:
+            # Keep the pages fetched so far
+            break
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -1,16 +1,18 @@
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+from .http_client import get_session
+from .engine import AsyncFetcher, sync_scraper
+from .pagination import Page, paginate_offsets
 
-def scrape_amazon(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_amazon(url: str) -> List[Dict[str, str]]:
     """
     Scraper for Amazon Careers using the JSON API.
-    Iterates through 10 pages by modifying the 'offset' parameter.
+    Covers up to 10 pages of the 'offset' parameter, prefetched concurrently.
     """
     print(f"[Amazon] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('amazon')
     
     # Headers based on your network tab
     session.headers.update({
@@ -38,56 +40,39 @@ def scrape_amazon(url: str) -> List[Dict[str, str]]:
     # Determine start offset
     start_offset = int(params.get('offset', 0))
     
-    all_jobs = []
     PAGES_TO_SCRAPE = 10
     PAGE_SIZE = 10
+    fetcher = AsyncFetcher(session)
     
-    for i in range(PAGES_TO_SCRAPE):
-        current_offset = start_offset + (i * PAGE_SIZE)
-        print(f"[Amazon] Fetching page {i+1} (Offset: {current_offset})...")
-        
+    async def fetch_page(offset: int) -> Optional[Page]:
         # Update offset in params
-        params['offset'] = str(current_offset)
+        response = await fetcher.get(api_url, params={**params, 'offset': str(offset)}, timeout=30)
         
-        try:
-            response = session.get(api_url, params=params, timeout=30)
-            
-            if response.status_code != 200:
-                print(f"[Amazon] API Error {response.status_code}")
-                break
-                
-            data = response.json()
-            
-            # Navigate JSON: root -> jobs (list)
-            jobs_list = data.get('jobs', [])
+        if response.status_code != 200:
+            print(f"[Amazon] API Error {response.status_code}")
+            return None
             
-            if not jobs_list:
-                print(f"[Amazon] No jobs found at offset {current_offset}. Stopping.")
-                break
+        data = response.json()
+        
+        # Navigate JSON: root -> jobs (list)
+        jobs_list = data.get('jobs', [])
+        
+        page_jobs = []
+        for job in jobs_list:
+            # Path is relative: "/en/jobs/3154759/sr-research-scientist"
+            job_path = job.get('job_path')
             
-            for job in jobs_list:
-                # Extract fields based on your JSON snippet
-                title = job.get('title')
-                
-                # Path is relative: "/en/jobs/3154759/sr-research-scientist"
-                job_path = job.get('job_path')
-                full_url = f"https://amazon.jobs{job_path}"
-                
+            page_jobs.append({
+                'title': job.get('title'),
+                'url': f"https://amazon.jobs{job_path}",
                 # Location: prefer 'normalized_location', fallback to 'location'
-                location = job.get('normalized_location') or job.get('location')
-                
-                all_jobs.append({
-                    'title': title,
-                    'url': full_url,
-                    'location': location
-                })
-            
-            # Polite sleep to avoid rate limits
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"[Amazon] Request failed: {e}")
-            break
+                'location': job.get('normalized_location') or job.get('location')
+            })
+        
+        # 'hits' is the total match count
+        return Page(jobs=page_jobs, count=len(jobs_list), total=data.get('hits'))
+    
+    all_jobs = await paginate_offsets(fetch_page, start_offset, PAGE_SIZE, PAGES_TO_SCRAPE, label='Amazon')
 
     print(f"[Amazon] Total jobs found: {len(all_jobs)}")
     return all_jobs
@@ -1,17 +1,20 @@
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+import asyncio
+from .http_client import get_session
+from .context import mark_partial
+from .engine import AsyncFetcher, sync_scraper
 
-def scrape_apple(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_apple(url: str) -> List[Dict[str, str]]:
     """
     Scraper for Apple Careers. 
-    Iterates through the first 5 pages of results.
+    Fetches the first 5 pages of results concurrently and parses them in order.
     """
     print(f"[Apple] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('apple')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
@@ -30,19 +33,24 @@ def scrape_apple(url: str) -> List[Dict[str, str]]:
     base_search_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
     
     all_jobs = []
+    fetcher = AsyncFetcher(session)
+    page_nums = list(range(1, 6))
     
-    # Iterate through the first 5 pages
-    for page_num in range(1, 6):
-        print(f"[Apple] Fetching page {page_num}...")
-        
-        # Update the page parameter
-        params['page'] = page_num
-        
+    # Request the first 5 pages at once; the engine caps in-flight requests per host
+    print(f"[Apple] Fetching pages {page_nums[0]}-{page_nums[-1]}...")
+    responses = await asyncio.gather(
+        *(fetcher.get(base_search_url, params={**params, 'page': page_num}, timeout=30) for page_num in page_nums),
+        return_exceptions=True
+    )
+    
+    for page_num, response in zip(page_nums, responses):
         try:
-            response = session.get(base_search_url, params=params, timeout=30)
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code != 200:
                 print(f"[Apple] Error {response.status_code} on page {page_num}")
+                mark_partial(f"Apple page {page_num}: HTTP {response.status_code}")
                 break
                 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -95,9 +103,6 @@ def scrape_apple(url: str) -> List[Dict[str, str]]:
                     print(f"[Apple] Error parsing job row: {e}")
                     continue
             
-            # Polite sleep between pages
-            time.sleep(1)
-            
         except Exception as e:
             print(f"[Apple] Request failed on page {page_num}: {e}")
             break
@@ -0,0 +1,221 @@
+"""
+Ashby job board engine.
+
+Every Ashby board is served by the same GraphQL operation,
+ApiJobBoardWithTeams, keyed by the org slug (jobs.ashbyhq.com/{org}).
+fetch_board() asks for only the fields the scrapers use, over one shared
+pooled connection to jobs.ashbyhq.com, and memoizes each org's board for
+BOARD_TTL_SECONDS, so several filtered views of one org in a run cost a
+single request. filter_postings() applies a team / location / employment
+type / keyword spec to a board.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .collector import JobCollector
+from .http_client import get_session
+from .tracing import traced
+
+API_URL = "https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
+JOB_URL = "https://jobs.ashbyhq.com/{org}/{job_id}"
+
+# Long enough to cover one scheduled run, short enough that the next run refetches
+BOARD_TTL_SECONDS = int(os.environ.get('ASHBY_BOARD_TTL', '120'))
+
+# Only the fields filter_postings() reads
+BOARD_QUERY = """query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
+  jobBoard: jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) {
+    teams { id name externalName }
+    jobPostings {
+      id
+      title
+      teamId
+      locationName
+      workplaceType
+      employmentType
+      secondaryLocations { locationName }
+    }
+  }
+}"""
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
+    'Content-Type': 'application/json',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'apollographql-client-name': 'frontend_non_user',
+    'apollographql-client-version': '0.1.0',
+    'Origin': 'https://jobs.ashbyhq.com',
+}
+
+# org -> (fetched at, board)
+_boards: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_lock = threading.Lock()
+_org_locks: Dict[str, threading.Lock] = {}
+
+
+def scrape_ashby(
+    url: str,
+    label: str,
+    org: Optional[str] = None,
+    teams: Optional[Set[str]] = None,
+    locations: Optional[Set[str]] = None,
+    employment_types: Optional[Set[str]] = None,
+    keyword: Optional[str] = None,
+    include_workplace: bool = False,
+    employment_type_in_url: bool = False,
+    matched_locations_only: bool = False,
+    impersonate: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """
+    Scrape one Ashby org (default: the first path segment of url) with a filter spec.
+
+    teams matches the posting's own team (externalName, else name); locations
+    matches any primary or secondary location. include_workplace appends a
+    non-Onsite workplace type to the location, and employment_type_in_url keeps
+    the ?employmentType= suffix some stored job URLs carry. With
+    matched_locations_only the location lists just the locations that passed
+    the filter, not all of the posting's.
+    """
+    print(f"[{label}] Scraping: {url}")
+    org = org or org_from_url(url)
+
+    board = fetch_board(org, impersonate=impersonate)
+    jobs = filter_postings(
+        board,
+        org,
+        teams=teams,
+        locations=locations,
+        employment_types=employment_types,
+        keyword=keyword,
+        include_workplace=include_workplace,
+        employment_type_in_url=employment_type_in_url,
+        matched_locations_only=matched_locations_only,
+    )
+
+    print(f"[{label}] Found {len(jobs)} jobs of {len(board.get('jobPostings') or [])} on the board")
+    return jobs
+
+
+def fetch_board(org: str, impersonate: Optional[str] = None) -> Dict[str, Any]:
+    """The org's board ({'teams': [...], 'jobPostings': [...]}), memoized per org. Raises on errors."""
+    with _lock:
+        cached = _boards.get(org)
+        if cached and time.monotonic() - cached[0] < BOARD_TTL_SECONDS:
+            return cached[1]
+        org_lock = _org_locks.setdefault(org, threading.Lock())
+
+    # One request per org even when two views of it run at the same time
+    with org_lock:
+        with _lock:
+            cached = _boards.get(org)
+            if cached and time.monotonic() - cached[0] < BOARD_TTL_SECONDS:
+                return cached[1]
+
+        session = get_session('ashby', impersonate=impersonate)
+        payload = {
+            "operationName": "ApiJobBoardWithTeams",
+            "variables": {"organizationHostedJobsPageName": org},
+            "query": BOARD_QUERY,
+        }
+        headers = {**HEADERS, 'Referer': f'https://jobs.ashbyhq.com/{org}'}
+
+        response = session.post(API_URL, json=payload, headers=headers, timeout=30)
+        response.raise_for_status()
+
+        board = (response.json().get('data') or {}).get('jobBoard')
+        if not board:
+            raise ValueError(f"No Ashby job board returned for '{org}'")
+
+        with _lock:
+            _boards[org] = (time.monotonic(), board)
+        return board
+
+
+@traced('parse.ashby')
+def filter_postings(
+    board: Dict[str, Any],
+    org: str,
+    teams: Optional[Set[str]] = None,
+    locations: Optional[Set[str]] = None,
+    employment_types: Optional[Set[str]] = None,
+    keyword: Optional[str] = None,
+    include_workplace: bool = False,
+    employment_type_in_url: bool = False,
+    matched_locations_only: bool = False,
+) -> List[Dict[str, str]]:
+    """Jobs on the board that pass every filter that is set."""
+    team_names = {
+        team.get('id'): (team.get('externalName') or team.get('name') or '').strip()
+        for team in board.get('teams') or []
+    }
+
+    collector = JobCollector()
+
+    for post in board.get('jobPostings') or []:
+        job_id = post.get('id')
+        title = post.get('title') or ''
+        if not job_id:
+            continue
+
+        # Only the team itself, not its parents
+        if teams and team_names.get(post.get('teamId'), '') not in teams:
+            continue
+
+        employment_type = post.get('employmentType')
+        if employment_types and employment_type not in employment_types:
+            continue
+
+        if keyword and keyword.lower() not in title.lower():
+            continue
+
+        locs = all_locations(post)
+        if locations and not (set(locs) & locations):
+            continue
+
+        if locations and matched_locations_only:
+            locs = [loc for loc in locs if loc in locations]
+
+        workplace_type = post.get('workplaceType')
+        if include_workplace and workplace_type and workplace_type != 'Onsite':
+            locs.append(workplace_type)
+
+        job_url = JOB_URL.format(org=org, job_id=job_id)
+        if employment_type_in_url and employment_type:
+            job_url += f"?employmentType={employment_type}"
+
+        collector.add({
+            'title': title,
+            'url': job_url,
+            'location': ", ".join(dict.fromkeys(locs))
+        })
+
+    return collector.jobs
+
+
+def all_locations(post: Dict[str, Any]) -> List[str]:
+    """Primary + secondary location names, in order, without blanks."""
+    locs = []
+    if post.get('locationName'):
+        locs.append(post['locationName'].strip())
+    for sec in post.get('secondaryLocations') or []:
+        if sec.get('locationName'):
+            locs.append(sec['locationName'].strip())
+    return locs
+
+
+def org_from_url(url: str) -> str:
+    """jobs.ashbyhq.com/{org}[/{job id}][?...] -> org"""
+    parts = [p for p in urlparse(url).path.split('/') if p]
+    if not parts:
+        raise ValueError(f"No Ashby org in {url}")
+    return parts[0]
+
+
+def employment_types_from_url(url: str) -> Set[str]:
+    """The employmentType filter of a board URL, if any."""
+    return set(parse_qs(urlparse(url).query).get('employmentType', []))
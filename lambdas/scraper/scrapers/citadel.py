@@ -1,15 +1,17 @@
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
 import html
-import time
+from .context import deadline_reached, mark_partial
+from .http_client import get_session
+from .collector import JobCollector
 
 def scrape_citadel(url: str) -> List[Dict[str, str]]:
     """
     Scraper for Citadel careers using WordPress AJAX API.
     """
     print(f"Citadel Scraping: {url}")
+    session = get_session('citadel')
     
     # 1. API Endpoint
     api_url = "https://www.citadel.com/wp-admin/admin-ajax.php"
@@ -42,11 +44,12 @@ def scrape_citadel(url: str) -> List[Dict[str, str]]:
         'x-requested-with': 'XMLHttpRequest', # Critical for WP AJAX
     }
     
-    jobs = []
-    seen_urls = set()
+    collector = JobCollector()
     current_page = 1
     
     while True:
+        if deadline_reached():
+            break
         print(f"Fetching page {current_page}...")
         
         # Update pagination in payload
@@ -55,10 +58,11 @@ def scrape_citadel(url: str) -> List[Dict[str, str]]:
         
         try:
             # Use POST with data=payload
-            response = requests.post(api_url, headers=headers, data=payload, timeout=30)
+            response = session.post(api_url, headers=headers, data=payload, timeout=30)
             
             if response.status_code != 200:
                 print(f"Status Error: {response.status_code}")
+                mark_partial(f"Citadel page {current_page}: HTTP {response.status_code}")
                 break
                 
             data = response.json()
@@ -79,16 +83,14 @@ def scrape_citadel(url: str) -> List[Dict[str, str]]:
                 print(f"No jobs found on page {current_page}.")
                 break
                 
-            new_jobs_count = 0
+            page_jobs = []
             
             for card in job_cards:
                 try:
                     job_url = card.get('href')
-                    if not job_url or job_url in seen_urls:
+                    if not job_url:
                         continue
                     
-                    seen_urls.add(job_url)
-                    
                     # Title is often in 'data-position' attribute or h2
                     # We must unescape HTML entities (e.g., &#038; -> &)
                     title_raw = card.get('data-position')
@@ -102,12 +104,11 @@ def scrape_citadel(url: str) -> List[Dict[str, str]]:
                     loc_elem = card.find('span', class_='careers-listing-card__location')
                     location = loc_elem.get_text(strip=True) if loc_elem else None
                     
-                    jobs.append({
+                    page_jobs.append({
                         'title': title,
                         'url': job_url,
                         'location': location
                     })
-                    new_jobs_count += 1
                     
                 except Exception as e:
                     print(f"Error parsing card: {e}")
@@ -115,20 +116,19 @@ def scrape_citadel(url: str) -> List[Dict[str, str]]:
             
             # Check if we should stop
             # If we found no new jobs, or if we have collected all known posts
-            if new_jobs_count == 0:
+            if collector.add_page(page_jobs).added == 0:
                 break
                 
-            if len(jobs) >= total_posts:
+            if len(collector) >= total_posts:
                 print(f"Reached total post count ({total_posts}).")
                 break
                 
             current_page += 1
-            time.sleep(1) # Be polite
             
         except Exception as e:
             print(f"Error fetching data: {e}")
             break
             
-    print(f"[Citadel] Found {len(jobs)} jobs")
-    return jobs
+    print(f"[Citadel] Found {len(collector)} jobs")
+    return collector.jobs
 
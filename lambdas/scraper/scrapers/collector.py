@@ -0,0 +1,112 @@
+"""
+Job accumulator shared by the scrapers.
+
+JobCollector keeps jobs in insertion order and dedupes them in O(1) on a
+canonical form of the URL. Scheme and host case, default ports, fragments,
+trailing slashes, tracking parameters and query order don't make two postings
+different. The job keeps the URL exactly as scraped, because that is the key
+stored in DynamoDB. add_page() records how many jobs each page added and how
+many were duplicates, so a pagination loop can stop once a page adds nothing.
+fingerprint() hashes the collected set, so an unchanged board can be
+recognised without looking each job up.
+"""
+
+import hashlib
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where the click came from
+TRACKING_PARAMS = {'gclid', 'fbclid', 'gh_src', 'lever-source'}
+TRACKING_PREFIXES = ('utm_',)
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class PageStats(NamedTuple):
+    added: int
+    duplicates: int
+
+
+def canonical_url(url: str) -> str:
+    """The dedupe key for a job URL (not a URL to fetch)."""
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+
+    path = parts.path
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+
+class JobCollector:
+    """Ordered, deduplicated jobs of one scrape."""
+
+    def __init__(self):
+        self.pages: List[PageStats] = []
+        self._jobs: List[Dict[str, str]] = []
+        self._keys = set()
+
+    def add(self, job: Dict[str, str]) -> bool:
+        """Adds the job unless its URL is missing or already collected; returns whether it was added."""
+        url = job.get('url')
+        if not url:
+            return False
+
+        key = canonical_url(url)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._jobs.append(job)
+        return True
+
+    def add_page(self, jobs: Iterable[Dict[str, str]]) -> PageStats:
+        """Adds one page of jobs and records its added / duplicate counts."""
+        added = duplicates = 0
+        for job in jobs:
+            if self.add(job):
+                added += 1
+            elif job.get('url'):
+                duplicates += 1
+
+        stats = PageStats(added, duplicates)
+        self.pages.append(stats)
+        return stats
+
+    def __contains__(self, url: str) -> bool:
+        return canonical_url(url) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self._jobs)
+
+    @property
+    def jobs(self) -> List[Dict[str, str]]:
+        return list(self._jobs)
+
+    def fingerprint(self) -> str:
+        """
+        Stable hash of the collected job set: the sorted canonical URLs, so it
+        ignores order and cosmetic URL differences. Equal fingerprints mean the
+        same jobs, i.e. nothing new to store.
+        """
+        digest = hashlib.sha256()
+        for key in sorted(self._keys):
+            digest.update(key.encode('utf-8'))
+            digest.update(b'\n')
+        return digest.hexdigest()
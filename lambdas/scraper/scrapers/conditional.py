@@ -0,0 +1,210 @@
+"""
+Conditional GET for single-document job feeds.
+
+conditional_get() sends the ETag / Last-Modified validators stored for the URL
+as If-None-Match / If-Modified-Since. A 304 raises BoardNotModified, and the
+Lambda skips parsing, dedupe and writes for that company. A 200 leaves its
+validators in the company's ScrapeContext, and the Lambda commits them only
+after the jobs are persisted. A run that fails halfway therefore never marks
+the document as seen.
+
+Validators live in a ValidatorStore keyed by request URL:
+    VALIDATOR_STORE=dynamodb  items 'validators#{url}' in STATE_TABLE (default when STATE_TABLE is set)
+    VALIDATOR_STORE=file      one JSON file, VALIDATOR_FILE (default locally)
+    VALIDATOR_STORE=off       plain GETs
+Each record also keeps the body size and the scraper CPU of the last full
+parse, which is what a later 304 saves. The Lambda hands its DynamoDB client
+to use_dynamodb_client(), so validator reads and writes are counted and
+traced with its other calls and share its connection pool.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from .context import ScrapeContext, current_context
+
+VALIDATOR_STORE = os.environ.get('VALIDATOR_STORE', 'dynamodb' if os.environ.get('STATE_TABLE') else 'file')
+VALIDATOR_FILE = os.environ.get('VALIDATOR_FILE', '/tmp/job_scraper_validators.json')
+STATE_TABLE = os.environ.get('STATE_TABLE', 'job_scraper_state')
+
+
+class BoardNotModified(Exception):
+    """The job document is unchanged since the last persisted run (HTTP 304)."""
+
+    def __init__(self, url: str):
+        super().__init__(f"Not modified since last run: {url}")
+        self.url = url
+
+
+class FileValidatorStore:
+    """Validators in one JSON file; survives warm invocations (and local runs)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read().get(url)
+
+    def put(self, url: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            records = self._read()
+            records[url] = record
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(records, f)
+            os.replace(tmp_path, self.path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class DynamoValidatorStore:
+    """Validators as 'validators#{url}' items of the state table."""
+
+    def __init__(self, table_name: str, client):
+        self.table_name = table_name
+        self.client = client
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        item = self.client.get_item(
+            TableName=self.table_name,
+            Key={'state_key': {'S': self._key(url)}}
+        ).get('Item')
+        if not item:
+            return None
+        return {
+            'etag': item.get('etag', {}).get('S'),
+            'last_modified': item.get('last_modified', {}).get('S'),
+            'bytes': int(item.get('bytes', {}).get('N', '0')),
+            'cpu_ms': float(item.get('cpu_ms', {}).get('N', '0')),
+        }
+
+    def put(self, url: str, record: Dict[str, Any]) -> None:
+        item = {
+            'state_key': {'S': self._key(url)},
+            'bytes': {'N': str(record.get('bytes', 0))},
+            'cpu_ms': {'N': str(record.get('cpu_ms', 0.0))},
+            'updated_at': {'N': str(int(time.time()))},
+        }
+        for field in ('etag', 'last_modified'):
+            if record.get(field):
+                item[field] = {'S': record[field]}
+        self.client.put_item(TableName=self.table_name, Item=item)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return f"validators#{url}"
+
+
+_store = None
+_store_lock = threading.Lock()
+_dynamodb_client = None
+
+
+def use_dynamodb_client(client) -> None:
+    """The boto3 DynamoDB client the dynamodb store should use (the Lambda's instrumented one)."""
+    global _dynamodb_client
+    _dynamodb_client = client
+
+
+def get_validator_store():
+    """The configured store, or None when conditional GETs are off."""
+    global _store
+    if VALIDATOR_STORE == 'off':
+        return None
+    with _store_lock:
+        if _store is None:
+            if VALIDATOR_STORE == 'dynamodb':
+                _store = DynamoValidatorStore(STATE_TABLE, _dynamodb_client or _default_dynamodb_client())
+            else:
+                _store = FileValidatorStore(VALIDATOR_FILE)
+        return _store
+
+
+def _default_dynamodb_client():
+    """For local tools that never went through the Lambda's setup."""
+    import boto3
+
+    return boto3.client('dynamodb')
+
+
+def conditional_get(session, url: str, **kwargs):
+    """
+    session.get(url, **kwargs) with the stored validators attached.
+    Raises BoardNotModified on 304. Outside a ScrapeContext it is a plain GET.
+    """
+    ctx = current_context()
+    store = get_validator_store() if ctx is not None else None
+    if store is None:
+        return session.get(url, **kwargs)
+
+    key = _request_key(url, kwargs.get('params'))
+    record = _lookup(store, key)
+    headers = dict(kwargs.pop('headers', None) or {})
+    if record and record.get('etag'):
+        headers['If-None-Match'] = record['etag']
+    if record and record.get('last_modified'):
+        headers['If-Modified-Since'] = record['last_modified']
+
+    response = session.get(url, headers=headers, **kwargs)
+
+    if response.status_code == 304 and record:
+        ctx.not_modified.append(key)
+        ctx.bytes_saved += record.get('bytes', 0)
+        ctx.cpu_ms_saved += record.get('cpu_ms', 0.0)
+        raise BoardNotModified(key)
+
+    if response.status_code == 200:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            ctx.pending_validators[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'bytes': len(response.content),
+            }
+
+    return response
+
+
+def commit_validators(ctx: ScrapeContext) -> None:
+    """Store the validators seen during ctx's scrape; call only after its jobs are persisted."""
+    store = get_validator_store()
+    if store is None or not ctx.pending_validators:
+        return
+
+    # The scraper's CPU is attributed to its documents, which is what a 304 saves next time
+    cpu_ms = ctx.cpu_ms / len(ctx.pending_validators)
+    for url, record in ctx.pending_validators.items():
+        try:
+            store.put(url, {**record, 'cpu_ms': round(cpu_ms, 1)})
+        except Exception as e:
+            # Only costs a full download next run
+            print(f"[{ctx.company_name}] Failed to store validators for {url}: {e}")
+    ctx.pending_validators.clear()
+
+
+def _request_key(url: str, params) -> str:
+    """The URL with its query parameters, so differently filtered requests get their own validators."""
+    if not params:
+        return url
+    query = urlencode(params, doseq=True)
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def _lookup(store, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        return store.get(url)
+    except Exception as e:
+        print(f"Validator lookup failed for {url}: {e}")
+        return None
@@ -0,0 +1,161 @@
+"""
+Per-company scrape context.
+
+The scraper Lambda opens a ScrapeContext around each company's scrape. Helpers
+deep inside a scraper (conditional GETs, the HTTP layer's retries, the
+invocation deadline) reach it through current_context() rather than through
+every scraper's signature. The context lives in a ContextVar, so concurrent
+companies on one event loop each see their own. The engine copies it onto the
+worker thread of a sync scraper and onto the fetch thread of every
+AsyncFetcher request.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Retries one company's requests may spend in total (see retry.py)
+RETRY_BUDGET = int(os.environ.get('RETRY_BUDGET', '20'))
+
+
+class DeadlineExceeded(Exception):
+    """The invocation is about to time out; stop fetching and keep what was collected."""
+
+
+class ScrapeContext:
+    """What one company's scrape observed, beyond its job list."""
+
+    def __init__(self, company_name: str, deadline: Optional[float] = None):
+        self.company_name = company_name
+        # time.monotonic() by which fetching must stop (None: no limit)
+        self.deadline = deadline
+        # Stopped early at the deadline (always also partial)
+        self.truncated = False
+        # url -> validators (etag / last_modified / bytes) to store once the jobs are persisted
+        self.pending_validators: Dict[str, Dict[str, Any]] = {}
+        # Documents the server answered 304 Not Modified for
+        self.not_modified: List[str] = []
+        # Body bytes and scraper CPU the 304s made unnecessary
+        self.bytes_saved = 0
+        self.cpu_ms_saved = 0.0
+        # CPU the scraper thread spent (sync scrapers only)
+        self.cpu_ms = 0.0
+        # Per-company totals for the run's metrics: HTTP attempts, 2xx answers
+        # (pages), body bytes, DynamoDB calls, and wall times set by the Lambda
+        self.requests = 0
+        self.pages = 0
+        self.bytes_downloaded = 0
+        self.dynamodb_calls = 0
+        self.scrape_ms = 0.0
+        self.notify_ms = 0.0
+        # Retries left and spent; partial once a request failed for good
+        self.retry_budget = RETRY_BUDGET
+        self.retries = 0
+        self.partial = False
+        self.partial_reasons: List[str] = []
+        self._lock = threading.Lock()
+
+    def record_request(self, body_bytes: int, ok: bool) -> None:
+        """Count one HTTP attempt (ok: answered 2xx)."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += body_bytes
+            if ok:
+                self.pages += 1
+
+    def record_dynamodb_call(self) -> None:
+        with self._lock:
+            self.dynamodb_calls += 1
+
+    def take_retry(self) -> bool:
+        """Spend one retry from the budget; False when it is used up."""
+        with self._lock:
+            if self.retries >= self.retry_budget:
+                return False
+            self.retries += 1
+            return True
+
+    def mark_partial(self, reason: str) -> None:
+        """Some of the board could not be fetched, so the job list may be incomplete."""
+        with self._lock:
+            self.partial = True
+            self.partial_reasons.append(reason)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def deadline_reached(self) -> bool:
+        """Whether the deadline has passed; the first time it has, marks the scrape truncated."""
+        remaining = self.remaining()
+        if remaining is None or remaining > 0:
+            return False
+        self.mark_truncated()
+        return True
+
+    def mark_truncated(self) -> None:
+        with self._lock:
+            if self.truncated:
+                return
+            self.truncated = True
+        print(f"[{self.company_name}] Deadline reached; keeping the jobs fetched so far")
+        self.mark_partial('deadline reached')
+
+
+_current: ContextVar[Optional[ScrapeContext]] = ContextVar('scrape_context', default=None)
+
+
+def current_context() -> Optional[ScrapeContext]:
+    """The context of the company being scraped, or None outside the Lambda (e.g. test scripts)."""
+    return _current.get()
+
+
+def deadline_reached() -> bool:
+    """For scrapers' own page loops: stop when this is True. Always False outside a context."""
+    ctx = current_context()
+    return ctx is not None and ctx.deadline_reached()
+
+
+def mark_partial(reason: str) -> None:
+    """For scrapers that give up on a page the HTTP layer returned. No-op outside a context."""
+    ctx = current_context()
+    if ctx is not None:
+        ctx.mark_partial(reason)
+
+
+def check_deadline() -> None:
+    """Raises DeadlineExceeded once the current context's deadline has passed."""
+    ctx = current_context()
+    if ctx is not None and ctx.deadline_reached():
+        raise DeadlineExceeded(f"Deadline reached while scraping {ctx.company_name}")
+
+
+@contextmanager
+def scrape_context(company_name: str, deadline: Optional[float] = None) -> Iterator[ScrapeContext]:
+    """A fresh context for company_name, current inside the with block."""
+    with use_context(ScrapeContext(company_name, deadline)) as ctx:
+        yield ctx
+
+
+@contextmanager
+def use_context(ctx: ScrapeContext) -> Iterator[ScrapeContext]:
+    """Make an existing context current inside the with block."""
+    token = _current.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current.reset(token)
+
+
+def run_measured(ctx: ScrapeContext, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call fn on this thread and add the thread's CPU time to ctx.cpu_ms."""
+    started = time.thread_time()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        ctx.cpu_ms += (time.thread_time() - started) * 1000
@@ -1,8 +1,9 @@
 import json
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
 import re
+from .http_client import get_session
+from .conditional import BoardNotModified, conditional_get
 
 def scrape_deshaw(url: str = "https://www.deshaw.com/careers") -> List[Dict[str, str]]:
     """
@@ -11,7 +12,7 @@ def scrape_deshaw(url: str = "https://www.deshaw.com/careers") -> List[Dict[str,
     """
     print(f"[DE Shaw] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('deshaw')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
     })
@@ -19,7 +20,7 @@ def scrape_deshaw(url: str = "https://www.deshaw.com/careers") -> List[Dict[str,
     jobs = []
     
     try:
-        response = session.get(url, timeout=30)
+        response = conditional_get(session, url, timeout=30)
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # 1. Get Next.js Data
@@ -66,6 +67,8 @@ def scrape_deshaw(url: str = "https://www.deshaw.com/careers") -> List[Dict[str,
                 'location': location_str
             })
             
+    except BoardNotModified:
+        raise
     except Exception as e:
         print(f"[DE Shaw] Extraction failed: {e}")
 
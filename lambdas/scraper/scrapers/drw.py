@@ -1,7 +1,8 @@
 import json
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
+from .conditional import BoardNotModified, conditional_get
 
 def scrape_drw(url: str = "https://drw.com/work-at-drw/listings") -> List[Dict[str, str]]:
     """
@@ -11,7 +12,7 @@ def scrape_drw(url: str = "https://drw.com/work-at-drw/listings") -> List[Dict[s
     """
     print(f"[DRW] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('drw')
     session.headers.update({
         'Authority': 'drw.com',
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
@@ -21,7 +22,7 @@ def scrape_drw(url: str = "https://drw.com/work-at-drw/listings") -> List[Dict[s
     jobs = []
     
     try:
-        response = session.get(url, timeout=30)
+        response = conditional_get(session, url, timeout=30)
         
         if response.status_code != 200:
             print(f"[DRW] API Error {response.status_code}")
@@ -83,6 +84,8 @@ def scrape_drw(url: str = "https://drw.com/work-at-drw/listings") -> List[Dict[s
                 'location': location_str
             })
             
+    except BoardNotModified:
+        raise
     except Exception as e:
         print(f"[DRW] Extraction failed: {e}")
 
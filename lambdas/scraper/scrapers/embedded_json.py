@@ -0,0 +1,98 @@
+"""
+Embedded JSON extraction.
+
+Pull a JSON value out of a page by the text that precedes it, e.g. '"jobs":['.
+Rather than walking the page a character at a time and counting brackets,
+json's C decoder (JSONDecoder.raw_decode) reads the value from the marker and
+stops where the value ends. This also handles brackets inside strings.
+
+Next.js App Router pages ship their data as a flight/RSC stream of JS string
+literals:
+    self.__next_f.push([1,"...{\\"jobs\\":[{\\"id\\":1,...}]}..."])
+so the JSON is escaped once. extract_escaped_json() finds the end of the
+enclosing string literal with a regex, unescapes it in one json.loads call, and
+raw-decodes from there. flight_payload() rebuilds the whole stream for values
+that are split across push() chunks.
+"""
+
+import json
+import re
+from typing import Any
+
+from .tracing import traced
+
+_decoder = json.JSONDecoder()
+
+# Body of a JSON/JS double-quoted string, up to (not including) the closing quote.
+# Unrolled (runs of plain characters between escapes) so re does not step per character.
+_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# One chunk of a Next.js flight stream: self.__next_f.push([1,"..."])
+_FLIGHT_CHUNK_RE = re.compile(r'self\.__next_f\.push\(\[\d+\s*,\s*("[^"\\]*(?:\\.[^"\\]*)*")\s*\]\)', re.DOTALL)
+
+
+@traced('parse.embedded_json')
+def extract_json(text: str, marker: str) -> Any:
+    """
+    The JSON value right after the first occurrence of marker in text. A marker
+    ending in '[' or '{' includes the value's opening bracket.
+    Raises ValueError when the marker is missing or the value doesn't decode.
+    """
+    start = text.find(marker)
+    if start == -1:
+        raise ValueError(f"Marker {marker!r} not found")
+    return _decode_at(text, start, marker)
+
+
+@traced('parse.escaped_json')
+def extract_escaped_json(text: str, marker: str) -> Any:
+    """
+    Like extract_json(), for a value embedded in a JS string literal (the marker
+    is given unescaped, e.g. '"jobs":[' finds \\"jobs\\":[).
+    Raises ValueError when the marker is missing or the value doesn't decode.
+    """
+    escaped_marker = json.dumps(marker)[1:-1]
+    start = text.find(escaped_marker)
+    if start == -1:
+        raise ValueError(f"Marker {marker!r} not found")
+
+    # Rest of the enclosing string literal, unescaped in one pass
+    body = _STRING_BODY_RE.match(text, start).group(0)
+    unescaped = json.loads('"' + body + '"')
+    return _decode_at(unescaped, 0, marker)
+
+
+def flight_payload(html: str) -> str:
+    """Every self.__next_f.push() string of a Next.js page, unescaped and joined in order."""
+    return ''.join(
+        chunk for chunk in (json.loads(m.group(1)) for m in _FLIGHT_CHUNK_RE.finditer(html))
+        if isinstance(chunk, str)
+    )
+
+
+@traced('parse.flight_json')
+def extract_flight_json(html: str, marker: str) -> Any:
+    """
+    The JSON value after marker in a Next.js flight stream: from the string
+    literal holding the marker, else from the reassembled stream, else from
+    the page as plain (unescaped) JSON.
+    Raises ValueError when none of these works.
+    """
+    try:
+        return extract_escaped_json(html, marker)
+    except ValueError:
+        pass
+    try:
+        return extract_json(flight_payload(html), marker)
+    except ValueError:
+        return extract_json(html, marker)
+
+
+def _decode_at(text: str, start: int, marker: str) -> Any:
+    pos = start + len(marker)
+    if marker[-1:] in ('[', '{'):
+        pos -= 1
+    # raw_decode does not skip leading whitespace itself
+    while pos < len(text) and text[pos] in ' \t\r\n':
+        pos += 1
+    value, _ = _decoder.raw_decode(text, pos)
+    return value
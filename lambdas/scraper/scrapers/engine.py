@@ -0,0 +1,153 @@
+"""
+asyncio scraping engine.
+
+Async scrapers await page fetches through an AsyncFetcher, which caps
+concurrency per host and runs the request on the shared pooled sessions from
+http_client (one HTTP layer, one set of keep-alive connections and counters).
+scrape_many() drives many companies, async and sync scrapers alike, on one
+event loop. sync_scraper() keeps the plain get_scraper(name)(url) call working.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from .context import ScrapeContext, run_measured, use_context
+from .tracing import span
+
+T = TypeVar('T')
+
+# In-flight requests allowed per host, across every company on the loop
+PER_HOST_CONCURRENCY = int(os.environ.get('PER_HOST_CONCURRENCY', '4'))
+# Threads that carry blocking requests for the event loop; survives warm invocations
+FETCH_THREADS = int(os.environ.get('FETCH_THREADS', '32'))
+
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_THREADS, thread_name_prefix='fetch')
+
+# Semaphores belong to the loop that created them: loop -> host -> semaphore
+_host_limits_lock = threading.Lock()
+_host_limits: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = weakref.WeakKeyDictionary()
+
+
+class AsyncFetcher:
+    """Awaitable wrapper around a get_session() session, limited per host."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def request(self, method: str, url: str, **kwargs):
+        loop = asyncio.get_running_loop()
+        async with _host_semaphore(loop, urlsplit(url).netloc):
+            # The fetch thread sees the company's ScrapeContext (retry budget, partial flag)
+            call = functools.partial(contextvars.copy_context().run, self.session.request, method, url, **kwargs)
+            return await loop.run_in_executor(_fetch_executor, call)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+
+def sync_scraper(async_fn: Callable[..., Awaitable[List[Dict[str, str]]]]) -> Callable[..., List[Dict[str, str]]]:
+    """
+    Decorator for async scrapers: the returned function is a normal blocking
+    scraper, and the coroutine function stays reachable as .async_scrape so
+    scrape_many() can run it on its own loop.
+    """
+    @functools.wraps(async_fn)
+    def wrapper(url: str, *args, **kwargs) -> List[Dict[str, str]]:
+        return run_async(async_fn(url, *args, **kwargs))
+
+    wrapper.async_scrape = async_fn
+    return wrapper
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion from sync code, even if this thread already runs a loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Called from inside a loop: finish the coroutine on a private loop in another thread
+    result: Dict[str, Any] = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+async def scrape_many(
+    companies: List[Tuple[str, str]],
+    concurrency: int = 8,
+    contexts: Optional[Dict[str, ScrapeContext]] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape (company_name, url) pairs concurrently on the running loop.
+
+    Async scrapers are awaited directly; sync ones run on a worker thread.
+    A company's ScrapeContext from contexts, if given, is current while it is
+    scraped (on the worker thread too, which also measures its CPU time), and
+    gets the company's wall time in scrape_ms.
+    Returns company_name -> job list, or the exception that company raised.
+    """
+    from . import get_scraper
+
+    limit = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
+    contexts = contexts or {}
+
+    async def run_one(company_name: str, url: str):
+        async with limit:
+            scrape_fn = get_scraper(company_name)
+            async_fn = getattr(scrape_fn, 'async_scrape', None)
+            ctx = contexts.get(company_name) or ScrapeContext(company_name)
+
+            # Each task runs in its own copy of the contextvars, so this stays per company
+            started = time.monotonic()
+            try:
+                with use_context(ctx), span('scrape', company=company_name):
+                    if async_fn is not None:
+                        return await async_fn(url)
+                    call = functools.partial(contextvars.copy_context().run, run_measured, ctx, scrape_fn, url)
+                    return await loop.run_in_executor(scraper_executor, call)
+            finally:
+                ctx.scrape_ms = (time.monotonic() - started) * 1000
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='scrape') as scraper_executor:
+        outcomes = await asyncio.gather(
+            *(run_one(name, url) for name, url in companies),
+            return_exceptions=True
+        )
+
+    return {name: outcome for (name, _), outcome in zip(companies, outcomes)}
+
+
+def _host_semaphore(loop: asyncio.AbstractEventLoop, host: str) -> asyncio.Semaphore:
+    with _host_limits_lock:
+        limits = _host_limits.get(loop)
+        if limits is None:
+            limits = {}
+            _host_limits[loop] = limits
+    semaphore = limits.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PER_HOST_CONCURRENCY)
+        limits[host] = semaphore
+    return semaphore
@@ -0,0 +1,176 @@
+"""
+Recorded HTTP exchanges, for running scrapers offline.
+
+Inside recording(directory), every response the shared HTTP layer receives is
+saved to directory. Inside replaying(directory), http_client answers requests
+from those files and nothing reaches the network: no rate limiting, retries or
+deadlines. The scraper's own code (parsing, filtering, pagination) runs exactly
+as it does live. scripts/benchmark_scrapers.py uses this to time parsers on
+captured pages.
+
+A directory holds exchanges.jsonl (one request/response record per line) and
+one NNN.body file per response body, as received after decompression.
+Requests are matched on method, full URL and body. A request whose body
+differs from the recording, e.g. because it carries a fresh anti-bot token,
+falls back to the first unused exchange with the same method and URL.
+
+Only one store is active at a time, for all threads: recording and replaying
+are for local tools, never the Lambda.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+EXCHANGES_FILE = 'exchanges.jsonl'
+
+# Describe the bytes on the wire, not the decoded body that is stored
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+class FixtureMissing(LookupError):
+    """Replay found no recorded response for a request."""
+
+
+class FixtureStore:
+    """The exchanges in one directory, recorded or replayed."""
+
+    def __init__(self, directory: str, replaying: bool):
+        self.directory = directory
+        self.replaying = replaying
+        self.exchanges: List[Dict[str, Any]] = []
+        self.replayed = 0
+        self.missing: List[str] = []
+        self._bodies: Dict[str, bytes] = {}
+        self._used: set = set()
+        self._lock = threading.Lock()
+        if replaying:
+            self._load()
+
+    def record(self, method: str, url: str, kwargs: Dict[str, Any], response) -> None:
+        full_url = request_url(method, url, kwargs)
+        with self._lock:
+            index = len(self.exchanges)
+            body_file = f"{index:03d}.body"
+            with open(os.path.join(self.directory, body_file), 'wb') as f:
+                f.write(response.content)
+            exchange = {
+                'method': method.upper(),
+                'url': full_url,
+                'body_key': body_key(kwargs),
+                'status_code': response.status_code,
+                'headers': {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+                'body_file': body_file,
+            }
+            self.exchanges.append(exchange)
+            with open(os.path.join(self.directory, EXCHANGES_FILE), 'a') as f:
+                f.write(json.dumps(exchange) + '\n')
+
+    def replay(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        full_url = request_url(method, url, kwargs)
+        key = body_key(kwargs)
+        with self._lock:
+            index = self._match(method.upper(), full_url, key)
+            if index is None:
+                self.missing.append(f"{method.upper()} {full_url}")
+                raise FixtureMissing(f"No recorded response for {method.upper()} {full_url}")
+            self._used.add(index)
+            self.replayed += 1
+        return self._response(self.exchanges[index])
+
+    def _match(self, method: str, url: str, key: str) -> Optional[int]:
+        same_request = [
+            i for i, e in enumerate(self.exchanges)
+            if e['method'] == method and e['url'] == url
+        ]
+        for i in same_request:
+            if self.exchanges[i]['body_key'] == key:
+                return i
+        for i in same_request:
+            if i not in self._used:
+                return i
+        # Scrapers may ask for the same page twice; repeat the last one
+        return same_request[-1] if same_request else None
+
+    def _response(self, exchange: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = exchange['status_code']
+        response.headers = CaseInsensitiveDict(exchange['headers'])
+        response.url = exchange['url']
+        response.reason = ''
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self._bodies[exchange['body_file']]
+        return response
+
+    def _load(self) -> None:
+        path = os.path.join(self.directory, EXCHANGES_FILE)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No recorded exchanges in {self.directory}")
+        with open(path) as f:
+            self.exchanges = [json.loads(line) for line in f if line.strip()]
+        # Read up front, so replaying costs no file I/O
+        for exchange in self.exchanges:
+            with open(os.path.join(self.directory, exchange['body_file']), 'rb') as f:
+                self._bodies[exchange['body_file']] = f.read()
+
+
+def request_url(method: str, url: str, kwargs: Dict[str, Any]) -> str:
+    """The URL with the request's params applied, as it goes on the wire."""
+    return requests.Request(method, url, params=kwargs.get('params')).prepare().url
+
+
+def body_key(kwargs: Dict[str, Any]) -> str:
+    """A short hash of the request body ('' without one); dict bodies hash the same in any key order."""
+    if kwargs.get('json') is not None:
+        body = json.dumps(kwargs['json'], sort_keys=True)
+    elif isinstance(kwargs.get('data'), dict):
+        body = urlencode(sorted(kwargs['data'].items()))
+    elif kwargs.get('data') is not None:
+        body = kwargs['data']
+    else:
+        return ''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+_active: Optional[FixtureStore] = None
+
+
+def active_store() -> Optional[FixtureStore]:
+    return _active
+
+
+@contextmanager
+def recording(directory: str) -> Iterator[FixtureStore]:
+    """Save every response received inside the block to directory (which is emptied first)."""
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name == EXCHANGES_FILE or name.endswith('.body'):
+            os.remove(os.path.join(directory, name))
+    with _activated(FixtureStore(directory, replaying=False)) as store:
+        yield store
+
+
+@contextmanager
+def replaying(directory: str) -> Iterator[FixtureStore]:
+    """Answer every request inside the block from the exchanges recorded in directory."""
+    with _activated(FixtureStore(directory, replaying=True)) as store:
+        yield store
+
+
+@contextmanager
+def _activated(store: FixtureStore) -> Iterator[FixtureStore]:
+    global _active
+    previous, _active = _active, store
+    try:
+        yield store
+    finally:
+        _active = previous
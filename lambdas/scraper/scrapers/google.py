@@ -1,9 +1,10 @@
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
 import re
+from .http_client import get_session
+from .collector import JobCollector
+from .context import deadline_reached
 
 def scrape_google(url: str) -> List[Dict[str, str]]:
     """
@@ -13,7 +14,7 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
     """
     print(f"[Google] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('google')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
@@ -24,10 +25,13 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
     query_params = parse_qs(parsed_url.query)
     base_url_parts = list(parsed_url)
     
-    all_jobs = []
+    collector = JobCollector()
     page = 1
     
     while True:
+        if deadline_reached():
+            break
+        
         print(f"[Google] Fetching page {page}...")
         
         # Update page parameter
@@ -49,7 +53,7 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
                 print(f"[Google] No jobs found on page {page}. Stopping.")
                 break
                 
-            jobs_found_on_page = 0
+            page_jobs = []
             
             for link in job_links:
                 # 2. Identify the Container
@@ -62,10 +66,6 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
                 relative_url = link['href']
                 full_url = f"https://www.google.com/about/careers/applications/{relative_url}"
                 
-                # Check for duplicates
-                if any(j['url'] == full_url for j in all_jobs):
-                    continue
-
                 # --- TITLE ---
                 # Systematic: The Title is always the H3 heading inside the card.
                 title_tag = card.find('h3')
@@ -89,16 +89,17 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
                     if loc_span:
                         location_str = loc_span.get_text(strip=True)
                 
-                all_jobs.append({
+                page_jobs.append({
                     'title': title,
                     'url': full_url,
                     'location': location_str
                 })
-                jobs_found_on_page += 1
             
-            print(f"[Google] Found {jobs_found_on_page} jobs on page {page}")
+            # Duplicates (the same card linked twice, or repeated across pages) are dropped here
+            stats = collector.add_page(page_jobs)
+            print(f"[Google] Found {stats.added} jobs on page {page} ({stats.duplicates} duplicates)")
             
-            if jobs_found_on_page == 0:
+            if stats.added == 0:
                 break
             
             # Google often stops pagination around page 5-10 for unauthenticated scraping
@@ -106,12 +107,11 @@ def scrape_google(url: str) -> List[Dict[str, str]]:
                 break
                 
             page += 1
-            time.sleep(2) # Necessary delay to avoid blocks
             
         except Exception as e:
             print(f"[Google] Request failed: {e}")
             break
 
-    print(f"[Google] Total jobs found: {len(all_jobs)}")
-    return all_jobs
+    print(f"[Google] Total jobs found: {len(collector)}")
+    return collector.jobs
 
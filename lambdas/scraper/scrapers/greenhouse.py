@@ -0,0 +1,408 @@
+"""
+Greenhouse board engine.
+
+One GET to the public board API returns every open job on a board:
+    https://boards-api.greenhouse.io/v1/boards/{board}/jobs
+
+The departments[] / offices[] ids that the seeded job-board URLs carry are
+applied locally (a selected parent department or office also matches its
+children, as on the HTML board), together with optional department-name,
+location-name, metadata and title-keyword filters. The ancestry comes from
+the postings' own departments and offices. When one of them has a parent that
+no posting is filed under, the board's full tree is read from
+/v1/boards/{board}/departments (or /offices) with one more request.
+
+Boards that used to be scraped from job-boards.greenhouse.io HTML keep their
+job URLs in that form (https://job-boards.greenhouse.io/{board}/jobs/{id}) so
+dedupe against stored jobs stays stable; if the API is unavailable they fall
+back to walking the HTML board. Only that fallback parses HTML: with lxml's
+XPath over the job rows when the page matches the known layout, otherwise with
+BeautifulSoup. Each company logs once which parser ran ('api' for the board
+API).
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # BeautifulSoup alone still works, just slower
+    lxml_html = None
+
+from .collector import JobCollector
+from .context import DeadlineExceeded, deadline_reached, mark_partial
+from .http_client import get_session
+from .tracing import traced
+
+BOARD_API = "https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+BOARD_TREE_API = "https://boards-api.greenhouse.io/v1/boards/{board}/{kind}"
+BOARD_HTML = "https://job-boards.greenhouse.io/{board}"
+BOARD_JOB_URL = "https://job-boards.greenhouse.io/{board}/jobs/{job_id}"
+
+# Pages walked by the HTML fallback
+MAX_HTML_PAGES = 10
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/html;q=0.9, */*;q=0.8',
+}
+
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)')
+
+# Fast-path selectors, equivalent to the BeautifulSoup ones
+_JOB_POST_RE = re.compile(r'class="[^"]*\bjob-post\b')
+_ROW_XPATH = ".//tr[contains(concat(' ', normalize-space(@class), ' '), ' job-post ')]"
+_DEPARTMENT_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' job-posts--table--department ')]"
+
+
+def scrape_greenhouse(
+    url: str,
+    label: str,
+    board: Optional[str] = None,
+    department_ids: Optional[Set[str]] = None,
+    office_ids: Optional[Set[str]] = None,
+    department_names: Optional[Set[str]] = None,
+    location_names: Optional[Set[str]] = None,
+    metadata: Optional[Dict[str, Set[str]]] = None,
+    keyword: Optional[str] = None,
+    board_urls: bool = True,
+) -> List[Dict[str, str]]:
+    """
+    Scrape one Greenhouse board with a single API request.
+
+    board defaults to the one named in url; department_ids / office_ids default
+    to the departments[] / offices[] query parameters of url. With board_urls
+    the job URL is the job-boards.greenhouse.io one, otherwise the API's
+    absolute_url (the company's own careers page for embedded boards).
+    """
+    print(f"[{label}] Scraping: {url}")
+
+    board = board or board_from_url(url)
+    url_departments, url_offices = filters_from_url(url)
+    department_ids = url_departments if department_ids is None else department_ids
+    office_ids = url_offices if office_ids is None else office_ids
+
+    # Department and office objects are only included with content=true
+    needs_content = bool(department_ids or office_ids or department_names)
+    session = get_session(f"greenhouse:{board}")
+
+    try:
+        postings = fetch_board(board, session, content=needs_content)
+    except Exception as e:
+        if not board_urls:
+            raise
+        print(f"[{label}] Board API failed ({e}); falling back to HTML board")
+        jobs = _scrape_html(board, department_ids, office_ids, department_names, label, session)
+        print(f"[{label}] Total jobs found: {len(jobs)}")
+        return jobs
+
+    print(f"[{label}] Board API returned {len(postings)} jobs (parser: api)")
+
+    departments = _tree(postings, 'departments')
+    offices = _tree(postings, 'offices')
+    if department_ids or department_names:
+        departments = _complete_tree(departments, board, 'departments', session, label)
+    if office_ids:
+        offices = _complete_tree(offices, board, 'offices', session, label)
+
+    collector = JobCollector()
+
+    for posting in postings:
+        title = (posting.get('title') or '').strip()
+        location = ((posting.get('location') or {}).get('name') or '').strip()
+
+        if department_ids and not (_expand(posting, 'departments', departments) & department_ids):
+            continue
+        if office_ids and not (_expand(posting, 'offices', offices) & office_ids):
+            continue
+        if department_names and not (_names(_expand(posting, 'departments', departments), departments) & department_names):
+            continue
+        if location_names and location not in location_names:
+            continue
+        if metadata and not all(_metadata_value(posting, key) in allowed for key, allowed in metadata.items()):
+            continue
+        if keyword and keyword.lower() not in title.lower():
+            continue
+
+        if board_urls:
+            job_url = BOARD_JOB_URL.format(board=board, job_id=posting.get('id'))
+        else:
+            job_url = (posting.get('absolute_url') or '').strip()
+
+        collector.add({
+            'title': title,
+            'url': job_url,
+            'location': location or 'Not specified'
+        })
+
+    print(f"[{label}] Total jobs found: {len(collector)}")
+    return collector.jobs
+
+
+def fetch_board(board: str, session=None, content: bool = False) -> List[Dict]:
+    """All open postings on a board. Raises on HTTP errors."""
+    session = session or get_session(f"greenhouse:{board}")
+    params = {'content': 'true'} if content else None
+
+    response = session.get(BOARD_API.format(board=board), params=params, headers=DEFAULT_HEADERS, timeout=30)
+    response.raise_for_status()
+    return response.json().get('jobs', [])
+
+
+def fetch_tree(board: str, kind: str, session=None) -> Dict[str, Tuple[str, Optional[str]]]:
+    """id -> (name, parent id) for every department or office (kind) of a board. Raises on HTTP errors."""
+    session = session or get_session(f"greenhouse:{board}")
+
+    response = session.get(BOARD_TREE_API.format(board=board, kind=kind), headers=DEFAULT_HEADERS, timeout=30)
+    response.raise_for_status()
+    return _nodes(response.json().get(kind) or [])
+
+
+def board_from_url(url: str) -> str:
+    """
+    Board token from any Greenhouse URL form: job-boards / boards.greenhouse.io/{board},
+    (boards-)api.greenhouse.io/v1/boards/{board}/jobs or embed/job_board?for={board}.
+    """
+    parsed = urlparse(url)
+    parts = [p for p in parsed.path.split('/') if p]
+
+    if 'boards' in parts and parts.index('boards') + 1 < len(parts):
+        return parts[parts.index('boards') + 1]
+    if parts[:1] == ['embed']:
+        return parse_qs(parsed.query).get('for', [''])[0]
+    if parts:
+        return parts[0]
+    raise ValueError(f"No Greenhouse board in {url}")
+
+
+def filters_from_url(url: str) -> Tuple[Set[str], Set[str]]:
+    """The departments[] and offices[] ids of a job-board URL."""
+    query = parse_qs(urlparse(url).query)
+    return set(query.get('departments[]', [])), set(query.get('offices[]', []))
+
+
+def parse_board_html(html: str, board: str, department_names: Optional[Set[str]] = None) -> List[Dict[str, str]]:
+    """
+    Jobs from one page of a job-boards.greenhouse.io board:
+      <div class="job-posts--table--department"><h3>DEPARTMENT</h3> ... <tr class="job-post">
+    With department_names, only the matching department blocks are kept.
+    """
+    return parse_board_page(html, board, department_names)[0]
+
+
+@traced('parse.greenhouse_html')
+def parse_board_page(html: str, board: str, department_names: Optional[Set[str]] = None) -> Tuple[List[Dict[str, str]], str]:
+    """
+    parse_board_html() plus the parser that produced the jobs: 'lxml' when every
+    job row matched the expected layout, otherwise 'bs4' (the original parser).
+    """
+    if lxml_html is not None:
+        try:
+            jobs = _parse_board_lxml(html, board, department_names)
+        except Exception:
+            jobs = None
+        if jobs is not None:
+            return jobs, 'lxml'
+    return _parse_board_bs4(html, board, department_names), 'bs4'
+
+
+def _parse_board_lxml(html: str, board: str, department_names: Optional[Set[str]]) -> Optional[List[Dict[str, str]]]:
+    """
+    The fast path: lxml's C parser and XPath over the tr.job-post rows only.
+    Returns None when the page doesn't look like the layout parse_board_html
+    documents, so the caller can fall back to BeautifulSoup.
+    """
+    if not _JOB_POST_RE.search(html):
+        # Nothing to extract, or a layout this path doesn't know
+        return None
+
+    root = lxml_html.fromstring(html)
+
+    if department_names:
+        departments = root.xpath(_DEPARTMENT_XPATH)
+        if not departments:
+            return None
+        blocks = []
+        for block in departments:
+            headers = block.xpath('.//h3')
+            if headers and _text(headers[0]) in department_names:
+                blocks.append(block)
+    else:
+        blocks = [root]
+
+    jobs = []
+    for block in blocks:
+        for row in block.xpath(_ROW_XPATH):
+            links = row.xpath('.//a[@href]')
+            if not links:
+                return None
+            link = links[0]
+
+            title_elems = link.xpath(".//p[contains(@class, 'body--medium')]")
+            if not title_elems:
+                return None
+            # First string only, so the "New" badge doesn't pollute the title
+            title = next((t.strip() for t in title_elems[0].itertext() if t.strip()), '')
+            if not title:
+                return None
+
+            loc_elems = link.xpath(".//p[contains(@class, 'body--metadata')]")
+            location = _text(loc_elems[0]) if loc_elems else ''
+
+            jobs.append({
+                'title': title,
+                'url': _board_job_url(board, link.get('href').strip()),
+                'location': location or 'Not specified'
+            })
+
+    return jobs
+
+
+def _parse_board_bs4(html: str, board: str, department_names: Optional[Set[str]]) -> List[Dict[str, str]]:
+    soup = BeautifulSoup(html, 'html.parser')
+
+    blocks = []
+    if department_names:
+        for block in soup.select('div.job-posts--table--department'):
+            header = block.find('h3')
+            if header and header.get_text(' ', strip=True) in department_names:
+                blocks.append(block)
+    else:
+        blocks.append(soup)
+
+    jobs = []
+    for block in blocks:
+        for row in block.select('tr.job-post'):
+            link = row.find('a', href=True)
+            if not link:
+                continue
+
+            title_elem = link.find('p', class_=lambda c: c and 'body--medium' in c)
+            if not title_elem:
+                continue
+            # First string only, so the "New" badge doesn't pollute the title
+            title = next(iter(title_elem.stripped_strings), '').strip()
+            if not title:
+                continue
+
+            loc_elem = link.find('p', class_=lambda c: c and 'body--metadata' in c)
+            location = loc_elem.get_text(' ', strip=True) if loc_elem else ''
+
+            jobs.append({
+                'title': title,
+                'url': _board_job_url(board, link['href'].strip()),
+                'location': location or 'Not specified'
+            })
+
+    return jobs
+
+
+def _scrape_html(
+    board: str,
+    department_ids: Set[str],
+    office_ids: Set[str],
+    department_names: Optional[Set[str]],
+    label: str,
+    session,
+) -> List[Dict[str, str]]:
+    """Page through the HTML board until a page adds nothing new."""
+    params = {
+        'departments[]': sorted(department_ids),
+        'offices[]': sorted(office_ids),
+    }
+
+    collector = JobCollector()
+    # parser -> pages it parsed
+    parsers: Dict[str, int] = {}
+
+    for page in range(1, MAX_HTML_PAGES + 1):
+        if deadline_reached():
+            break
+        print(f"[{label}] Fetching HTML page {page}...")
+        try:
+            response = session.get(BOARD_HTML.format(board=board), params={**params, 'page': str(page)},
+                                   headers=DEFAULT_HEADERS, timeout=30)
+        except DeadlineExceeded:
+            # Keep the pages fetched so far
+            break
+        if response.status_code != 200:
+            print(f"[{label}] Error {response.status_code}")
+            mark_partial(f"{label} HTML page {page}: HTTP {response.status_code}")
+            break
+
+        page_jobs, parser = parse_board_page(response.content.decode('utf-8', errors='replace'), board, department_names)
+        stats = collector.add_page(page_jobs)
+        parsers[parser] = parsers.get(parser, 0) + 1
+
+        print(f"[{label}] Found {stats.added} new jobs on page {page}.")
+        if stats.added == 0:
+            break
+
+    if parsers:
+        print(f"[{label}] HTML pages parsed (parser: {', '.join(f'{name} x{pages}' for name, pages in parsers.items())})")
+    return collector.jobs
+
+
+def _board_job_url(board: str, href: str) -> str:
+    match = _JOB_ID_RE.search(href)
+    if match:
+        return BOARD_JOB_URL.format(board=board, job_id=match.group(1))
+    return urljoin(BOARD_HTML.format(board=board) + '/', href)
+
+
+def _text(elem) -> str:
+    """Like BeautifulSoup's get_text(' ', strip=True)."""
+    return ' '.join(t.strip() for t in elem.itertext() if t.strip())
+
+
+def _tree(postings: List[Dict], kind: str) -> Dict[str, Tuple[str, Optional[str]]]:
+    """id -> (name, parent id) for every department or office the postings are filed under."""
+    return _nodes(node for posting in postings for node in posting.get(kind) or [])
+
+
+def _nodes(nodes) -> Dict[str, Tuple[str, Optional[str]]]:
+    tree: Dict[str, Tuple[str, Optional[str]]] = {}
+    for node in nodes:
+        parent = node.get('parent_id')
+        tree[str(node.get('id'))] = (node.get('name') or '', str(parent) if parent else None)
+    return tree
+
+
+def _complete_tree(tree: Dict[str, Tuple[str, Optional[str]]], board: str, kind: str, session, label: str):
+    """tree, or the board's full one when an ancestor is missing from it (filters could not reach past it)."""
+    if all(parent is None or parent in tree for _, parent in tree.values()):
+        return tree
+    try:
+        full = fetch_tree(board, kind, session)
+    except Exception as e:
+        print(f"[{label}] Could not load the board's {kind} ({e}); matching on the postings' own")
+        mark_partial(f"{label}: board {kind} unavailable")
+        return tree
+    print(f"[{label}] Loaded the board's {len(full)} {kind} for parent filters")
+    return {**tree, **full}
+
+
+def _expand(posting: Dict, kind: str, tree: Dict[str, Tuple[str, Optional[str]]]) -> Set[str]:
+    """The posting's department/office ids plus all their known ancestors."""
+    ids: Set[str] = set()
+    for node in posting.get(kind) or []:
+        node_id: Optional[str] = str(node.get('id'))
+        while node_id and node_id not in ids:
+            ids.add(node_id)
+            node_id = tree.get(node_id, ('', None))[1]
+    return ids
+
+
+def _names(ids: Set[str], tree: Dict[str, Tuple[str, Optional[str]]]) -> Set[str]:
+    return {tree[node_id][0] for node_id in ids if node_id in tree}
+
+
+def _metadata_value(posting: Dict, key: str) -> str:
+    for field in posting.get('metadata') or []:
+        if field.get('name') == key:
+            value = field.get('value')
+            return '' if value is None else str(value).strip()
+    return ''
@@ -1,7 +1,7 @@
 import json
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
 
 def scrape_hrt(url: str = "https://www.hudsonrivertrading.com/careers/") -> List[Dict[str, str]]:
     """
@@ -10,7 +10,7 @@ def scrape_hrt(url: str = "https://www.hudsonrivertrading.com/careers/") -> List
     """
     print(f"[HRT] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('hrt')
     session.headers.update({
         'Authority': 'www.hudsonrivertrading.com',
         'Accept': '*/*',
@@ -0,0 +1,280 @@
+"""
+Shared HTTP client for the scrapers.
+
+Connection pools live at module level, so they survive across warm Lambda
+invocations: a warm container skips DNS and the TLS handshake for every host it
+has already talked to. Scrapers get their sessions from get_session() instead of
+building (and throwing away) their own. Every request is paced by its host's
+adaptive rate limiter (rate_limit.py) and retried per the shared policy
+(retry.py), within the company's deadline (context.py), and traced as one
+span per request, retries included (tracing.py). Local tools can record the
+responses and replay them offline (fixtures.py).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .context import check_deadline, current_context
+from .fixtures import active_store
+from .rate_limit import MAX_RETRY_AFTER, get_limiter, retry_after_seconds
+from .retry import RetryState, is_retryable_status
+from .tracing import span
+
+# Distinct hosts kept alive at once (urllib3 pool_connections)
+POOL_HOSTS = 64
+# Keep-alive connections per host; covers concurrent companies and page prefetch
+POOL_MAXSIZE = 16
+# (connect, read) seconds, used when a scraper does not pass its own timeout
+DEFAULT_TIMEOUT = (5, 30)
+
+_lock = threading.Lock()
+_adapter: Optional[HTTPAdapter] = None
+_impersonated: Dict[str, Any] = {}
+_impersonated_class = None
+
+# (transport, host) -> requests sent
+_request_counts: Dict[tuple, int] = {}
+_session_counts = {'impersonated_created': 0, 'impersonated_reused': 0}
+
+
+class _HookedSession:
+    """
+    request() override shared by both transports. Every scraper request passes
+    through here, which makes it the one place to add cross-cutting behaviour.
+    """
+
+    _transport = 'pooled'
+    _default_timeout: Any = DEFAULT_TIMEOUT
+    # Transport errors worth retrying, and the subclasses of those that are not
+    _retryable_errors: tuple = (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+    )
+    _fatal_errors: tuple = (requests.exceptions.SSLError, requests.exceptions.InvalidURL)
+
+    def request(self, method, url, *args, **kwargs):
+        fixtures = active_store()
+        if fixtures is not None and fixtures.replaying:
+            return fixtures.replay(method, url, kwargs)
+
+        retries = RetryState(method, url)
+        with span(f"http.{method.upper()}", url=url, transport=self._transport) as current:
+            response = self._send(retries, method, url, *args, **kwargs)
+            if current is not None:
+                current.set('status_code', response.status_code)
+                current.set('bytes', len(response.content))
+                current.set('retries', retries.retries)
+        if fixtures is not None:
+            fixtures.record(method, url, kwargs, response)
+        return response
+
+    def _send(self, retries: RetryState, method, url, *args, **kwargs):
+        timeout = kwargs.get('timeout')
+        if timeout is None:
+            timeout = self._default_timeout
+        ctx = current_context()
+        limiter = get_limiter(urlsplit(url).netloc)
+
+        while True:
+            limiter.acquire()
+            # Past the deadline nothing is sent; before it, no request may outlive it
+            check_deadline()
+            remaining = ctx.remaining() if ctx is not None else None
+            kwargs['timeout'] = timeout if remaining is None else _cap_timeout(timeout, remaining)
+            _record_request(self._transport, url)
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except Exception as e:
+                if ctx is not None:
+                    ctx.record_request(0, False)
+                if not isinstance(e, self._retryable_errors) or isinstance(e, self._fatal_errors):
+                    retries.give_up(f"{type(e).__name__}: {e}")
+                    raise
+                if retries.next_delay(type(e).__name__) is None:
+                    raise
+                time.sleep(retries.delay)
+                continue
+
+            if ctx is not None:
+                ctx.record_request(len(response.content), 200 <= response.status_code < 300)
+            retry_after = retry_after_seconds(response)
+            limiter.observe(response.status_code, retry_after)
+            if not is_retryable_status(response.status_code):
+                # The scraper decides: it may recover (e.g. refresh a stale token) or give up
+                return response
+
+            # A Retry-After longer than we are willing to wait is a failure now
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                retries.give_up(f"HTTP {response.status_code}, Retry-After {retry_after:.0f}s")
+                return response
+            if retries.next_delay(f"HTTP {response.status_code}") is None:
+                return response
+            response.close()
+            # acquire() also waits out a Retry-After pause
+            time.sleep(retries.delay)
+
+
+class PooledSession(_HookedSession, requests.Session):
+    """
+    A requests.Session bound to the module-level connection pool.
+
+    Cookies and headers are per session (so per scrape), but connections are
+    shared, so creating one per run is cheap.
+    """
+
+    def __init__(self):
+        super().__init__()
+        adapter = _shared_adapter()
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def close(self):
+        # The pooled adapter outlives the session; closing it would drop every keep-alive connection
+        pass
+
+
+def get_session(key: str, impersonate: Optional[str] = None):
+    """
+    Get an HTTP session for a scraper.
+
+    key names the caller (usually the scraper module). Without impersonate this
+    returns a fresh PooledSession on the shared pool. With impersonate (e.g.
+    "chrome120") it returns the curl_cffi session cached under key, with its
+    cookies cleared, so the curl handle and its live connections are reused by
+    the next warm invocation.
+    """
+    if impersonate is None:
+        return PooledSession()
+
+    cache_key = f"{key}:{impersonate}"
+    with _lock:
+        session = _impersonated.get(cache_key)
+        if session is None:
+            session = _impersonated_session_class()(impersonate=impersonate)
+            _impersonated[cache_key] = session
+            _session_counts['impersonated_created'] += 1
+        else:
+            session.cookies.clear()
+            _session_counts['impersonated_reused'] += 1
+    return session
+
+
+def get_stats() -> Dict[str, Any]:
+    """
+    Connection reuse counters since the container started.
+
+    For pooled hosts, connections is the number of TCP/TLS connections urllib3
+    opened; every other request rode an existing keep-alive connection, i.e. a
+    handshake saved. curl_cffi does not expose connection counts, so impersonated
+    traffic reports requests and warm session reuse only.
+    """
+    with _lock:
+        counts = dict(_request_counts)
+        sessions = dict(_session_counts)
+
+    connections = _pool_connections()
+    hosts: Dict[str, Dict[str, Any]] = {}
+    pooled_requests = 0
+    pooled_connections = 0
+    impersonated_requests = 0
+
+    for (transport, host), sent in counts.items():
+        entry = hosts.setdefault(host, {})
+        if transport == 'pooled':
+            opened = connections.get(host, 0)
+            entry['requests'] = sent
+            entry['connections'] = opened
+            pooled_requests += sent
+            pooled_connections += opened
+        else:
+            entry['impersonated_requests'] = sent
+            impersonated_requests += sent
+
+    return {
+        'requests': pooled_requests + impersonated_requests,
+        'pooled_requests': pooled_requests,
+        'connections_opened': pooled_connections,
+        'handshakes_saved': max(0, pooled_requests - pooled_connections),
+        'impersonated_requests': impersonated_requests,
+        'impersonated_sessions_created': sessions['impersonated_created'],
+        'impersonated_sessions_reused': sessions['impersonated_reused'],
+        'hosts': hosts,
+    }
+
+
+def _shared_adapter() -> HTTPAdapter:
+    global _adapter
+    if _adapter is None:
+        with _lock:
+            if _adapter is None:
+                _adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE)
+    return _adapter
+
+
+def _impersonated_session_class():
+    """curl_cffi is imported on first use so requests-only scrapers never load it."""
+    global _impersonated_class
+    if _impersonated_class is None:
+        from curl_cffi import requests as curl_requests
+
+        class ImpersonatedSession(_HookedSession, curl_requests.Session):
+            """
+            A curl_cffi session kept per scraper. curl_cffi gives each thread its own
+            curl handle, so concurrent page fetches are safe and the engine's long-lived
+            fetch threads keep their handles (and connections) warm.
+            """
+
+            _transport = 'impersonated'
+            _default_timeout = DEFAULT_TIMEOUT[1]
+            _retryable_errors = (
+                curl_requests.exceptions.Timeout,
+                curl_requests.exceptions.ConnectionError,
+                curl_requests.exceptions.ChunkedEncodingError,
+                curl_requests.exceptions.IncompleteRead,
+            )
+            _fatal_errors = (
+                curl_requests.exceptions.SSLError,
+                curl_requests.exceptions.CertificateVerifyError,
+                curl_requests.exceptions.DNSError,
+                curl_requests.exceptions.InvalidURL,
+            )
+
+        _impersonated_class = ImpersonatedSession
+    return _impersonated_class
+
+
+def _cap_timeout(timeout, remaining: float):
+    """timeout (seconds or a (connect, read) tuple) cut down to the seconds remaining."""
+    remaining = max(0.1, remaining)
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
+
+
+def _record_request(transport: str, url: str) -> None:
+    host = urlsplit(url).netloc
+    with _lock:
+        key = (transport, host)
+        _request_counts[key] = _request_counts.get(key, 0) + 1
+
+
+def _pool_connections() -> Dict[str, int]:
+    """Connections opened per host, read from the urllib3 pools behind the shared adapter."""
+    if _adapter is None:
+        return {}
+
+    pools = _adapter.poolmanager.pools
+    opened: Dict[str, int] = {}
+    for pool_key in list(pools.keys()):
+        pool = pools.get(pool_key)
+        if pool is None:
+            continue
+        host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+        opened[host] = opened.get(host, 0) + pool.num_connections
+    return opened
@@ -1,6 +1,6 @@
 from typing import List, Dict, Any
-import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
+from .http_client import get_session
 
 def scrape_huggingface(url: str) -> List[Dict[str, str]]:
     """
@@ -9,7 +9,7 @@ def scrape_huggingface(url: str) -> List[Dict[str, str]]:
     """
     print(f"[Hugging Face] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('huggingface')
     session.headers.update({
         'Authority': 'apply.workable.com',
         'Accept': 'application/json, text/plain, */*',
@@ -1,9 +1,9 @@
-import json
 from typing import List, Dict, Any
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
 import re
-import curl_cffi
+from .context import deadline_reached
+from .http_client import get_session
+from .embedded_json import extract_flight_json
 
 def scrape_imc(url: str) -> List[Dict[str, str]]:
     print(f"[IMC] Scraping: {url}")
@@ -20,7 +20,7 @@ def scrape_imc(url: str) -> List[Dict[str, str]]:
     print(f"[IMC] Active Filters: Depts={filter_depts}, Offices={filter_offices}")
 
     # --- STEP 2: Setup Session ---
-    session = curl_cffi.requests.Session(impersonate="chrome120")
+    session = get_session('imc', impersonate="chrome120")
     base_url = "https://www.imc.com/us/search-careers"
     
     all_jobs = []
@@ -30,6 +30,8 @@ def scrape_imc(url: str) -> List[Dict[str, str]]:
     MAX_PAGES = 10
     
     for page in range(1, MAX_PAGES + 1):
+        if deadline_reached():
+            break
         print(f"[IMC] Fetching Page {page}...")
         req_params['page'] = str(page)
         
@@ -37,64 +39,15 @@ def scrape_imc(url: str) -> List[Dict[str, str]]:
             response = session.get(base_url, params=req_params, timeout=30)
             html = response.text
             
-            # --- STEP 3: Robust JSON Extraction ---
-            
-            # Marker: \"jobs\":[  (This is how it appears in the Next.js JS stream)
-            # Indices: \ (0), " (1), j (2), o (3), b (4), s (5), \ (6), " (7), : (8), [ (9)
-            marker = r'\"jobs\":['
-            start_idx = html.find(marker)
+            # --- STEP 3: JSON Extraction ---
             
+            # The jobs array sits in the Next.js flight stream as \"jobs\":[...]
             jobs_data = []
-            
-            if start_idx != -1:
-                # We start extracting exactly at the '[' character
-                # The marker length is 10 characters. Index 9 is the '['.
-                # So start_idx + 9 is the index of '['.
-                array_start_idx = start_idx + 9
-                
-                # Check to be safe
-                if html[array_start_idx] != '[':
-                    # In case of slight variations, look for the first [ after marker
-                    array_start_idx = html.find('[', start_idx)
-                
-                if array_start_idx != -1:
-                    bracket_count = 0
-                    extracted_str = ""
-                    found_end = False
-                    
-                    # Loop starting from the first '['
-                    for i in range(array_start_idx, len(html)):
-                        char = html[i]
-                        extracted_str += char
-                        
-                        if char == '[':
-                            bracket_count += 1
-                        elif char == ']':
-                            bracket_count -= 1
-                        
-                        # Break only if we have closed the main array
-                        if bracket_count == 0:
-                            found_end = True
-                            break
-                    
-                    if found_end:
-                        try:
-                            # Sanitize the extracted string
-                            # It is a JS string literal content, so quotes are escaped (\")
-                            # We need to turn \" into " and \\ into \
-                            clean_json_str = extracted_str.replace('\\"', '"').replace('\\\\', '\\')
-                            
-                            jobs_data = json.loads(clean_json_str)
-                            print(f"[IMC] Successfully parsed {len(jobs_data)} jobs.")
-                        except json.JSONDecodeError:
-                            # Fallback: Try raw load (sometimes Next.js doesn't double escape simple structures)
-                            try:
-                                jobs_data = json.loads(extracted_str)
-                                print("[IMC] Parsed raw JSON (no unescape needed).")
-                            except:
-                                print("[IMC] Failed to parse JSON blob.")
-            else:
-                print(f"[IMC] Marker not found on page {page}. (Page might be empty or layout changed)")
+            try:
+                jobs_data = extract_flight_json(html, '"jobs":[')
+                print(f"[IMC] Successfully parsed {len(jobs_data)} jobs.")
+            except ValueError as e:
+                print(f"[IMC] No jobs array on page {page} ({e}). (Page might be empty or layout changed)")
 
             # If we still have no data, check for bot block
             if not jobs_data and "Just a moment" in html:
@@ -168,8 +121,6 @@ def scrape_imc(url: str) -> List[Dict[str, str]]:
             if len(jobs_data) < 10:
                 print("[IMC] Reached end of data.")
                 break
-                
-            time.sleep(1)
 
         except Exception as e:
             print(f"[IMC] Error on page {page}: {e}")
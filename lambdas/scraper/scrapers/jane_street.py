@@ -1,5 +1,7 @@
 from typing import List, Dict, Any
 import requests
+from .http_client import get_session
+from .conditional import conditional_get
 
 def scrape_jane_street(url: str) -> List[Dict[str, str]]:
     """
@@ -8,6 +10,7 @@ def scrape_jane_street(url: str) -> List[Dict[str, str]]:
     """
     
     print(f"[Jane Street] Fetching jobs from API...")
+    session = get_session('jane_street')
     
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -15,7 +18,7 @@ def scrape_jane_street(url: str) -> List[Dict[str, str]]:
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = conditional_get(session, url, headers=headers, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"[Jane Street] Request failed: {e}")
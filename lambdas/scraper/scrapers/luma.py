@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Set
-import requests
+from .http_client import get_session
 
 
 def scrape_luma(
@@ -20,6 +20,7 @@ def scrape_luma(
       https://jobs.gem.com/<boardId>/<extId>
     """
     print(f"Luma Scraping: {url}")
+    session = get_session('luma')
     print(f"Filtering departments: {sorted(allowed_departments)}")
 
     board_id = url.rstrip("/").split("/")[-1]  # "lumalabs-ai"
@@ -103,7 +104,7 @@ def scrape_luma(
     jobs: List[Dict[str, str]] = []
 
     try:
-        resp = requests.post(api_url, json=payload, headers=headers, timeout=20)
+        resp = session.post(api_url, json=payload, headers=headers, timeout=20)
         if resp.status_code != 200:
             print(f"Error: Status {resp.status_code}")
             return []
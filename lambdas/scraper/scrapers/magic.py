@@ -1,6 +1,7 @@
 from typing import List, Dict
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
+from .conditional import BoardNotModified, conditional_get
 
 def scrape_magic(url: str) -> List[Dict[str, str]]:
     """
@@ -8,7 +9,7 @@ def scrape_magic(url: str) -> List[Dict[str, str]]:
     """
     print(f"[Magic] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('magic')
     session.headers.update({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
         'Accept-Language': 'en-US,en;q=0.9',
@@ -27,7 +28,7 @@ def scrape_magic(url: str) -> List[Dict[str, str]]:
     jobs = []
     
     try:
-        response = session.get(url, timeout=30)
+        response = conditional_get(session, url, timeout=30)
         response.raise_for_status()
         
         html_content = response.content.decode('utf-8', errors='replace')
@@ -75,6 +76,8 @@ def scrape_magic(url: str) -> List[Dict[str, str]]:
                 print(f"[Magic] Error parsing job item: {e}")
                 continue
         
+    except BoardNotModified:
+        raise
     except Exception as e:
         print(f"[Magic] Request failed: {e}")
     
@@ -1,9 +1,10 @@
 import json
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
 import re
+from .context import deadline_reached, mark_partial
+from .http_client import get_session
+from .token_cache import get_token, invalidate_token, put_token, restore_cookies, session_cookies
 
 def scrape_meta(url: str) -> List[Dict[str, str]]:
     """
@@ -11,7 +12,7 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
     """
     print(f"Meta Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('meta')
     
     # 1. Headers: Mimic the exact headers from your network tab
     # Note: We let requests handle 'content-length' automatically
@@ -30,35 +31,9 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
         'x-fb-friendly-name': 'CareersJobSearchResultsV3DataQuery', # Updated friendly name
     })
 
-    # --- Step 1: Fetch LSD Token ---
-    print("Fetching tokens...")
-    try:
-        # We visit the base URL to get the token. 
-        # Using the specific search URL as the visit entry point is also safer for referer consistency.
-        init_resp = session.get(url)
-        init_resp.raise_for_status()
-        
-        # Regex to find LSD
-        # Pattern 1: JSON blob
-        match = re.search(r'"LSD".*?"token":"([^"]+)"', init_resp.text)
-        lsd_token = match.group(1) if match else None
-        
-        # Pattern 2: Hidden Input
-        if not lsd_token:
-            match_input = re.search(r'name="lsd" value="([^"]+)"', init_resp.text)
-            lsd_token = match_input.group(1) if match_input else None
-
-        if not lsd_token:
-            print("Could not find LSD token.")
-            return []
-            
-        print(f"Got Token: {lsd_token}")
-        
-        # Update headers with the found token
-        session.headers.update({'x-fb-lsd': lsd_token})
-        
-    except Exception as e:
-        print(f"Error extracting token: {e}")
+    # --- Step 1: Fetch LSD Token (cached across warm invocations) ---
+    lsd_token, token_cached = _lsd_token(session, url)
+    if not lsd_token:
         return []
 
     # --- Step 2: Parse URL for Search Filters ---
@@ -86,6 +61,8 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
         print(f"Scraping mode: {mode_label}")
 
         while has_next and page_count < 5:
+            if deadline_reached():
+                break
             page_count += 1
             
             # --- Constructing the Variables JSON ---
@@ -137,8 +114,20 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
                 # POST request with data=payload for application/x-www-form-urlencoded
                 resp = session.post("https://www.metacareers.com/graphql", data=payload, timeout=30)
                 
+                # Cached token expired early: fetch a fresh one once and retry
+                if resp.status_code in (401, 403) and token_cached:
+                    print(f"Status Error: {resp.status_code}; refreshing LSD token")
+                    invalidate_token('meta')
+                    lsd_token, token_cached = _lsd_token(session, url)
+                    if not lsd_token:
+                        mark_partial("Meta: no fresh LSD token")
+                        break
+                    payload['lsd'] = lsd_token
+                    resp = session.post("https://www.metacareers.com/graphql", data=payload, timeout=30)
+                
                 if resp.status_code != 200:
                     print(f"Status Error: {resp.status_code}")
+                    mark_partial(f"Meta page {page_count}: HTTP {resp.status_code}")
                     # print(resp.text) # Uncomment to debug
                     break
                 
@@ -192,9 +181,6 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
                 cursor = paging.get('next_cursor')
                 has_next = paging.get('has_next_page', False) and cursor
                 
-                # Sleep to be polite
-                time.sleep(1)
-                
             except Exception as e:
                 print(f"Error fetching page: {e}")
                 break
@@ -202,3 +188,48 @@ def scrape_meta(url: str) -> List[Dict[str, str]]:
     print(f"[Meta] Found {len(jobs)} jobs")
     return jobs
 
+
+def _lsd_token(session, url: str) -> Tuple[Optional[str], bool]:
+    """
+    The LSD token, set as the session's x-fb-lsd header along with the cookies
+    it was issued with. Served from the token cache while valid; otherwise
+    scraped from the search page. Returns (token, came_from_cache).
+    """
+    cached = get_token('meta')
+    if cached is not None:
+        restore_cookies(session, cached)
+        session.headers.update({'x-fb-lsd': cached['lsd']})
+        print("Using cached LSD token.")
+        return cached['lsd'], True
+
+    print("Fetching tokens...")
+    try:
+        # We visit the base URL to get the token. 
+        # Using the specific search URL as the visit entry point is also safer for referer consistency.
+        init_resp = session.get(url)
+        init_resp.raise_for_status()
+        
+        # Regex to find LSD
+        # Pattern 1: JSON blob
+        match = re.search(r'"LSD".*?"token":"([^"]+)"', init_resp.text)
+        lsd_token = match.group(1) if match else None
+        
+        # Pattern 2: Hidden Input
+        if not lsd_token:
+            match_input = re.search(r'name="lsd" value="([^"]+)"', init_resp.text)
+            lsd_token = match_input.group(1) if match_input else None
+
+        if not lsd_token:
+            print("Could not find LSD token.")
+            return None, False
+            
+        print(f"Got Token: {lsd_token}")
+        
+        # Update headers with the found token
+        session.headers.update({'x-fb-lsd': lsd_token})
+        put_token('meta', '', {'lsd': lsd_token, 'cookies': session_cookies(session)})
+        return lsd_token, False
+        
+    except Exception as e:
+        print(f"Error extracting token: {e}")
+        return None, False
@@ -1,10 +1,13 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
 import re
-import curl_cffi
+from .http_client import get_session
+from .engine import AsyncFetcher, sync_scraper
+from .pagination import Page, paginate_offsets
+from .token_cache import get_token, invalidate_token, put_token, restore_cookies, session_cookies
 
-def scrape_microsoft(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_microsoft(url: str) -> List[Dict[str, str]]:
     print(f"[Microsoft] Scraping: {url}")
     
     # --- STEP 1: Parse and Clean Parameters ---
@@ -37,40 +40,14 @@ def scrape_microsoft(url: str) -> List[Dict[str, str]]:
     print(f"[Microsoft] Initial Params: {api_params}")
 
     # --- STEP 2: Initialize Session ---
-    session = curl_cffi.requests.Session(impersonate="chrome120")
+    session = get_session('microsoft', impersonate="chrome120")
+    fetcher = AsyncFetcher(session)
     
-    # --- STEP 3: Handshake with Retry (Max 3 attempts) ---
-    csrf_token = None
-    max_retries = 3
-    
-    print("[Microsoft] Handshake (Getting CSRF)...")
-    
-    for attempt in range(1, max_retries + 1):
-        try:
-            init_resp = session.get("https://apply.careers.microsoft.com/careers", timeout=15)
-            
-            if init_resp.status_code == 200:
-                csrf_match = re.search(r'<meta name="_csrf" content="([^"]+)"', init_resp.text)
-                if csrf_match:
-                    csrf_token = csrf_match.group(1)
-                    print(f"[Microsoft] Token acquired on attempt {attempt}.")
-                    break # Success!
-                else:
-                    print(f"[Microsoft] Attempt {attempt}: No CSRF meta tag found.")
-            else:
-                print(f"[Microsoft] Attempt {attempt}: HTTP {init_resp.status_code}")
-                
-        except Exception as e:
-            print(f"[Microsoft] Attempt {attempt} failed: {e}")
-        
-        # Backoff delay (2s, 4s, etc.) if not successful
-        if attempt < max_retries:
-            delay = 2 * attempt
-            print(f"[Microsoft] Retrying in {delay} seconds...")
-            time.sleep(delay)
+    # --- STEP 3: CSRF token (cached across warm invocations) ---
+    csrf_token, token_cached = await _csrf_token(fetcher)
 
     if not csrf_token:
-        print("[Microsoft] Critical: Could not acquire CSRF token after 3 attempts.")
+        print("[Microsoft] Critical: Could not acquire CSRF token.")
         return []
 
     # --- STEP 4: Fetch Data with Pagination ---
@@ -83,65 +60,83 @@ def scrape_microsoft(url: str) -> List[Dict[str, str]]:
         'Origin': 'https://apply.careers.microsoft.com'
     }
     
-    all_jobs = []
-    
     # Ensure current_offset is an integer
     current_offset = int(api_params['start'])
     
     MAX_PAGES = 10
+    # The API serves 10 positions per page; a shorter page is the last one
+    PAGE_SIZE = 10
     
-    for i in range(MAX_PAGES):
-        print(f"[Microsoft] Fetching page {i+1} (Start Index: {current_offset})...")
+    async def fetch_page(offset: int) -> Optional[Page]:
+        nonlocal token_cached
+        # Explicitly set the 'start' parameter for this request
+        page_params = {**api_params, 'start': str(offset)}
+        resp = await fetcher.get(api_url, params=page_params, headers=headers, timeout=30)
         
-        # Explicitly update the 'start' parameter for this request
-        api_params['start'] = str(current_offset)
+        # Cached token expired early: redo the handshake once and retry
+        if resp.status_code in (401, 403) and token_cached:
+            print(f"[Microsoft] API Error {resp.status_code}; refreshing CSRF token")
+            invalidate_token('microsoft')
+            fresh_token, token_cached = await _csrf_token(fetcher)
+            if fresh_token:
+                headers['x-csrf-token'] = fresh_token
+                resp = await fetcher.get(api_url, params=page_params, headers=headers, timeout=30)
         
-        try:
-            resp = session.get(api_url, params=api_params, headers=headers, timeout=30)
-            
-            if resp.status_code != 200:
-                print(f"[Microsoft] API Error: {resp.status_code}")
-                break
-                
-            data = resp.json()
-            positions = data.get('data', {}).get('positions', [])
-            
-            count_found = len(positions)
-            
-            if count_found == 0:
-                print(f"[Microsoft] No more jobs found.")
-                break
-                
-            for pos in positions:
-                j_title = pos.get('name')
-                j_relative_url = pos.get('positionUrl')
-                j_locs = ", ".join(pos.get('locations', []))
-                
-                all_jobs.append({
-                    'title': j_title,
-                    'url': f"https://apply.careers.microsoft.com{j_relative_url}",
-                    'location': j_locs
-                })
-            
-            print(f"[Microsoft] Page {i+1}: Found {count_found} jobs.")
-            
-            # --- Pagination Logic ---
-            # Increase the offset by the actual number of items found.
-            # This ensures we start the next page exactly where the last one ended.
-            current_offset += count_found
+        if resp.status_code != 200:
+            print(f"[Microsoft] API Error: {resp.status_code}")
+            return None
             
-            # Stop if we found fewer than 20 results (standard page size seems to be 20)
-            # This saves an unnecessary extra request at the end
-            if count_found < 10:
-                print("[Microsoft] Reached end of results.")
-                break
-                
-            time.sleep(1.5) # Polite delay
-            
-        except Exception as e:
-            print(f"[Microsoft] Loop Error: {e}")
-            break
+        data = resp.json().get('data', {})
+        positions = data.get('positions', [])
+        
+        page_jobs = []
+        for pos in positions:
+            j_relative_url = pos.get('positionUrl')
+            page_jobs.append({
+                'title': pos.get('name'),
+                'url': f"https://apply.careers.microsoft.com{j_relative_url}",
+                'location': ", ".join(pos.get('locations', []))
+            })
+        
+        return Page(jobs=page_jobs, count=len(positions), total=data.get('count'))
+    
+    all_jobs = await paginate_offsets(fetch_page, current_offset, PAGE_SIZE, MAX_PAGES, label='Microsoft')
             
     print(f"[Microsoft] Total jobs collected: {len(all_jobs)}")
     return all_jobs
 
+
+async def _csrf_token(fetcher: AsyncFetcher) -> Tuple[Optional[str], bool]:
+    """
+    The careers page CSRF token, with its session cookies loaded into the
+    session. Served from the token cache while valid; otherwise read from the
+    careers page (the HTTP layer retries transient failures). Returns
+    (token, came_from_cache).
+    """
+    cached = get_token('microsoft')
+    if cached is not None:
+        restore_cookies(fetcher.session, cached)
+        print("[Microsoft] Using cached CSRF token.")
+        return cached['csrf'], True
+
+    print("[Microsoft] Handshake (Getting CSRF)...")
+    
+    try:
+        init_resp = await fetcher.get("https://apply.careers.microsoft.com/careers", timeout=15)
+    except Exception as e:
+        print(f"[Microsoft] Handshake failed: {e}")
+        return None, False
+    
+    if init_resp.status_code != 200:
+        print(f"[Microsoft] Handshake: HTTP {init_resp.status_code}")
+        return None, False
+    
+    csrf_match = re.search(r'<meta name="_csrf" content="([^"]+)"', init_resp.text)
+    if not csrf_match:
+        print("[Microsoft] Handshake: No CSRF meta tag found.")
+        return None, False
+    
+    csrf_token = csrf_match.group(1)
+    print("[Microsoft] Token acquired.")
+    put_token('microsoft', '', {'csrf': csrf_token, 'cookies': session_cookies(fetcher.session)})
+    return csrf_token, False
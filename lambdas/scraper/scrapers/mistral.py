@@ -1,6 +1,6 @@
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
 
 
 def scrape_mistral(url: str) -> List[Dict[str, str]]:
@@ -8,11 +8,12 @@ def scrape_mistral(url: str) -> List[Dict[str, str]]:
     Mistral (Lever) scraping logic.
     """
     print(f"Mistral Scraping: {url}")
+    session = get_session('mistral')
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
-    response = requests.get(url, headers=headers, timeout=30)
+    response = session.get(url, headers=headers, timeout=30)
     response.raise_for_status()
     
     soup = BeautifulSoup(response.text, 'html.parser')
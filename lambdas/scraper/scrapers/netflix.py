@@ -1,17 +1,19 @@
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+from .http_client import get_session
+from .engine import AsyncFetcher, sync_scraper
+from .pagination import Page, paginate_offsets
 
-def scrape_netflix(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_netflix(url: str) -> List[Dict[str, str]]:
     """
     Scraper for Netflix (Explore/Eightfold.ai).
     Uses the API endpoint: /api/apply/v2/jobs
-    Iterates by modifying the 'start' parameter.
+    Pages through the 'start' parameter, prefetching pages concurrently.
     """
     print(f"[Netflix] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('netflix')
     session.headers.update({
         'Authority': 'explore.jobs.netflix.net',
         'Accept': '*/*',
@@ -33,15 +35,11 @@ def scrape_netflix(url: str) -> List[Dict[str, str]]:
     # 2. API Configuration
     api_url = "https://explore.jobs.netflix.net/api/apply/v2/jobs"
     
-    jobs = []
-    start = 0
     num = 10 # Page size
     MAX_PAGES = 10
-    page_count = 0
+    fetcher = AsyncFetcher(session)
     
-    while page_count < MAX_PAGES:
-        print(f"[Netflix] Fetching results starting at {start}...")
-        
+    async def fetch_page(start: int) -> Optional[Page]:
         # 3. Construct Payload Parameters
         # Matches: domain=netflix.com&start=20&num=10&query=...&location=...&sort_by=new
         params = {
@@ -53,57 +51,39 @@ def scrape_netflix(url: str) -> List[Dict[str, str]]:
             'sort_by': 'new' 
         }
         
-        try:
-            response = session.get(api_url, params=params, timeout=30)
-            
-            if response.status_code != 200:
-                print(f"[Netflix] API Error {response.status_code}")
-                break
-                
-            data = response.json()
-            
-            # 4. Extract Jobs
-            positions = data.get('positions', [])
-            
-            if not positions:
-                print(f"[Netflix] No jobs found at start {start}. Stopping.")
-                break
-            
-            for pos in positions:
-                title = pos.get('name')
-                
-                # Use canonical URL if available, else build it
-                full_url = pos.get('canonicalPositionUrl')
-                if not full_url:
-                    job_id = pos.get('id')
-                    full_url = f"https://explore.jobs.netflix.net/careers/job/{job_id}"
-                
-                # Locations
-                locs = pos.get('locations', [])
-                location_str = "; ".join(locs) if locs else pos.get('location')
-                
-                jobs.append({
-                    'title': title,
-                    'url': full_url,
-                    'location': location_str
-                })
-            
-            count = len(positions)
-            print(f"[Netflix] Found {count} jobs on this page.")
+        response = await fetcher.get(api_url, params=params, timeout=30)
+        
+        if response.status_code != 200:
+            print(f"[Netflix] API Error {response.status_code}")
+            return None
             
-            # Pagination Logic
-            start += count
-            page_count += 1
+        data = response.json()
+        
+        # 4. Extract Jobs
+        positions = data.get('positions', [])
+        
+        page_jobs = []
+        for pos in positions:
+            # Use canonical URL if available, else build it
+            full_url = pos.get('canonicalPositionUrl')
+            if not full_url:
+                job_id = pos.get('id')
+                full_url = f"https://explore.jobs.netflix.net/careers/job/{job_id}"
             
-            # If we received fewer items than requested, we are at the end
-            if count < num:
-                break
-                
-            time.sleep(1)
+            # Locations
+            locs = pos.get('locations', [])
+            location_str = "; ".join(locs) if locs else pos.get('location')
             
-        except Exception as e:
-            print(f"[Netflix] Request failed: {e}")
-            break
+            page_jobs.append({
+                'title': pos.get('name'),
+                'url': full_url,
+                'location': location_str
+            })
+        
+        # 'count' is the total number of matching positions
+        return Page(jobs=page_jobs, count=len(positions), total=data.get('count'))
+    
+    jobs = await paginate_offsets(fetch_page, 0, num, MAX_PAGES, label='Netflix')
 
     print(f"[Netflix] Total jobs found: {len(jobs)}")
     return jobs
@@ -1,39 +1,20 @@
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional, Tuple
 import re
+from .context import deadline_reached, mark_partial
+from .http_client import get_session
+from .token_cache import get_token, invalidate_token, put_token, restore_cookies, session_cookies
 
 def scrape_optiver(base_url: str = "https://optiver.com/working-at-optiver/career-opportunities/") -> List[Dict[str, str]]:
     print(f"[Optiver] Starting scraper...")
     
-    session = requests.Session()
+    session = get_session('optiver')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
     })
 
-    # --- STEP 1: Extract Nonce from 'jobArchiveData' ---
-    print(f"[Optiver] Fetching main page to extract dynamic nonce...")
-    nonce = None
-    
-    try:
-        response = session.get(base_url, timeout=30)
-        
-        # Regex explanation:
-        # 1. Find 'var jobArchiveData'
-        # 2. Match the opening bracket '{' and any characters/newlines [\s\S]*? until...
-        # 3. We find "nonce": "CAPTURE_THIS"
-        pattern = r'var\s+jobArchiveData\s*=\s*\{[\s\S]*?"nonce"\s*:\s*"([^"]+)"'
-        
-        match = re.search(pattern, response.text)
-        
-        if match:
-            nonce = match.group(1)
-            print(f"[Optiver] Success! Found Nonce: {nonce}")
-        else:
-            print("[Optiver] WARNING: Could not find 'jobArchiveData' nonce.")
-            return []
-
-    except Exception as e:
-        print(f"[Optiver] Failed to fetch career page: {e}")
+    # --- STEP 1: Nonce from 'jobArchiveData' (cached across warm invocations) ---
+    nonce, nonce_cached = _nonce(session, base_url)
+    if not nonce:
         return []
 
     # --- STEP 2: Scrape API ---
@@ -56,6 +37,8 @@ def scrape_optiver(base_url: str = "https://optiver.com/working-at-optiver/caree
     max_pages = 1
     
     while current_page <= max_pages:
+        if deadline_reached():
+            break
         print(f"[Optiver] Fetching API page {current_page}...")
 
         payload = {
@@ -90,14 +73,27 @@ def scrape_optiver(base_url: str = "https://optiver.com/working-at-optiver/caree
         try:
             response = session.post(api_url, data=payload, timeout=30)
             
+            # WordPress answers 403 to an expired nonce: fetch a fresh one once and retry
+            if response.status_code in (401, 403) and nonce_cached:
+                print(f"[Optiver] API Error {response.status_code}; refreshing nonce")
+                invalidate_token('optiver', base_url)
+                nonce, nonce_cached = _nonce(session, base_url)
+                if not nonce:
+                    mark_partial(f"Optiver page {current_page}: no fresh nonce")
+                    break
+                payload['job_archive_nonce'] = nonce
+                response = session.post(api_url, data=payload, timeout=30)
+            
             if response.status_code != 200:
                 print(f"[Optiver] API Error {response.status_code}")
+                mark_partial(f"Optiver page {current_page}: HTTP {response.status_code}")
                 break
                 
             data = response.json()
             
             if not data.get('success'):
                 print(f"[Optiver] API rejected request. Nonce '{nonce}' might be invalid.")
+                invalidate_token('optiver', base_url)
                 break
 
             max_pages = data.get('max_num_pages', 1)
@@ -133,3 +129,41 @@ def scrape_optiver(base_url: str = "https://optiver.com/working-at-optiver/caree
     print(f"[Optiver] Total US jobs found: {len(all_jobs)}")
     return all_jobs
 
+
+def _nonce(session, base_url: str) -> Tuple[Optional[str], bool]:
+    """
+    The job archive nonce, with the cookies it was issued with loaded into the
+    session. Served from the token cache while valid; otherwise scraped from
+    the career page. Returns (nonce, came_from_cache).
+    """
+    cached = get_token('optiver', base_url)
+    if cached is not None:
+        restore_cookies(session, cached)
+        print(f"[Optiver] Using cached nonce: {cached['nonce']}")
+        return cached['nonce'], True
+
+    print(f"[Optiver] Fetching main page to extract dynamic nonce...")
+    
+    try:
+        response = session.get(base_url, timeout=30)
+        
+        # Regex explanation:
+        # 1. Find 'var jobArchiveData'
+        # 2. Match the opening bracket '{' and any characters/newlines [\s\S]*? until...
+        # 3. We find "nonce": "CAPTURE_THIS"
+        pattern = r'var\s+jobArchiveData\s*=\s*\{[\s\S]*?"nonce"\s*:\s*"([^"]+)"'
+        
+        match = re.search(pattern, response.text)
+        
+        if match:
+            nonce = match.group(1)
+            print(f"[Optiver] Success! Found Nonce: {nonce}")
+            put_token('optiver', base_url, {'nonce': nonce, 'cookies': session_cookies(session)})
+            return nonce, False
+        else:
+            print("[Optiver] WARNING: Could not find 'jobArchiveData' nonce.")
+            return None, False
+
+    except Exception as e:
+        print(f"[Optiver] Failed to fetch career page: {e}")
+        return None, False
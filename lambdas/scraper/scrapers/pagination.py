@@ -0,0 +1,103 @@
+"""
+Offset pagination with prefetch.
+
+The scraper supplies an async fetch_page(offset) that returns a Page. After the
+first page, the remaining offsets are requested concurrently instead of one by
+one: all of them when the API reported a total, otherwise in speculative windows
+of PREFETCH_WINDOW pages. Concurrency per host is capped by the engine's
+AsyncFetcher. Pages are merged in offset order with URL dedupe, and merging
+stops at the first failed, short, empty or all-duplicate page, exactly where the
+serial loop would have stopped. Past the company's deadline no further window
+is requested, and the jobs merged so far are returned.
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from .collector import JobCollector
+from .context import deadline_reached, mark_partial
+
+# Pages requested together when the total is unknown
+PREFETCH_WINDOW = int(os.environ.get('PREFETCH_WINDOW', '4'))
+
+
+class Page(NamedTuple):
+    jobs: List[Dict[str, str]]
+    # Items the API returned (before any filtering); a short page is the last one
+    count: int
+    # Total results reported by the API, if any; only the first page's is used
+    total: Optional[int] = None
+
+
+async def paginate_offsets(
+    fetch_page: Callable[[int], Awaitable[Optional[Page]]],
+    start: int,
+    page_size: int,
+    max_pages: int,
+    label: str,
+    window: int = PREFETCH_WINDOW,
+) -> List[Dict[str, str]]:
+    """
+    Collect jobs from offset start onwards, page_size per page, at most max_pages pages.
+
+    fetch_page returns None for a failed page (after logging why); exceptions
+    are caught and treated the same way. Either marks the company partial.
+    """
+    collector = JobCollector()
+
+    def merge(offset: int, page: Optional[Page]) -> bool:
+        """Adds the page's unseen jobs; returns whether later pages are still wanted."""
+        if page is None:
+            mark_partial(f"{label}: page at offset {offset} failed")
+            return False
+        if page.count == 0:
+            print(f"[{label}] No jobs at offset {offset}. Stopping.")
+            return False
+
+        stats = collector.add_page(page.jobs)
+
+        print(f"[{label}] Offset {offset}: {page.count} jobs, {stats.added} new (Total: {len(collector)})")
+
+        if stats.added == 0 and page.jobs:
+            print(f"[{label}] No new unique jobs found. Stopping.")
+            return False
+        if page.count < page_size:
+            print(f"[{label}] Reached last page (got {page.count} items).")
+            return False
+        return True
+
+    first = await _fetch(fetch_page, start, label)
+    if not merge(start, first):
+        return collector.jobs
+
+    offsets = [start + i * page_size for i in range(1, max_pages)]
+    # A full first page with a total that ends there means the field is not a real total
+    if first.total is not None and first.total > start + first.count:
+        print(f"[{label}] Total jobs available: {first.total}")
+        offsets = [offset for offset in offsets if offset < first.total]
+        windows = [offsets]
+    else:
+        windows = [offsets[i:i + window] for i in range(0, len(offsets), max(1, window))]
+
+    for batch in windows:
+        if not batch:
+            break
+        if deadline_reached():
+            print(f"[{label}] Deadline reached; stopping with {len(collector)} jobs")
+            break
+        print(f"[{label}] Prefetching offsets {batch[0]}-{batch[-1]} ({len(batch)} pages)...")
+        pages = await asyncio.gather(*(_fetch(fetch_page, offset, label) for offset in batch))
+        for offset, page in zip(batch, pages):
+            if not merge(offset, page):
+                return collector.jobs
+
+    return collector.jobs
+
+
+async def _fetch(fetch_page: Callable[[int], Awaitable[Optional[Page]]], offset: int, label: str) -> Optional[Page]:
+    try:
+        return await fetch_page(offset)
+    except Exception as e:
+        print(f"[{label}] Request failed at offset {offset}: {e}")
+        return None
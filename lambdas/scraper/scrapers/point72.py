@@ -1,8 +1,8 @@
 import json
 from typing import List, Dict, Any
-import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
 import ast
+from .http_client import get_session
 
 def scrape_point72(url: str = "https://careers.point72.com/") -> List[Dict[str, Any]]:
     print(f"[Point72] Scraping URL: {url}")
@@ -31,7 +31,7 @@ def scrape_point72(url: str = "https://careers.point72.com/") -> List[Dict[str,
     # We always scrape the base URL because that's where the data lives.
     base_url = "https://careers.point72.com/"
     
-    session = requests.Session()
+    session = get_session('point72')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
     })
@@ -0,0 +1,141 @@
+"""
+Adaptive per-host rate limiter.
+
+Every request from a get_session() session takes a token from its host's
+bucket first (http_client's request() hook), so scrapers need no sleeps of
+their own. Buckets adapt:
+    - 429 / 503 halves the host's rate, and a Retry-After pauses the host
+      for that long before the request is retried (retry.py)
+    - SPEEDUP_AFTER successes in a row raise the rate by SPEEDUP_FACTOR, up
+      to HOST_MAX_RATE
+Buckets live at module level, so a warm container keeps what it learned about
+each host. HOST_RATES gives hosts known to block bursts a slower start.
+"""
+
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Requests per second a host starts at, its burst, and the adaptive bounds
+HOST_RATE = float(os.environ.get('HOST_RATE', '10'))
+HOST_BURST = float(os.environ.get('HOST_BURST', '10'))
+HOST_MIN_RATE = 0.2
+HOST_MAX_RATE = float(os.environ.get('HOST_MAX_RATE', '40'))
+
+BACKOFF_FACTOR = 0.5
+SPEEDUP_FACTOR = 1.25
+SPEEDUP_AFTER = 10
+
+# Longest Retry-After honoured by waiting; longer ones fail the request instead
+MAX_RETRY_AFTER = 30.0
+
+THROTTLE_STATUSES = (429, 503)
+
+# Starting rates (and bursts) for hosts that block fast scraping
+HOST_RATES = {
+    'www.google.com': 0.5,
+    'www.metacareers.com': 1.0,
+    'www.imc.com': 1.0,
+    'www.citadel.com': 1.0,
+    'www.uber.com': 1.0,
+    'careers.adobe.com': 5.0,
+}
+
+
+class HostLimiter:
+    """Token bucket for one host, with AIMD rate adaptation."""
+
+    def __init__(self, host: str, rate: float, burst: float):
+        self.host = host
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.successes = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the host may be sent another request."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+                self.waited += wait
+            time.sleep(wait)
+
+    def observe(self, status_code: int, retry_after: Optional[float]) -> None:
+        """Adapt the rate to the host's answer."""
+        with self._lock:
+            if status_code in THROTTLE_STATUSES:
+                self.throttled += 1
+                self.successes = 0
+                self.rate = max(HOST_MIN_RATE, self.rate * BACKOFF_FACTOR)
+                self.tokens = 0.0
+                if retry_after is not None:
+                    self.paused_until = max(self.paused_until, time.monotonic() + min(retry_after, MAX_RETRY_AFTER))
+                print(f"[RateLimit] {self.host} answered {status_code}; slowing to {self.rate:.2f} req/s")
+            elif status_code < 400:
+                self.successes += 1
+                if self.successes >= SPEEDUP_AFTER:
+                    self.successes = 0
+                    self.rate = min(HOST_MAX_RATE, self.rate * SPEEDUP_FACTOR)
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(host: str) -> HostLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            rate = HOST_RATES.get(host, HOST_RATE)
+            limiter = HostLimiter(host, rate, min(rate, HOST_BURST))
+            _limiters[host] = limiter
+        return limiter
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Retry-After as seconds (delta-seconds or HTTP-date form), or None."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_stats() -> Dict[str, Any]:
+    """Per-host rate, throttled answers and seconds spent waiting, since the container started."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    hosts = {
+        limiter.host: {
+            'rate': round(limiter.rate, 2),
+            'throttled': limiter.throttled,
+            'waited_s': round(limiter.waited, 2),
+        }
+        for limiter in limiters
+    }
+    return {
+        'throttled': sum(h['throttled'] for h in hosts.values()),
+        'waited_s': round(sum(h['waited_s'] for h in hosts.values()), 2),
+        'hosts': hosts,
+    }
@@ -1,17 +1,19 @@
 from typing import List, Dict, Any
-import requests
 from bs4 import BeautifulSoup
+from .http_client import get_session
+from .conditional import conditional_get
 
 def scrape_rentech(url: str) -> List[Dict[str, str]]:
     """
     Renaissance Technologies scraping logic.
     """
     print(f"RenTech Scraping: {url}")
+    session = get_session('renaissance')
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
-    response = requests.get(url, headers=headers, timeout=30)
+    response = conditional_get(session, url, headers=headers, timeout=30)
     response.raise_for_status()
     
     soup = BeautifulSoup(response.text, 'html.parser')
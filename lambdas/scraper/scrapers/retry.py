@@ -0,0 +1,78 @@
+"""
+Retry policy of the shared HTTP layer.
+
+http_client's request() hook sends every request through a RetryState:
+    - retryable: timeouts, dropped connections, 408/425/429 and 5xx
+    - fatal: everything else (4xx, TLS and URL errors), returned or raised at once
+Retries wait with exponential backoff and decorrelated jitter (RETRY_BASE up
+to RETRY_CAP seconds), at most RETRY_ATTEMPTS times per request. They also
+draw on the company's retry budget (ScrapeContext.retry_budget), so one dead
+host cannot eat the whole invocation.
+
+No retry is started that would end past the company's deadline.
+
+A request that still fails after its retries, or on a fatal transport error,
+marks the company's ScrapeContext as partial. A non-retryable error status
+(e.g. a 401 for a stale token) is handed back to the scraper, which may
+recover from it. A scraper that abandons the page instead calls
+context.mark_partial(), as paginate_offsets does for a failed page. Either
+way the scraper may carry on with what it has, and the Lambda then records
+the jobs it got but does not treat the list as the whole board.
+"""
+
+import os
+import random
+from typing import Optional
+
+from .context import current_context
+
+RETRY_ATTEMPTS = int(os.environ.get('RETRY_ATTEMPTS', '3'))
+RETRY_BASE = float(os.environ.get('RETRY_BASE', '0.5'))
+RETRY_CAP = float(os.environ.get('RETRY_CAP', '10'))
+
+RETRYABLE_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+
+def is_retryable_status(status_code: int) -> bool:
+    return status_code in RETRYABLE_STATUSES
+
+
+class RetryState:
+    """Retry bookkeeping for one request."""
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+        self.retries = 0
+        self.delay = RETRY_BASE
+
+    def next_delay(self, reason: str) -> Optional[float]:
+        """
+        Seconds to wait before retrying after reason, or None to give up (and
+        mark the company partial).
+        """
+        ctx = current_context()
+        if self.retries >= RETRY_ATTEMPTS:
+            return self.give_up(f"{reason} after {self.retries} retries")
+        # Decorrelated jitter: spreads out the retries of concurrent requests to one host
+        delay = min(RETRY_CAP, random.uniform(RETRY_BASE, self.delay * 3))
+        remaining = ctx.remaining() if ctx is not None else None
+        if remaining is not None and remaining <= delay:
+            print(f"[Retry] Not retrying {self.method} {self.url} ({reason}): deadline too close")
+            ctx.mark_truncated()
+            return None
+        if ctx is not None and not ctx.take_retry():
+            return self.give_up(f"{reason}; retry budget spent")
+
+        self.retries += 1
+        self.delay = delay
+        print(f"[Retry] {self.method} {self.url}: {reason}; retry {self.retries} in {self.delay:.1f}s")
+        return self.delay
+
+    def give_up(self, reason: str) -> None:
+        """Record a request that failed for good."""
+        ctx = current_context()
+        if ctx is not None:
+            ctx.mark_partial(f"{self.method} {self.url}: {reason}")
+        print(f"[Retry] Giving up on {self.method} {self.url}: {reason}")
+        return None
@@ -1,13 +1,5 @@
 from typing import List, Dict, Set
-import requests
-
-
-def _get_metadata_value(job: Dict, key: str) -> str:
-    for m in (job.get("metadata") or []):
-        if m.get("name") == key:
-            v = m.get("value")
-            return "" if v is None else str(v).strip()
-    return ""
+from .greenhouse import scrape_greenhouse
 
 
 def scrape_robinhood(
@@ -25,47 +17,16 @@ def scrape_robinhood(
     },
 ) -> List[Dict[str, str]]:
     """
-    Scrapes Robinhood jobs from Greenhouse Job Board API, filtered to:
+    Scrapes Robinhood jobs from the Greenhouse board API, filtered to:
       - metadata["Careers Page Bucket"] == "ENGINEERING & SECURITY"
       - location.name in allowed_locations
 
     Returns: [{"title":..., "url":..., "location":...}, ...]
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
-        ),
-        "Accept": "application/json,*/*",
-        "Origin": "https://careers.robinhood.com",
-        "Referer": "https://careers.robinhood.com/",
-    }
-
-    resp = requests.get(url, headers=headers, timeout=30)
-    resp.raise_for_status()
-
-    jobs = resp.json().get("jobs", [])
-    out: List[Dict[str, str]] = []
-
-    for j in jobs:
-        bucket = _get_metadata_value(j, "Careers Page Bucket")
-        if bucket != allowed_bucket:
-            continue
-
-        loc_obj = j.get("location") or {}
-        location = (loc_obj.get("name") or "").strip()
-        if location not in allowed_locations:
-            continue
-
-        out.append(
-            {
-                "title": (j.get("title") or "").strip(),
-                "url": (j.get("absolute_url") or "").strip(),
-                "location": location,
-            }
-        )
-
-    # De-dupe by URL
-    out = list({x["url"]: x for x in out if x.get("url")}.values())
-    print(f"Robinhood: found {len(out)} jobs")
-    return out
+    return scrape_greenhouse(
+        url,
+        label="Robinhood",
+        metadata={"Careers Page Bucket": {allowed_bucket}},
+        location_names=allowed_locations,
+        board_urls=False,
+    )
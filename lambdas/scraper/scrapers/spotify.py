@@ -1,6 +1,7 @@
 from typing import List, Dict, Any
-import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
+from .http_client import get_session
+from .conditional import BoardNotModified, conditional_get
 
 def scrape_spotify(url: str) -> List[Dict[str, str]]:
     """
@@ -9,7 +10,7 @@ def scrape_spotify(url: str) -> List[Dict[str, str]]:
     """
     print(f"[Spotify] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('spotify')
     # Headers exactly as found in your network tab
     session.headers.update({
         'Authority': 'api-dot-new-spotifyjobs-com.nw.r.appspot.com',
@@ -39,7 +40,7 @@ def scrape_spotify(url: str) -> List[Dict[str, str]]:
     
     try:
         print("[Spotify] Fetching jobs from API...")
-        response = session.get(api_url, params=api_params, timeout=30)
+        response = conditional_get(session, api_url, params=api_params, timeout=30)
         
         if response.status_code != 200:
             print(f"[Spotify] API Error {response.status_code}")
@@ -74,6 +75,8 @@ def scrape_spotify(url: str) -> List[Dict[str, str]]:
                 'location': location_str
             })
             
+    except BoardNotModified:
+        raise
     except Exception as e:
         print(f"[Spotify] Request failed: {e}")
 
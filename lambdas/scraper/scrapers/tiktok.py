@@ -1,9 +1,11 @@
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+from .http_client import get_session
+from .engine import AsyncFetcher, sync_scraper
+from .pagination import Page, paginate_offsets
 
-def scrape_tiktok(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_tiktok(url: str) -> List[Dict[str, str]]:
     """
     Scraper for TikTok Careers (API).
     Parses filters (category, location, recruitment type) from the URL 
@@ -11,7 +13,7 @@ def scrape_tiktok(url: str) -> List[Dict[str, str]]:
     """
     print(f"[TikTok] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('tiktok')
     session.headers.update({
         'Authority': 'api.lifeattiktok.com',
         'Accept': '*/*',
@@ -50,17 +52,11 @@ def scrape_tiktok(url: str) -> List[Dict[str, str]]:
 
     api_url = "https://api.lifeattiktok.com/api/v1/public/supplier/search/job/posts"
     
-    jobs = []
     MAX_PAGES = 50
     PAGE_SIZE = 12
+    fetcher = AsyncFetcher(session)
     
-    # Loop through pages
-    for i in range(MAX_PAGES):
-        # Calculate current offset based on start_offset + loop index
-        current_offset = start_offset + (i * PAGE_SIZE)
-        
-        print(f"[TikTok] Fetching page {i+1} (Offset: {current_offset})...")
-        
+    async def fetch_page(offset: int) -> Optional[Page]:
         # 2. Construct Payload
         # We inject the parsed lists directly into the JSON body
         payload = {
@@ -70,54 +66,38 @@ def scrape_tiktok(url: str) -> List[Dict[str, str]]:
             "location_code_list": location_codes,
             "keyword": keyword,
             "limit": PAGE_SIZE,
-            "offset": current_offset
+            "offset": offset
         }
         
-        try:
-            response = session.post(api_url, json=payload, timeout=30)
-            
-            if response.status_code != 200:
-                print(f"[TikTok] API Error {response.status_code}")
-                break
-                
-            data = response.json()
-            
-            # 3. Extract Jobs
-            # Structure: data -> data -> job_post_list
-            inner_data = data.get('data', {})
-            job_list = inner_data.get('job_post_list', [])
-            
-            if not job_list:
-                print(f"[TikTok] No jobs found at offset {current_offset}. Stopping.")
-                break
+        response = await fetcher.post(api_url, json=payload, timeout=30)
+        
+        if response.status_code != 200:
+            print(f"[TikTok] API Error {response.status_code}")
+            return None
             
-            for item in job_list:
-                title = item.get('title')
-                job_id = item.get('id')
-                
-                # Construct URL
-                full_url = f"https://lifeattiktok.com/search/{job_id}"
-                
-                # Extract Location
-                city_info = item.get('city_info', {})
-                location = city_info.get('en_name', 'Not specified')
-                
-                jobs.append({
-                    'title': title,
-                    'url': full_url,
-                    'location': location
-                })
+        data = response.json()
+        
+        # 3. Extract Jobs
+        # Structure: data -> data -> job_post_list
+        inner_data = data.get('data', {})
+        job_list = inner_data.get('job_post_list', [])
+        
+        page_jobs = []
+        for item in job_list:
+            job_id = item.get('id')
             
-            # Check for end of results
-            if len(job_list) < PAGE_SIZE:
-                print("[TikTok] Reached end of results.")
-                break
-                
-            time.sleep(1) 
+            # Extract Location
+            city_info = item.get('city_info', {})
             
-        except Exception as e:
-            print(f"[TikTok] Request failed: {e}")
-            break
+            page_jobs.append({
+                'title': item.get('title'),
+                'url': f"https://lifeattiktok.com/search/{job_id}",
+                'location': city_info.get('en_name', 'Not specified')
+            })
+        
+        return Page(jobs=page_jobs, count=len(job_list), total=inner_data.get('count'))
+    
+    jobs = await paginate_offsets(fetch_page, start_offset, PAGE_SIZE, MAX_PAGES, label='TikTok')
 
     print(f"[TikTok] Total jobs found: {len(jobs)}")
     return jobs
@@ -0,0 +1,145 @@
+"""
+Cache for anti-bot and session tokens (CSRF tokens, nonces, session cookies).
+
+Several scrapers load a page first only to read a token from it: Meta's LSD
+token, Microsoft's CSRF meta tag, Optiver's WordPress nonce, Adobe's
+PLAY_SESSION cookie and Workday's CALYPSO_CSRF_TOKEN. The token is valid for
+a while, so it is cached per (source, key) with a per-source TTL. That lets a
+warm container skip the handshake page until the token actually expires.
+Tokens are usually bound to the session cookies, so a cached token keeps the
+cookies it was issued with, and replaying it restores them into the new
+session.
+
+Scrapers invalidate a token when the API rejects it (401/403), redo the
+handshake once, and retry.
+
+The cache lives in memory. When TOKEN_CACHE_FILE is set (e.g. locally, or
+/tmp in Lambda) it is also kept in that JSON file, so separate processes share
+it. Per-source TTLs can be overridden with TOKEN_TTL_{SOURCE}, e.g.
+TOKEN_TTL_META=600. A TTL of 0 turns caching off for that source.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+TOKEN_CACHE_FILE = os.environ.get('TOKEN_CACHE_FILE', '')
+
+# Seconds a token is reused; conservative next to the sites' own lifetimes
+DEFAULT_TTL_SECONDS = 900
+SOURCE_TTL_SECONDS = {
+    'meta': 1800,
+    'microsoft': 1200,
+    # WordPress nonces are valid for 12-24h
+    'optiver': 6 * 3600,
+    'adobe': 1800,
+    'workday': 1800,
+}
+
+
+def ttl_for(source: str) -> int:
+    override = os.environ.get(f"TOKEN_TTL_{source.upper()}")
+    if override is not None:
+        return int(override)
+    return SOURCE_TTL_SECONDS.get(source, DEFAULT_TTL_SECONDS)
+
+
+class TokenCache:
+    """(source, key) -> token record, with expiry; thread-safe."""
+
+    def __init__(self, path: str = ''):
+        self.path = path
+        self._lock = threading.Lock()
+        # 'source|key' -> {'value': {...}, 'expires_at': epoch seconds}
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str, key: str = '') -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(self._key(source, key))
+            if entry is None or entry['expires_at'] <= time.time():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry['value']
+
+    def put(self, source: str, key: str, value: Dict[str, Any]) -> None:
+        ttl = ttl_for(source)
+        if ttl <= 0:
+            return
+        with self._lock:
+            entries = self._load()
+            entries[self._key(source, key)] = {'value': value, 'expires_at': time.time() + ttl}
+            self._save(entries)
+
+    def invalidate(self, source: str, key: str = '') -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(self._key(source, key), None) is not None:
+                self._save(entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path:
+                try:
+                    with open(self.path) as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    pass
+            now = time.time()
+            self._entries = {k: v for k, v in self._entries.items() if v.get('expires_at', 0) > now}
+        return self._entries
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The in-memory copy still serves this container
+            print(f"[TokenCache] Failed to persist {self.path}: {e}")
+
+    @staticmethod
+    def _key(source: str, key: str) -> str:
+        return f"{source}|{key}"
+
+
+_cache = TokenCache(TOKEN_CACHE_FILE)
+
+
+def get_token(source: str, key: str = '') -> Optional[Dict[str, Any]]:
+    """The cached token record for (source, key), or None if absent or expired."""
+    return _cache.get(source, key)
+
+
+def put_token(source: str, key: str, value: Dict[str, Any]) -> None:
+    """Cache a token record (a JSON-serialisable dict) for the source's TTL."""
+    _cache.put(source, key, value)
+
+
+def invalidate_token(source: str, key: str = '') -> None:
+    """Drop a token the server rejected, so the next lookup redoes the handshake."""
+    _cache.invalidate(source, key)
+
+
+def session_cookies(session) -> Dict[str, str]:
+    """The session's cookies as a plain dict, for storing next to a token."""
+    return {name: value for name, value in session.cookies.items() if value is not None}
+
+
+def restore_cookies(session, token: Dict[str, Any]) -> None:
+    """Load the cookies a cached token was issued with into a fresh session."""
+    session.cookies.update(token.get('cookies') or {})
+
+
+def get_stats() -> Dict[str, int]:
+    """Token cache hits / misses since the container started."""
+    return {'hits': _cache.hits, 'misses': _cache.misses}
@@ -0,0 +1,235 @@
+"""
+Lightweight tracing for scraper runs.
+
+The orchestrator puts a run_id in every scraper payload. The scraper uses it as
+the trace id, so all invocations of one run share a trace. Spans nest through
+a ContextVar, like ScrapeContext: the invocation, each company's scrape and
+record phases, every HTTP request (http_client), shared parse steps, DynamoDB
+calls (botocore events) and the SNS publish. The engine copies contextvars
+onto its worker and fetch threads, so spans started there get the right parent.
+
+Spans are buffered and written by flush() at the end of the invocation:
+    TRACE_EXPORT=off    nothing recorded (default)
+    TRACE_EXPORT=jsonl  one JSON object per span appended to TRACE_FILE
+    TRACE_EXPORT=otlp   OTLP/HTTP JSON POSTed to TRACE_ENDPOINT (a collector, or
+                        scripts/trace_collector.py as a local stand-in)
+"""
+
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+TRACE_EXPORT = os.environ.get('TRACE_EXPORT', 'off')
+TRACE_FILE = os.environ.get('TRACE_FILE', '/tmp/job_scraper_spans.jsonl')
+TRACE_ENDPOINT = os.environ.get('TRACE_ENDPOINT', 'http://localhost:4318/v1/traces')
+SERVICE_NAME = os.environ.get('TRACE_SERVICE_NAME', 'job-scraper')
+
+
+class Span:
+    """One timed operation; attributes are plain JSON values."""
+
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'start_ns', 'end_ns', 'attributes', 'error')
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start_ns': self.start_ns,
+            'end_ns': self.end_ns,
+            'duration_ms': round(((self.end_ns or self.start_ns) - self.start_ns) / 1e6, 3),
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+
+_trace_id: ContextVar[Optional[str]] = ContextVar('trace_id', default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+_finished: List[Span] = []
+_finished_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return TRACE_EXPORT != 'off'
+
+
+def start_trace(run_id: Optional[str] = None) -> str:
+    """Make run_id (or a new id) the trace of spans started in this context; returns it."""
+    trace_id = run_id or secrets.token_hex(16)
+    _trace_id.set(trace_id)
+    return trace_id
+
+
+def start_span(name: str, **attributes) -> Optional[Span]:
+    """A child of the current span that does not become current; end it with end_span()."""
+    if not enabled():
+        return None
+    parent = _current_span.get()
+    trace_id = parent.trace_id if parent is not None else (_trace_id.get() or start_trace())
+    return Span(trace_id, parent.span_id if parent is not None else None, name, attributes)
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    if span is None:
+        return
+    span.end_ns = time.time_ns()
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    with _finished_lock:
+        _finished.append(span)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """A child of the current span, current inside the with block. Yields None when tracing is off."""
+    current = start_span(name, **attributes)
+    if current is None:
+        yield None
+        return
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        end_span(current, e)
+        raise
+    else:
+        end_span(current)
+    finally:
+        _current_span.reset(token)
+
+
+def traced(name: str) -> Callable:
+    """Decorator: run the function inside span(name)."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_aws_calls(client, service: str) -> None:
+    """
+    A span per API call of a boto3 client, e.g. dynamodb.BatchGetItem or
+    sns.Publish. botocore hands the before and after events of one call the
+    same request context dict, which carries the span between them.
+    """
+    events = client.meta.events
+    events.register(f'before-call.{service}', functools.partial(_before_aws_call, service))
+    events.register(f'after-call.{service}', _after_aws_call)
+    events.register(f'after-call-error.{service}', _after_aws_call_error)
+
+
+def _before_aws_call(service: str, model=None, context=None, **kwargs) -> None:
+    if context is not None and enabled():
+        context['trace_span'] = start_span(f"{service}.{model.name}", operation=model.name)
+
+
+def _after_aws_call(context=None, parsed=None, **kwargs) -> None:
+    if context is None:
+        return
+    span = context.pop('trace_span', None)
+    # Error responses arrive here too; e.g. ConditionalCheckFailed is how inserts dedupe, not a failure
+    error_code = (parsed or {}).get('Error', {}).get('Code')
+    if span is not None and error_code:
+        span.set('error_code', error_code)
+    end_span(span)
+
+
+def _after_aws_call_error(context=None, exception=None, **kwargs) -> None:
+    if context is not None:
+        end_span(context.pop('trace_span', None), exception)
+
+
+def flush() -> int:
+    """Export the spans finished so far; returns how many. Export failures are logged, never raised."""
+    with _finished_lock:
+        spans = list(_finished)
+        _finished.clear()
+    if not spans:
+        return 0
+
+    try:
+        if TRACE_EXPORT == 'jsonl':
+            with open(TRACE_FILE, 'a') as f:
+                for s in spans:
+                    f.write(json.dumps(s.to_dict()) + '\n')
+        elif TRACE_EXPORT == 'otlp':
+            request = urllib.request.Request(
+                TRACE_ENDPOINT,
+                data=json.dumps(otlp_payload(spans)).encode('utf-8'),
+                headers={'Content-Type': 'application/json'},
+                method='POST'
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                response.read()
+    except Exception as e:
+        print(f"[Tracing] Failed to export {len(spans)} spans to {TRACE_EXPORT}: {e}")
+    return len(spans)
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """Spans in the OTLP/HTTP JSON encoding (ExportTraceServiceRequest)."""
+    return {
+        'resourceSpans': [{
+            'resource': {'attributes': [_otlp_attribute('service.name', SERVICE_NAME)]},
+            'scopeSpans': [{
+                'scope': {'name': 'job_scraper'},
+                'spans': [_otlp_span(s) for s in spans],
+            }],
+        }],
+    }
+
+
+def _otlp_span(s: Span) -> Dict[str, Any]:
+    otlp = {
+        'traceId': s.trace_id,
+        'spanId': s.span_id,
+        'name': s.name,
+        'kind': 1,
+        'startTimeUnixNano': str(s.start_ns),
+        'endTimeUnixNano': str(s.end_ns or s.start_ns),
+        'attributes': [_otlp_attribute(k, v) for k, v in s.attributes.items() if v is not None],
+        # 1 = OK, 2 = ERROR
+        'status': {'code': 2, 'message': s.error} if s.error else {'code': 1},
+    }
+    if s.parent_id:
+        otlp['parentSpanId'] = s.parent_id
+    return otlp
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {'boolValue': value}
+    elif isinstance(value, int):
+        typed = {'intValue': str(value)}
+    elif isinstance(value, float):
+        typed = {'doubleValue': value}
+    else:
+        typed = {'stringValue': str(value)}
+    return {'key': key, 'value': typed}
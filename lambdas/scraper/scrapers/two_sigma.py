@@ -2,6 +2,9 @@ from typing import List, Dict, Any
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
+from .http_client import get_session
+from .collector import JobCollector
+from .context import DeadlineExceeded, deadline_reached, mark_partial
 
 
 def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
@@ -11,6 +14,7 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
     """
     
     print(f"[Two Sigma] Scraping: {url}")
+    session = get_session('two_sigma')
     
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -25,11 +29,13 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
     # Flatten params (parse_qs returns lists)
     base_params = {k: v[0] if len(v) == 1 else v for k, v in base_params.items()}
     
-    all_jobs = []
-    seen_urls = set()
+    collector = JobCollector()
     offset = 0
     
     while True:
+        if deadline_reached():
+            break
+        
         # Update offset
         base_params['jobOffset'] = str(offset)
         
@@ -47,7 +53,7 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
         print(f"[Two Sigma] Fetching offset {offset}: {page_url}")
         
         try:
-            response = requests.get(page_url, headers=headers, timeout=30)
+            response = session.get(page_url, headers=headers, timeout=30)
             
             if response.status_code == 404:
                 print(f"[Two Sigma] Page not found (404), stopping")
@@ -55,8 +61,12 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
             
             if response.status_code >= 400:
                 print(f"[Two Sigma] Error {response.status_code}, stopping")
+                mark_partial(f"Two Sigma offset {offset}: HTTP {response.status_code}")
                 break
                 
+        except DeadlineExceeded:
+            # Keep the pages fetched so far
+            break
         except requests.exceptions.RequestException as e:
             print(f"[Two Sigma] Request failed: {e}")
             break
@@ -70,7 +80,7 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
             print(f"[Two Sigma] No jobs found at offset {offset}, stopping")
             break
         
-        new_jobs_on_page = 0
+        page_jobs = []
         
         for article in job_articles:
             try:
@@ -82,11 +92,9 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
                 
                 job_url = title_link.get('href', '')
                 
-                if not job_url or job_url in seen_urls:
+                if not job_url:
                     continue
                 
-                seen_urls.add(job_url)
-                
                 # Get title
                 title = title_link.get_text(strip=True)
                 
@@ -121,22 +129,21 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
                     if experience != 'Experienced':
                         continue  # Skip non-experienced roles
                 
-                all_jobs.append({
+                page_jobs.append({
                     'title': title,
                     'url': job_url,
                     'location': location
                 })
                 
-                new_jobs_on_page += 1
-                
             except Exception as e:
                 print(f"[Two Sigma] Error parsing job: {e}")
                 continue
         
-        print(f"[Two Sigma] Found {new_jobs_on_page} new jobs at offset {offset}")
+        stats = collector.add_page(page_jobs)
+        print(f"[Two Sigma] Found {stats.added} new jobs at offset {offset}")
         
         # No new jobs = end of results
-        if new_jobs_on_page == 0:
+        if stats.added == 0:
             print(f"[Two Sigma] No new jobs at offset {offset}, stopping")
             break
         
@@ -148,6 +155,6 @@ def scrape_two_sigma(url: str) -> List[Dict[str, str]]:
         # Increment offset by page size
         offset += int(base_params.get('jobRecordsPerPage', 10))
     
-    print(f"[Two Sigma] Total jobs found: {len(all_jobs)}")
-    return all_jobs
+    print(f"[Two Sigma] Total jobs found: {len(collector)}")
+    return collector.jobs
 
@@ -1,7 +1,7 @@
 from typing import List, Dict, Any
-import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+from .context import deadline_reached, mark_partial
+from .http_client import get_session
 
 def scrape_uber(url: str) -> List[Dict[str, str]]:
     """
@@ -10,7 +10,7 @@ def scrape_uber(url: str) -> List[Dict[str, str]]:
     """
     print(f"[Uber] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('uber')
     session.headers.update({
         'Authority': 'www.uber.com',
         'Accept': '*/*',
@@ -61,6 +61,8 @@ def scrape_uber(url: str) -> List[Dict[str, str]]:
     
     # Loop through pages (Uber API uses 0-based page index, limit 10)
     while page < MAX_PAGES:
+        if deadline_reached():
+            break
         print(f"[Uber] Fetching page {page}...")
         
         # 2. Construct JSON Payload
@@ -85,6 +87,7 @@ def scrape_uber(url: str) -> List[Dict[str, str]]:
             
             if response.status_code != 200:
                 print(f"[Uber] API Error {response.status_code}")
+                mark_partial(f"Uber page {page}: HTTP {response.status_code}")
                 break
                 
             data = response.json()
@@ -137,7 +140,6 @@ def scrape_uber(url: str) -> List[Dict[str, str]]:
                 break
                 
             page += 1
-            time.sleep(1)
             
         except Exception as e:
             print(f"[Uber] Request failed: {e}")
@@ -1,18 +1,21 @@
 from typing import List, Dict, Any
-import requests
+import asyncio
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin, unquote
-import time
+from .http_client import get_session
+from .context import mark_partial
+from .engine import AsyncFetcher, sync_scraper
 
-def scrape_waymo(url: str) -> List[Dict[str, str]]:
+@sync_scraper
+async def scrape_waymo(url: str) -> List[Dict[str, str]]:
     """
     Scraper for Waymo Careers.
-    Iterates up to 10 pages by modifying the 'page' query parameter.
+    Walks up to 10 pages of the 'page' query parameter, fetching a few at a time.
     Preserves filter arrays (e.g. country_codes[]).
     """
     print(f"[Waymo] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('waymo')
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
@@ -36,20 +39,34 @@ def scrape_waymo(url: str) -> List[Dict[str, str]]:
     
     all_jobs = []
     PAGES_TO_SCRAPE = 10
+    # Pages requested together; results are still consumed in page order
+    PAGE_WINDOW = 3
+    
+    fetcher = AsyncFetcher(session)
+    pages = list(range(start_page, start_page + PAGES_TO_SCRAPE))
+    responses = {}
     
     # Loop from start_page up to start_page + 10
-    for page_num in range(start_page, start_page + PAGES_TO_SCRAPE):
-        print(f"[Waymo] Fetching page {page_num}...")
-        
-        # Update page parameter
-        # Note: We overwrite the list with a new single-item list for 'page'
-        params['page'] = str(page_num)
+    for page_num in pages:
+        if page_num not in responses:
+            window = pages[pages.index(page_num):pages.index(page_num) + PAGE_WINDOW]
+            print(f"[Waymo] Fetching pages {window[0]}-{window[-1]}...")
+            
+            # Note: We overwrite the list with a new single-item list for 'page'
+            fetched = await asyncio.gather(
+                *(fetcher.get(base_url, params={**params, 'page': str(p)}, timeout=30) for p in window),
+                return_exceptions=True
+            )
+            responses.update(zip(window, fetched))
         
         try:
-            response = session.get(base_url, params=params, timeout=30)
+            response = responses[page_num]
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code != 200:
                 print(f"[Waymo] Error {response.status_code}")
+                mark_partial(f"Waymo page {page_num}: HTTP {response.status_code}")
                 break
                 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -103,8 +120,6 @@ def scrape_waymo(url: str) -> List[Dict[str, str]]:
             
             if new_jobs_count == 0:
                 break
-                
-            time.sleep(1) # Be polite
             
         except Exception as e:
             print(f"[Waymo] Request failed: {e}")
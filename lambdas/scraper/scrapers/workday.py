@@ -0,0 +1,162 @@
+"""
+Workday CXS engine.
+
+Every Workday careers site is backed by the same JSON endpoint:
+    POST https://{tenant}.wd{N}.myworkdayjobs.com/wday/cxs/{tenant}/{site}/jobs
+
+Tenant and site come from the public careers URL, and the URL's query string
+carries the search text and the facet filters. Some tenants only answer once
+the session holds the CALYPSO_CSRF_TOKEN cookie from the careers page. The
+handshake's cookies go to the token cache (token_cache.py) per host and are
+replayed into later sessions until they expire or the API rejects them. The
+first page reports the total, and the paginator then fetches every remaining
+offset concurrently.
+
+A new Workday company only needs a registry entry:
+    'Some Company': ('workday', 'scrape_workday'),
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .http_client import get_session
+from .engine import AsyncFetcher, sync_scraper
+from .pagination import Page, paginate_offsets
+from .token_cache import get_token, invalidate_token, put_token, restore_cookies, session_cookies
+
+PAGE_SIZE = 20
+MAX_PAGES = 50
+
+CSRF_COOKIE = 'CALYPSO_CSRF_TOKEN'
+CSRF_HEADER = 'x-calypso-csrf-token'
+
+# Query parameters that are not facet filters
+_NON_FACET_PARAMS = {'q', 'searchText', 'offset', 'limit'}
+# Optional locale prefix of the careers URL, e.g. /en-US/NVIDIAExternalCareerSite
+_LOCALE_RE = re.compile(r'^[a-z]{2}-[A-Z]{2}$')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US',
+    'Content-Type': 'application/json',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin',
+}
+
+@sync_scraper
+async def scrape_workday(url: str, label: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Scrape any Workday careers site URL, with the search text (q / searchText)
+    and the facet filters of its query string applied.
+    """
+    parsed_url = urlparse(url)
+    netloc = parsed_url.netloc
+    tenant, site = tenant_and_site(url)
+    label = label or f"Workday:{tenant}"
+    print(f"[{label}] Scraping: {url}")
+
+    api_url = f"https://{netloc}/wday/cxs/{tenant}/{site}/jobs"
+
+    query_params = parse_qs(parsed_url.query)
+    search_text = query_params.get('q', [''])[0] or query_params.get('searchText', [''])[0]
+    start = int(query_params.get('offset', ['0'])[0])
+    limit = int(query_params.get('limit', [str(PAGE_SIZE)])[0])
+    # Lists as given, since Workday expects arrays
+    applied_facets = {k: v for k, v in query_params.items() if k not in _NON_FACET_PARAMS}
+
+    session = get_session('workday')
+    session.headers.update({**HEADERS, 'Origin': f"https://{netloc}", 'Referer': url})
+    fetcher = AsyncFetcher(session)
+
+    handshake_cached = await _handshake(fetcher, netloc, site, label)
+
+    async def fetch_page(offset: int) -> Optional[Page]:
+        nonlocal handshake_cached
+        payload = {
+            "appliedFacets": applied_facets,
+            "limit": limit,
+            "offset": offset,
+            "searchText": search_text,
+        }
+
+        response = await fetcher.post(api_url, json=payload, timeout=30)
+
+        # A stale handshake from an earlier invocation: redo it once and retry
+        if response.status_code in (401, 403, 422) and handshake_cached:
+            print(f"[{label}] API Error {response.status_code}; redoing CSRF handshake")
+            invalidate_token('workday', netloc)
+            handshake_cached = await _handshake(fetcher, netloc, site, label)
+            response = await fetcher.post(api_url, json=payload, timeout=30)
+
+        if response.status_code != 200:
+            print(f"[{label}] API Error {response.status_code}")
+            return None
+
+        data = response.json()
+        postings = data.get('jobPostings') or []
+
+        page_jobs = []
+        for post in postings:
+            # Requisition id is usually bulletFields[0], e.g. "R2192"
+            bullet_fields = post.get('bulletFields') or []
+            page_jobs.append({
+                'title': post.get('title') or '',
+                'url': f"https://{netloc}/{site}{post.get('externalPath') or ''}",
+                'location': post.get('locationsText') or '',
+                'req_id': (bullet_fields[0] or '') if bullet_fields else '',
+            })
+
+        # Workday only reports the total on the first page
+        return Page(jobs=page_jobs, count=len(postings), total=data.get('total') or None)
+
+    jobs = await paginate_offsets(fetch_page, start, limit, MAX_PAGES, label=label)
+
+    print(f"[{label}] Total jobs scraped: {len(jobs)}")
+    return jobs
+
+
+def tenant_and_site(url: str) -> Tuple[str, str]:
+    """
+    https://{tenant}.wd5.myworkdayjobs.com[/{locale}]/{site}/... -> (tenant, site)
+    """
+    parsed_url = urlparse(url)
+    tenant = parsed_url.netloc.split('.')[0]
+
+    path_parts = [p for p in parsed_url.path.split('/') if p]
+    if path_parts and _LOCALE_RE.match(path_parts[0]):
+        path_parts = path_parts[1:]
+    if not tenant or not path_parts:
+        raise ValueError(f"No Workday tenant/site in {url}")
+    return tenant, path_parts[0]
+
+
+async def _handshake(fetcher: AsyncFetcher, netloc: str, site: str, label: str) -> bool:
+    """
+    Load the careers page cookies (and CSRF token) into the session, from the
+    token cache when possible. Returns whether they came from the cache.
+    """
+    session = fetcher.session
+
+    token = get_token('workday', netloc)
+    cached = token is not None
+
+    if token is None:
+        try:
+            await fetcher.get(f"https://{netloc}/{site}/", timeout=20)
+        except Exception as e:
+            # Most tenants answer without it
+            print(f"[{label}] CSRF handshake failed ({e}); continuing without it")
+            return False
+        token = {'cookies': session_cookies(session)}
+        put_token('workday', netloc, token)
+    else:
+        restore_cookies(session, token)
+
+    csrf = token['cookies'].get(CSRF_COOKIE)
+    if csrf:
+        session.headers[CSRF_HEADER] = csrf
+
+    return cached
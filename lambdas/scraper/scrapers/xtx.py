@@ -1,5 +1,6 @@
 from typing import List, Dict, Any
-import requests
+from .http_client import get_session
+from .conditional import BoardNotModified, conditional_get
 
 def scrape_xtx(url: str = "https://api.xtxcareers.com/jobs.json") -> List[Dict[str, str]]:
     """
@@ -8,7 +9,7 @@ def scrape_xtx(url: str = "https://api.xtxcareers.com/jobs.json") -> List[Dict[s
     """
     print(f"[XTX Markets] Scraping: {url}")
     
-    session = requests.Session()
+    session = get_session('xtx')
     session.headers.update({
         'Authority': 'api.xtxcareers.com',
         'Accept': '*/*',
@@ -20,7 +21,7 @@ def scrape_xtx(url: str = "https://api.xtxcareers.com/jobs.json") -> List[Dict[s
     jobs = []
     
     try:
-        response = session.get(url, timeout=30)
+        response = conditional_get(session, url, timeout=30)
         
         if response.status_code != 200:
             print(f"[XTX Markets] API Error {response.status_code}")
@@ -61,6 +62,8 @@ def scrape_xtx(url: str = "https://api.xtxcareers.com/jobs.json") -> List[Dict[s
                 'location': location_str
             })
             
+    except BoardNotModified:
+        raise
     except Exception as e:
         print(f"[XTX Markets] Request failed: {e}")
 
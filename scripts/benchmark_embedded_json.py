@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+
+from scrapers.embedded_json import extract_flight_json
+from scrapers.fixtures import EXCHANGES_FILE
+
+# IMC's fixture from benchmark_scrapers.py, which `record IMC` replaces with a live capture
+IMC_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks', 'fixtures', 'imc')
+
+MARKER = '"jobs":['
+
+
+def legacy_extract(html: str):
+    """The character loop scrape_imc used before scrapers/embedded_json.py"""
+    start_idx = html.find(r'\"jobs\":[')
+    if start_idx == -1:
+        return []
+    array_start_idx = start_idx + 9
+
+    bracket_count = 0
+    extracted_str = ""
+    for i in range(array_start_idx, len(html)):
+        char = html[i]
+        extracted_str += char
+        if char == '[':
+            bracket_count += 1
+        elif char == ']':
+            bracket_count -= 1
+        if bracket_count == 0:
+            break
+
+    clean_json_str = extracted_str.replace('\\"', '"').replace('\\\\', '\\')
+    return json.loads(clean_json_str)
+
+
+def fixture_page() -> str:
+    """The first page IMC answered in its benchmark fixtures, as the scraper received it"""
+    with open(os.path.join(IMC_FIXTURES, 'manifest.json')) as f:
+        manifest = json.load(f)
+    with open(os.path.join(IMC_FIXTURES, EXCHANGES_FILE)) as f:
+        exchange = next(json.loads(line) for line in f if line.strip())
+    print(f"Page: {exchange['url']} ({'synthetic' if manifest.get('synthetic') else 'recorded ' + str(manifest.get('recorded_at'))})")
+    with open(os.path.join(IMC_FIXTURES, exchange['body_file']), encoding='utf-8') as f:
+        return f.read()
+
+
+def synthetic_page(num_jobs: int) -> str:
+    """A Next.js page with the jobs array inside a self.__next_f.push() string, like IMC's"""
+    jobs = [{
+        'id': 4000000 + i,
+        'title': f'Software Engineer {i}',
+        'offices': [{'name': 'Chicago'}, {'name': 'New York'}],
+        'departments': [{'name': 'Technology'}],
+        'metadata': [{'value': 'Full Time'}],
+        'content': 'Build low-latency trading systems in C++ and Python. ' * 20,
+    } for i in range(num_jobs)]
+
+    rsc = '5:["$","div",null,{"children":' + json.dumps({'jobs': jobs, 'total': num_jobs}, separators=(',', ':')) + '}]\n'
+    filler = '<div class="filler">' + 'x' * 200_000 + '</div>'
+    return (
+        '<!DOCTYPE html><html><head></head><body>' + filler +
+        '<script>self.__next_f.push([1,' + json.dumps(rsc) + '])</script>' +
+        '</body></html>'
+    )
+
+
+def bench(label: str, fn, html: str, repeat: int):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(html)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<10} {best * 1000:>9.1f} ms  ({len(result)} jobs)")
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare embedded-JSON extraction on an IMC-style page")
+    parser.add_argument('--page', help="Captured HTML page (default: IMC's first page in benchmarks/fixtures/imc)")
+    parser.add_argument('--synthetic', action='store_true', help="Generate a multi-megabyte page instead")
+    parser.add_argument('--jobs', type=int, default=3000, help="Jobs on the synthetic page")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, encoding='utf-8') as f:
+            html = f.read()
+    elif args.synthetic:
+        html = synthetic_page(args.jobs)
+    else:
+        html = fixture_page()
+
+    print("="*50)
+    print(f"Embedded JSON Extraction ({len(html) / 1_000_000:.1f} MB page)")
+    print("="*50)
+
+    old = bench('legacy', legacy_extract, html, args.repeat)
+    new = bench('raw_decode', lambda h: extract_flight_json(h, MARKER), html, args.repeat)
+
+    assert old == new, "Extractors disagree"
+    print("✅ Both extractors returned the same jobs")
@@ -0,0 +1,217 @@
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+FIXTURES_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+HISTORY_FILE = os.path.join(ROOT, 'benchmarks', 'history.jsonl')
+
+# Every run takes the cold path a fresh Lambda would: full GETs, no cached tokens or boards
+os.environ['VALIDATOR_STORE'] = 'off'
+os.environ['TOKEN_CACHE_FILE'] = ''
+os.environ['ASHBY_BOARD_TTL'] = '0'
+os.environ['TRACE_EXPORT'] = 'off'
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(ROOT, 'lambdas', 'scraper'))
+
+from scrapers import SCRAPERS, get_scraper
+from scrapers.collector import JobCollector
+from scrapers.fixtures import recording, replaying
+from scrapers.token_cache import SOURCE_TTL_SECONDS
+
+for source in SOURCE_TTL_SECONDS:
+    os.environ[f"TOKEN_TTL_{source.upper()}"] = '0'
+
+
+def fixture_dir(company_name: str) -> str:
+    return os.path.join(FIXTURES_DIR, re.sub(r'[^a-z0-9]+', '_', company_name.lower()).strip('_'))
+
+def read_manifest(company_name: str):
+    path = os.path.join(fixture_dir(company_name), 'manifest.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def seed_urls():
+    """company -> URL from seed_companies.py, read without importing it (it needs boto3)"""
+    with open(os.path.join(ROOT, 'scripts', 'seed_companies.py')) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'COMPANIES' for t in node.targets):
+            return {c['company_name']: c['url'] for c in ast.literal_eval(node.value)}
+    return {}
+
+def fingerprint(jobs) -> str:
+    collector = JobCollector()
+    collector.add_page(jobs)
+    return collector.fingerprint()
+
+def record(company_name: str, url: str):
+    """Scrape one company live and save every response, plus what the scraper made of them"""
+    directory = fixture_dir(company_name)
+    with recording(directory) as store:
+        jobs = get_scraper(company_name)(url)
+
+    manifest = {
+        'company': company_name,
+        'url': url,
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'pages': len(store.exchanges),
+        'jobs': len(jobs),
+        'fingerprint': fingerprint(jobs),
+    }
+    with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"📼 {company_name}: {len(store.exchanges)} responses, {len(jobs)} jobs -> {directory}")
+
+def replay_once(company_name: str, url: str):
+    """One offline scrape; returns (jobs, fixture store, wall seconds, CPU seconds)"""
+    scrape_fn = get_scraper(company_name)
+    with replaying(fixture_dir(company_name)) as store, contextlib.redirect_stdout(io.StringIO()):
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+        jobs = scrape_fn(url)
+        wall, cpu = time.perf_counter() - wall_started, time.process_time() - cpu_started
+    return jobs, store, wall, cpu
+
+def measure(company_name: str, manifest: dict, repeat: int):
+    """Median time of repeat replays, after a warm-up one (imports, regex compiles)"""
+    url = manifest['url']
+    jobs, store, _, _ = replay_once(company_name, url)
+
+    walls, cpus = [], []
+    for _ in range(repeat):
+        _, _, wall, cpu = replay_once(company_name, url)
+        walls.append(wall)
+        cpus.append(cpu)
+
+    # Separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    try:
+        replay_once(company_name, url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    wall = statistics.median(walls)
+    pages = store.replayed
+    return {
+        'pages': pages,
+        'jobs': len(jobs),
+        'wall_ms': round(wall * 1000, 2),
+        'cpu_ms': round(statistics.median(cpus) * 1000, 2),
+        'ms_per_page': round(wall * 1000 / pages, 2) if pages else None,
+        'jobs_per_s': round(len(jobs) / wall) if wall else None,
+        'peak_kib': round(peak / 1024),
+        # The parser's output differs from what was scraped live when recording
+        'output_changed': fingerprint(jobs) != manifest['fingerprint'],
+        'missing': len(store.missing),
+    }
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT, capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+def previous_results():
+    """company -> its latest result in the history file"""
+    latest = {}
+    if os.path.exists(HISTORY_FILE):
+        with open(HISTORY_FILE) as f:
+            for line in f:
+                if line.strip():
+                    latest.update(json.loads(line)['results'])
+    return latest
+
+def change(now, before) -> str:
+    if not before:
+        return ''
+    return f"{(now - before) / before * 100:+.0f}%"
+
+def run(companies, repeat: int, save: bool):
+    """Benchmark every company with fixtures, print a table and append it to the history file"""
+    before = previous_results()
+    results = {}
+
+    print(f"{'company':<26} {'pages':>5} {'jobs':>6} {'ms/page':>9} {'cpu ms':>9} {'vs last':>8} {'jobs/s':>9} {'peak KiB':>9}")
+    for company_name in companies:
+        manifest = read_manifest(company_name)
+        if manifest is None:
+            continue
+        try:
+            result = measure(company_name, manifest, repeat)
+        except Exception as e:
+            print(f"{company_name:<26} ❌ {type(e).__name__}: {e}")
+            continue
+        results[company_name] = result
+
+        notes = []
+        if result['output_changed']:
+            notes.append('output differs from recording')
+        if result['missing']:
+            notes.append(f"{result['missing']} requests not recorded")
+        print(
+            f"{company_name:<26} {result['pages']:>5} {result['jobs']:>6} {result['ms_per_page'] or 0:>9.2f} "
+            f"{result['cpu_ms']:>9.2f} {change(result['cpu_ms'], (before.get(company_name) or {}).get('cpu_ms')):>8} "
+            f"{result['jobs_per_s'] or 0:>9} {result['peak_kib']:>9}"
+            + (f"  ⚠️ {'; '.join(notes)}" if notes else '')
+        )
+
+    if not results:
+        print(f"No fixtures found in {FIXTURES_DIR}; capture some with: benchmark_scrapers.py record")
+        return
+
+    commit, dirty = git_commit()
+    entry = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'dirty': dirty,
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'results': results,
+    }
+    if save:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        with open(HISTORY_FILE, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+        print(f"📈 Appended to {HISTORY_FILE}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Offline benchmark of the scrapers' parsing on recorded responses")
+    parser.add_argument('mode', choices=['record', 'run'], help="record: scrape live and save fixtures; run: replay them and time the scrapers")
+    parser.add_argument('companies', nargs='*', help="Company names (default: every registered scraper)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed replays per company (the median is reported)")
+    parser.add_argument('--no-history', action='store_true', help="Do not append this run to benchmarks/history.jsonl")
+    args = parser.parse_args()
+
+    companies = args.companies or list(SCRAPERS)
+
+    if args.mode == 'record':
+        # Seed URLs, unless a fixture already says where it was recorded from
+        urls = seed_urls()
+        for company_name in companies:
+            url = (read_manifest(company_name) or {}).get('url') or urls.get(company_name)
+            if url is None:
+                print(f"⏭️  {company_name}: no URL in seed_companies.py")
+                continue
+            try:
+                record(company_name, url)
+            except Exception as e:
+                print(f"❌ {company_name}: {type(e).__name__}: {e}")
+    else:
+        run(companies, args.repeat, save=not args.no_history)
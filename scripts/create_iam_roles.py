@@ -51,9 +51,12 @@ def create_orchestrator_role():
             {
                 "Effect": "Allow",
                 "Action": [
-                    "dynamodb:Scan"
+                    "dynamodb:Query"
                 ],
-                "Resource": f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_companies"
+                "Resource": [
+                    f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_companies",
+                    f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_companies/index/*"
+                ]
             },
             {
                 "Effect": "Allow",
@@ -112,12 +115,15 @@ def create_scraper_role():
                 "Effect": "Allow",
                 "Action": [
                     "dynamodb:GetItem",
+                    "dynamodb:BatchGetItem",
                     "dynamodb:PutItem",
+                    "dynamodb:UpdateItem",
                     "dynamodb:Query"
                 ],
                 "Resource": [
                     f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_jobs",
-                    f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_jobs/index/*"
+                    f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_jobs/index/*",
+                    f"arn:aws:dynamodb:{REGION}:*:table/job_scraper_state"
                 ]
             },
             {
@@ -5,6 +5,21 @@ REGION = 'us-east-1'
 
 dynamodb = boto3.client('dynamodb', region_name=REGION)
 
+# Sparse index: only companies carrying the 'enabled' attribute (check == 'Yes') appear in it
+ENABLED_INDEX = {
+    'IndexName': 'enabled_index',
+    'KeySchema': [
+        {
+            'AttributeName': 'enabled',
+            'KeyType': 'HASH'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'INCLUDE',
+        'NonKeyAttributes': ['url']
+    }
+}
+
 def create_companies_table():
     """Create the companies table"""
     try:
@@ -20,13 +35,39 @@ def create_companies_table():
                 {
                     'AttributeName': 'company_name',
                     'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'enabled',
+                    'AttributeType': 'S'
                 }
             ],
+            GlobalSecondaryIndexes=[ENABLED_INDEX],
             BillingMode='PAY_PER_REQUEST'
         )
         print("✅ Companies table created successfully")
     except dynamodb.exceptions.ResourceInUseException:
         print("ℹ️ Companies table already exists")
+        add_enabled_index()
+
+def add_enabled_index():
+    """Add the sparse enabled_index to an existing companies table"""
+    table = dynamodb.describe_table(TableName='job_scraper_companies')['Table']
+    existing = [i['IndexName'] for i in table.get('GlobalSecondaryIndexes', [])]
+    if ENABLED_INDEX['IndexName'] in existing:
+        print("ℹ️ enabled_index already exists")
+        return
+    
+    dynamodb.update_table(
+        TableName='job_scraper_companies',
+        AttributeDefinitions=[
+            {
+                'AttributeName': 'enabled',
+                'AttributeType': 'S'
+            }
+        ],
+        GlobalSecondaryIndexUpdates=[{'Create': ENABLED_INDEX}]
+    )
+    print("✅ enabled_index creation started (run manage_companies.py backfill for existing rows)")
 
 def create_jobs_table():
     """Create the jobs table"""
@@ -69,8 +110,32 @@ def create_jobs_table():
     except dynamodb.exceptions.ResourceInUseException:
         print("ℹ️ Jobs table already exists")
 
+def create_state_table():
+    """Create the scraper state table (conditional GET validators and other per-run state)"""
+    try:
+        dynamodb.create_table(
+            TableName='job_scraper_state',
+            KeySchema=[
+                {
+                    'AttributeName': 'state_key',
+                    'KeyType': 'HASH'
+                }
+            ],
+            AttributeDefinitions=[
+                {
+                    'AttributeName': 'state_key',
+                    'AttributeType': 'S'
+                }
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        print("✅ State table created successfully")
+    except dynamodb.exceptions.ResourceInUseException:
+        print("ℹ️ State table already exists")
+
 if __name__ == '__main__':
     print("Creating DynamoDB tables...")
     create_companies_table()
     create_jobs_table()
+    create_state_table()
     print("Done!")
\ No newline at end of file
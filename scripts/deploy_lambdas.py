@@ -84,10 +84,10 @@ def create_zip(source_dir: str, output_path: str, include_scrapers: bool = False
             print(f"  Cleaning up Windows-specific files...")
             cleanup_windows_files(package_dir)
     
-    # Copy lambda function
-    lambda_file = os.path.join(source_dir, 'lambda_function.py')
-    if os.path.exists(lambda_file):
-        shutil.copy(lambda_file, package_dir)
+    # Copy lambda function and the modules next to it (e.g. known_jobs.py)
+    for file_name in sorted(os.listdir(source_dir)):
+        if file_name.endswith('.py'):
+            shutil.copy(os.path.join(source_dir, file_name), package_dir)
     
     # Copy scrapers directory if needed (for scraper lambda)
     if include_scrapers:
@@ -202,7 +202,9 @@ def main():
         memory=256,
         env_vars={
             'COMPANIES_TABLE': 'job_scraper_companies',
-            'SCRAPER_FUNCTION': 'job-scraper-function'
+            'SCRAPER_FUNCTION': 'job-scraper-function',
+            'DISPATCH_CONCURRENCY': '16',
+            'COMPANIES_PER_INVOKE': '6'
         }
     )
     
@@ -223,10 +225,12 @@ def main():
         role_name='job-scraper-scraper-role',
         handler='lambda_function.lambda_handler',
         timeout=300,
-        memory=512,
+        memory=1024,
         env_vars={
             'JOBS_TABLE': 'job_scraper_jobs',
-            'SNS_TOPIC_ARN': SNS_TOPIC_ARN
+            'STATE_TABLE': 'job_scraper_state',
+            'SNS_TOPIC_ARN': SNS_TOPIC_ARN,
+            'SCRAPE_CONCURRENCY': '6'
         }
     )
     
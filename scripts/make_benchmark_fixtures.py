@@ -0,0 +1,240 @@
+import argparse
+import json
+import os
+import random
+import sys
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# One request at a time, so concurrent pages are recorded in the same order on every run
+os.environ['PER_HOST_CONCURRENCY'] = '1'
+os.environ['PREFETCH_WINDOW'] = '1'
+
+# Shares benchmark_scrapers.py's environment (cold path, fixture paths) and record()
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import benchmark_scrapers
+from scrapers import http_client
+
+# Synthetic fixtures for benchmark_scrapers.py, for when the career sites can't
+# be reached. Each company's scraper runs unchanged against generated pages in
+# the shape its site serves, and record() captures the requests it really makes.
+# The pages come from a fixed seed, so regenerating them changes nothing.
+# Covers the shared engines (Greenhouse, Ashby, Workday) plus an HTML parser
+# (Airbnb) and the embedded-JSON one (IMC).
+
+SEED = 2024
+CITIES = ['San Francisco', 'New York City', 'Seattle', 'London', 'Zurich', 'Chicago', 'Amsterdam', 'Remote - US', 'Washington, DC', 'Austin']
+ROLES = ['Software Engineer', 'Research Scientist', 'Research Engineer', 'Infrastructure Engineer', 'Quantitative Researcher', 'Data Scientist', 'Product Manager', 'Security Engineer']
+AREAS = ['Training', 'Inference', 'Platform', 'Alignment', 'Robotics', 'Compilers', 'Networking', 'Storage', 'Trading Systems', 'Developer Tools']
+
+DESCRIPTION = (
+    '&lt;p&gt;You will design, build and operate systems used by every team, working closely '
+    'with researchers and engineers.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Several years of experience&lt;/li&gt;'
+    '&lt;li&gt;Strong fundamentals&lt;/li&gt;&lt;/ul&gt;'
+)
+
+
+def response(body, status_code: int = 200, content_type: str = 'application/json') -> requests.Response:
+    if not isinstance(body, (str, bytes)):
+        body = json.dumps(body)
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    r = requests.Response()
+    r.status_code = status_code
+    r.headers = CaseInsensitiveDict({'Content-Type': content_type})
+    r.encoding = 'utf-8'
+    r._content = body
+    return r
+
+def title(rng: random.Random) -> str:
+    return f"{rng.choice(ROLES)}, {rng.choice(AREAS)}"
+
+
+def greenhouse_board(num_jobs: int, departments, offices, content: bool):
+    """A boards-api.greenhouse.io jobs document; departments/offices are (id, name, parent id) lists"""
+    rng = random.Random(SEED)
+    jobs = []
+    for i in range(num_jobs):
+        job = {
+            'id': 4000000000 + i,
+            'title': title(rng),
+            'location': {'name': rng.choice(CITIES)},
+            'absolute_url': f"https://example.com/careers/{4000000000 + i}",
+            'updated_at': '2024-05-01T12:00:00-04:00',
+            'metadata': None,
+        }
+        if content:
+            department = rng.choice(departments)
+            office = rng.choice(offices)
+            job['content'] = DESCRIPTION
+            job['departments'] = [{'id': int(department[0]), 'name': department[1], 'parent_id': department[2], 'child_ids': []}]
+            job['offices'] = [{'id': int(office[0]), 'name': office[1], 'parent_id': office[2], 'child_ids': [], 'location': office[1]}]
+        jobs.append(job)
+    return {'jobs': jobs, 'meta': {'total': num_jobs}}
+
+def anthropic_responder():
+    query = parse_qs(urlparse(benchmark_scrapers.seed_urls()['Anthropic']).query)
+    # The seeded filter ids, plus as many departments and offices the filters leave out
+    departments = [(d, f"Department {d}", None) for d in query['departments[]']] + [(str(5000000000 + i), f"Other {i}", None) for i in range(4)]
+    # One child office under the first seeded one, which its filter also matches
+    offices = [(o, f"Office {o}", None) for o in query['offices[]']] + [('6000000001', 'Annex', int(query['offices[]'][0]))]
+    offices += [(str(6000000100 + i), f"Elsewhere {i}", None) for i in range(5)]
+    board = greenhouse_board(400, departments, offices, content=True)
+    return lambda method, url, kwargs: response(board)
+
+def deepmind_responder():
+    board = greenhouse_board(600, [], [], content=False)
+    return lambda method, url, kwargs: response(board)
+
+
+def openai_responder():
+    """ApiJobBoardWithTeams: teams plus every posting with its locations"""
+    rng = random.Random(SEED)
+    teams = [{'id': f"team-{i}", 'name': name, 'externalName': None, 'parentTeamId': None, '__typename': 'JobBoardTeam'}
+             for i, name in enumerate(AREAS + ['Sora', 'Post-training', 'Reasoning', 'Human Data', 'Go To Market', 'Finance'])]
+    postings = []
+    for i in range(800):
+        postings.append({
+            'id': f"00000000-0000-4000-8000-{i:012d}",
+            'title': title(rng),
+            'teamId': rng.choice(teams)['id'],
+            'locationId': f"loc-{i % 10}",
+            'locationName': rng.choice(CITIES),
+            'workplaceType': rng.choice(['Onsite', 'Hybrid', 'Remote']),
+            'employmentType': 'FullTime',
+            'secondaryLocations': [{'locationId': 'loc-x', 'locationName': rng.choice(CITIES), '__typename': 'JobPostingSecondaryLocation'}
+                                   for _ in range(rng.randint(0, 2))],
+            'compensationTierSummary': '$250K – $400K',
+            '__typename': 'JobPostingBrief',
+        })
+    board = {'data': {'jobBoard': {'teams': teams, 'jobPostings': postings, '__typename': 'JobBoard'}}}
+    return lambda method, url, kwargs: response(board)
+
+
+def nvidia_responder():
+    """The Workday careers page, then the CXS jobs API one offset at a time (total on the first page only)"""
+    rng = random.Random(SEED)
+    postings = [{
+        'title': title(rng),
+        'externalPath': f"/job/US-CA-Santa-Clara/Engineer_JR{2000000 + i}",
+        'locationsText': rng.choice(['US, CA, Santa Clara', 'US, WA, Redmond', '3 Locations', 'US, TX, Austin']),
+        'postedOn': 'Posted 3 Days Ago',
+        'bulletFields': [f"JR{2000000 + i}"],
+    } for i in range(430)]
+
+    def respond(method, url, kwargs):
+        if method.upper() == 'GET':
+            return response('<html><head><title>Careers</title></head><body></body></html>', content_type='text/html')
+        payload = kwargs['json']
+        offset, limit = payload['offset'], payload['limit']
+        page = {'jobPostings': postings[offset:offset + limit], 'facets': []}
+        page['total'] = len(postings) if offset == 0 else 0
+        return response(page)
+    return respond
+
+
+def imc_responder():
+    """search-careers pages whose jobs ship in a Next.js flight stream, after a large page body"""
+    rng = random.Random(SEED)
+    departments = ['Technology', 'Trading', 'Quant Research', 'Operations']
+    offices = ['Chicago', 'New York', 'Amsterdam', 'Sydney', 'Remote - US']
+    types = ['Experienced', 'Graduate', 'Internship']
+    pages = [100, 100, 100, 7]
+
+    def page_html(page: int) -> str:
+        first = sum(pages[:page - 1])
+        jobs = [{
+            'id': 4400000 + first + i,
+            'title': title(rng),
+            'offices': [{'name': rng.choice(offices)}],
+            'departments': [{'name': rng.choice(departments)}],
+            'metadata': [{'value': rng.choice(types)}],
+            'content': 'Build low-latency trading systems in C++ and Python. ' * 10,
+        } for i in range(pages[page - 1])]
+        rsc = '5:["$","div",null,{"children":' + json.dumps({'jobs': jobs, 'total': sum(pages)}, separators=(',', ':')) + '}]\n'
+        return (
+            '<!DOCTYPE html><html><head><title>Search careers</title></head><body>'
+            + '<div class="filler">' + 'x' * 100_000 + '</div>'
+            + '<script>self.__next_f.push([1,' + json.dumps(rsc) + '])</script></body></html>'
+        )
+
+    html_pages = [page_html(page) for page in range(1, len(pages) + 1)]
+
+    def respond(method, url, kwargs):
+        page = int(kwargs['params']['page'])
+        return response(html_pages[page - 1] if page <= len(pages) else html_pages[-1], content_type='text/html')
+    return respond
+
+
+def airbnb_responder():
+    """FacetWP listing pages, 20 jobs each, then a 'No results' pager"""
+    rng = random.Random(SEED)
+    pages = 8
+
+    def page_html(page: int) -> str:
+        if page > pages:
+            items = ''
+            pager = 'No results'
+        else:
+            items = ''.join(
+                '<li role="listitem" class="job-item"><div class="flex">'
+                f'<h3 class="text-size-4"><a href="/positions/{5500000 + page * 100 + i}/">{title(rng)}</a></h3>'
+                f'<div class="flex justify-end"><span>{rng.choice(CITIES)}</span></div></div></li>'
+                for i in range(20)
+            )
+            pager = ' '.join(str(n) for n in range(1, pages + 1))
+        return (
+            '<!DOCTYPE html><html><head><title>Open positions</title></head><body><nav>'
+            + '<a href="/">Home</a>' * 40 + '</nav>'
+            + f'<ul class="job-list" role="list">{items}</ul>'
+            + f'<div class="facetwp-facet" data-name="jobs_pager" data-type="pager">{pager}</div>'
+            + '<footer>' + '<p>Airbnb careers</p>' * 40 + '</footer></body></html>'
+        )
+
+    html_pages = {page: page_html(page) for page in range(1, pages + 2)}
+
+    def respond(method, url, kwargs):
+        page = int(parse_qs(urlparse(url).query)['_paged'][0])
+        return response(html_pages.get(page, html_pages[pages + 1]), content_type='text/html')
+    return respond
+
+
+RESPONDERS = {
+    'Anthropic': anthropic_responder,
+    'Deepmind': deepmind_responder,
+    'OpenAI': openai_responder,
+    'Nvidia': nvidia_responder,
+    'IMC': imc_responder,
+    'Airbnb': airbnb_responder,
+}
+
+def make_fixture(company_name: str, url: str):
+    """Record the company's scraper against its synthetic site, in place of the network"""
+    respond = RESPONDERS[company_name]()
+    original = http_client._HookedSession._send
+    http_client._HookedSession._send = lambda self, retries, method, request_url, *args, **kwargs: respond(method, request_url, kwargs)
+    try:
+        benchmark_scrapers.record(company_name, url)
+    finally:
+        http_client._HookedSession._send = original
+
+    path = os.path.join(benchmark_scrapers.fixture_dir(company_name), 'manifest.json')
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest['synthetic'] = True
+    # Regenerating leaves the fixture unchanged
+    manifest['recorded_at'] = None
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate synthetic benchmark fixtures (no network needed)")
+    parser.add_argument('companies', nargs='*', help=f"Default: {', '.join(RESPONDERS)}")
+    args = parser.parse_args()
+
+    urls = benchmark_scrapers.seed_urls()
+    for company_name in args.companies or list(RESPONDERS):
+        make_fixture(company_name, urls[company_name])
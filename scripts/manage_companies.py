@@ -26,23 +26,45 @@ def add_company():
     url = input("Careers URL: ")
     check = input("Check (Yes/No): ")
     
-    table.put_item(Item={
+    item = {
         'company_name': name,
         'url': url,
         'check': check
-    })
+    }
+    if check == 'Yes':
+        item['enabled'] = 'Yes'
+    
+    table.put_item(Item=item)
     print(f"✅ Added {name}")
 
 def update_check(company_name: str, check: str):
     """Update the check status for a company"""
+    # Keep the sparse enabled_index in sync: only enabled companies carry 'enabled'
+    if check == 'Yes':
+        update_expression = 'SET #check = :check, #enabled = :check'
+    else:
+        update_expression = 'SET #check = :check REMOVE #enabled'
+    
     table.update_item(
         Key={'company_name': company_name},
-        UpdateExpression='SET #check = :check',
-        ExpressionAttributeNames={'#check': 'check'},
+        UpdateExpression=update_expression,
+        ExpressionAttributeNames={'#check': 'check', '#enabled': 'enabled'},
         ExpressionAttributeValues={':check': check}
     )
     print(f"✅ Updated {company_name} check to {check}")
 
+def backfill_enabled():
+    """Set/remove the 'enabled' attribute on every row from its check value"""
+    response = table.scan()
+    companies = response['Items']
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        companies.extend(response['Items'])
+    
+    for company in companies:
+        update_check(company['company_name'], company.get('check', 'No'))
+    print(f"✅ Backfilled {len(companies)} companies")
+
 def delete_company(company_name: str):
     """Delete a company"""
     table.delete_item(Key={'company_name': company_name})
@@ -58,7 +80,8 @@ def main():
         print("3. Enable company (set Check=Yes)")
         print("4. Disable company (set Check=No)")
         print("5. Delete company")
-        print("6. Exit")
+        print("6. Backfill enabled index")
+        print("7. Exit")
         
         choice = input("\nChoice: ")
         
@@ -78,6 +101,8 @@ def main():
             if confirm.lower() == 'yes':
                 delete_company(name)
         elif choice == '6':
+            backfill_enabled()
+        elif choice == '7':
             break
 
 if __name__ == '__main__':
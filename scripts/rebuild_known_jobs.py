@@ -0,0 +1,74 @@
+import os
+import sys
+
+import boto3
+
+# Run from the repo root; reuses the scraper Lambda's encoding
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+
+from known_jobs import KnownJobs, state_key, write_known_jobs
+
+# Configure your region
+REGION = 'us-east-1'
+
+JOBS_TABLE = 'job_scraper_jobs'
+STATE_TABLE = 'job_scraper_state'
+COMPANIES_TABLE = 'job_scraper_companies'
+
+dynamodb = boto3.client('dynamodb', region_name=REGION)
+
+def list_company_names():
+    """Every company in the companies table"""
+    names = []
+    paginator = dynamodb.get_paginator('scan')
+    for page in paginator.paginate(TableName=COMPANIES_TABLE, ProjectionExpression='company_name'):
+        names.extend(item['company_name']['S'] for item in page['Items'])
+    return sorted(names)
+
+def stored_job_urls(company_name: str):
+    """All job URLs recorded for a company, from company_name_index"""
+    urls = []
+    paginator = dynamodb.get_paginator('query')
+    pages = paginator.paginate(
+        TableName=JOBS_TABLE,
+        IndexName='company_name_index',
+        KeyConditionExpression='company_name = :name',
+        ExpressionAttributeValues={':name': {'S': company_name}},
+        ProjectionExpression='job_url'
+    )
+    for page in pages:
+        urls.extend(item['job_url']['S'] for item in page['Items'])
+    return urls
+
+def rebuild(company_name: str):
+    """Replace a company's known-jobs set with one built from the jobs table"""
+    urls = stored_job_urls(company_name)
+    known = KnownJobs()
+    known.add(urls)
+    # Write every shard, not only changed ones
+    known.changed = True
+
+    attributes = write_known_jobs(dynamodb, STATE_TABLE, company_name, known)
+
+    # Keep the fingerprint and heartbeat; only the set is replaced
+    dynamodb.update_item(
+        TableName=STATE_TABLE,
+        Key={'state_key': {'S': state_key(company_name)}},
+        UpdateExpression='SET known_hashes = :hashes, known_shards = :shards, known_count = :count',
+        ExpressionAttributeValues={
+            ':hashes': attributes['known_hashes'],
+            ':shards': attributes['known_shards'],
+            ':count': attributes['known_count']
+        }
+    )
+    print(f"✅ {company_name}: {len(urls)} jobs, {len(known)} hashes, {known.shards} shard(s)")
+
+if __name__ == '__main__':
+    print("="*50)
+    print("Rebuild Known-Jobs Sets")
+    print("="*50)
+
+    # Companies given on the command line, or all of them
+    companies = sys.argv[1:] or list_company_names()
+    for name in companies:
+        rebuild(name)
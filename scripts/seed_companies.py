@@ -308,7 +308,11 @@ COMPANIES = [
 def seed_companies():
     """Seed the companies table with initial data"""
     for company in COMPANIES:
-        table.put_item(Item=company)
+        item = dict(company)
+        # 'enabled' is the key of the sparse enabled_index the orchestrator queries
+        if item['check'] == 'Yes':
+            item['enabled'] = 'Yes'
+        table.put_item(Item=item)
         print(f"✅ Added: {company['company_name']}")
 
 if __name__ == '__main__':
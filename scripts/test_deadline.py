@@ -0,0 +1,100 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+# lambda_function builds its boto3 clients at import; nothing here reaches AWS
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import lambda_function
+from scrapers import http_client
+from scrapers.context import scrape_context
+
+JOBS_PER_PAGE = 3
+PAGES = 3
+
+class AirbnbPages(BaseHTTPRequestHandler):
+    """Airbnb-style listing pages of JOBS_PER_PAGE jobs, then a 'No results' pager"""
+
+    def do_GET(self):
+        page = int(parse_qs(urlparse(self.path).query).get('_paged', ['1'])[0])
+        if page > PAGES:
+            items, pager = '', 'No results'
+        else:
+            items = ''.join(
+                f'<li role="listitem"><h3><a href="/positions/{page}{i}/">Engineer {page}.{i}</a></h3>'
+                f'<div class="flex justify-end"><span>Remote</span></div></li>'
+                for i in range(JOBS_PER_PAGE)
+            )
+            pager = '1 2 3'
+        body = (
+            f'<ul class="job-list" role="list">{items}</ul>'
+            f'<div class="facetwp-facet" data-name="jobs_pager" data-type="pager">{pager}</div>'
+        ).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class SlowLimiter:
+    """Lets the first request through, then waits past the deadline, as a throttled host would"""
+
+    def __init__(self, limiter, deadline: float):
+        self.limiter = limiter
+        self.deadline = deadline
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        if self.acquired > 1:
+            time.sleep(max(0, self.deadline - time.monotonic()) + 0.05)
+        self.limiter.acquire()
+
+    def observe(self, status_code, retry_after):
+        self.limiter.observe(status_code, retry_after)
+
+def run_with_deadline_on_page_2(url: str):
+    """process_company for Airbnb with the deadline passing while page 2 waits; returns (result, inserted, state writes)"""
+    inserted, state_writes = [], []
+    lambda_function.get_company_state = lambda company_name: {}
+    lambda_function.find_existing_urls = lambda urls: set()
+    lambda_function.insert_new_jobs = lambda company_name, jobs: inserted.extend(jobs) or jobs
+    lambda_function.send_notification = lambda company_name, new_jobs: None
+    lambda_function.put_company_state = lambda *args: state_writes.append(args)
+
+    deadline = time.monotonic() + 2
+    limiters = {}
+    get_limiter = http_client.get_limiter
+    http_client.get_limiter = lambda host: limiters.setdefault(host, SlowLimiter(get_limiter(host), deadline))
+    try:
+        with scrape_context('Airbnb', deadline) as ctx:
+            result = lambda_function.process_company('Airbnb', url, ctx)
+    finally:
+        http_client.get_limiter = get_limiter
+    return result, inserted, state_writes
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), AirbnbPages)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/positions/?_paged=1"
+
+    print("🧪 Scraping Airbnb with the deadline passing during page 2...")
+    try:
+        result, inserted, state_writes = run_with_deadline_on_page_2(url)
+    finally:
+        server.shutdown()
+
+    assert result.get('truncated') and result.get('partial'), result
+    assert result['total_jobs'] == JOBS_PER_PAGE, result
+    assert sorted(job['title'] for job in inserted) == [f"Engineer 1.{i}" for i in range(JOBS_PER_PAGE)], inserted
+    # A truncated list must not become the company's fingerprint
+    assert not state_writes, state_writes
+    print(f"✅ Page 1's {len(inserted)} jobs recorded; company state left as is")
@@ -0,0 +1,59 @@
+import os
+import sys
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+
+from scrapers import greenhouse
+
+# Engineering (1) > Infrastructure (2) > Storage (3); Sales (9) stands alone.
+# No posting is filed under Infrastructure, so only the board's tree links Storage to Engineering.
+BOARD_DEPARTMENTS = {
+    '1': ('Engineering', None),
+    '2': ('Infrastructure', '1'),
+    '3': ('Storage', '2'),
+    '9': ('Sales', None),
+}
+POSTINGS = [
+    {'id': 101, 'title': 'Storage Engineer', 'location': {'name': 'Remote'},
+     'departments': [{'id': 3, 'name': 'Storage', 'parent_id': 2}], 'offices': []},
+    {'id': 102, 'title': 'Account Executive', 'location': {'name': 'London'},
+     'departments': [{'id': 9, 'name': 'Sales', 'parent_id': None}], 'offices': []},
+]
+
+def scrape(url: str, postings=POSTINGS):
+    """scrape_greenhouse against the board above; returns (job titles, tree requests made)"""
+    tree_requests = []
+
+    def fetch_tree(board, kind, session=None):
+        tree_requests.append(kind)
+        return dict(BOARD_DEPARTMENTS)
+
+    fetch_board, greenhouse_fetch_tree = greenhouse.fetch_board, greenhouse.fetch_tree
+    greenhouse.fetch_board = lambda board, session=None, content=False: postings
+    greenhouse.fetch_tree = fetch_tree
+    try:
+        jobs = greenhouse.scrape_greenhouse(url, label='Example')
+    finally:
+        greenhouse.fetch_board, greenhouse.fetch_tree = fetch_board, greenhouse_fetch_tree
+    return [job['title'] for job in jobs], tree_requests
+
+if __name__ == '__main__':
+    board = 'https://job-boards.greenhouse.io/example'
+
+    print("🧪 Filtering on a grandparent department...")
+    titles, tree_requests = scrape(f"{board}?departments[]=1")
+    assert titles == ['Storage Engineer'], titles
+    assert tree_requests == ['departments'], tree_requests
+    print("✅ Engineering matches a Storage posting through Infrastructure")
+
+    print("🧪 Filtering on the posting's own department...")
+    titles, _ = scrape(f"{board}?departments[]=3")
+    assert titles == ['Storage Engineer'], titles
+    print("✅ Storage matches")
+
+    print("🧪 Filtering a board whose postings carry every ancestor...")
+    titles, tree_requests = scrape(f"{board}?departments[]=9", postings=POSTINGS[1:])
+    assert titles == ['Account Executive'], titles
+    assert tree_requests == [], "a complete tree needs no extra request"
+    print("✅ No extra request")
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import json
+
+# Run from the repo root with the scraper requirements installed locally
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper')
+
+# Heavy packages that a requests-only scraper should never pull in
+HEAVY_PACKAGES = ['bs4', 'curl_cffi', 'cloudscraper', 'lxml']
+
+CHILD = '''
+import json, sys
+from scrapers import get_scraper, has_scraper, SCRAPERS
+
+# Shared helpers (http_client, engines) may load too; only company modules count
+company_modules = {'scrapers.' + module for module, _ in SCRAPERS.values()}
+
+before = sorted(m for m in sys.modules if m in company_modules)
+known = has_scraper(sys.argv[1])
+get_scraper(sys.argv[1])
+after = sorted(m for m in sys.modules if m in company_modules)
+
+print(json.dumps({
+    'registered': len(SCRAPERS),
+    'has_scraper': known,
+    'before': before,
+    'after': after,
+    'heavy': sorted(p for p in %r if p in sys.modules),
+}))
+''' % (HEAVY_PACKAGES,)
+
+def check_company(company_name: str, expected_module: str, heavy_allowed: bool = False):
+    """Resolve one scraper in a fresh interpreter and check no other company module was imported"""
+    print(f"🧪 Resolving {company_name} in a fresh interpreter...")
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', CHILD, company_name],
+        cwd=SCRAPER_DIR
+    )
+    result = json.loads(output)
+
+    assert result['has_scraper'], f"{company_name} is not registered"
+    assert result['before'] == [], f"Importing the registry loaded scrapers: {result['before']}"
+    assert result['after'] == [f'scrapers.{expected_module}'], f"Unexpected scraper modules: {result['after']}"
+    if not heavy_allowed:
+        assert result['heavy'] == [], f"Heavy packages imported: {result['heavy']}"
+
+    print(f"✅ {company_name}: loaded {result['after']} (of {result['registered']} registered), heavy={result['heavy']}")
+
+if __name__ == '__main__':
+    print("="*50)
+    print("Scraper Registry Lazy Import Check")
+    print("="*50)
+
+    check_company('OpenAI', 'openai')
+    check_company('Anthropic', 'anthropic', heavy_allowed=True)
@@ -0,0 +1,73 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+
+# Committed fixtures (benchmarks/fixtures), so the default run needs no network;
+# importing benchmark_scrapers also puts live runs on its cold path (no caches)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_scrapers import fixture_dir, read_manifest
+from metrics import METRICS, emit_company_metrics
+from scrapers import get_platform, get_scraper
+from scrapers.context import run_measured, scrape_context
+from scrapers.fixtures import replaying
+
+def capture_record(company_name: str, url: str, live: bool = False):
+    """
+    Scrape one company as the Lambda does (no DynamoDB) and return the EMF
+    record it prints. Replays the company's fixtures unless live.
+    """
+    with contextlib.ExitStack() as stack:
+        if not live:
+            stack.enter_context(replaying(fixture_dir(company_name)))
+        ctx = stack.enter_context(scrape_context(company_name))
+        started = time.monotonic()
+        jobs = run_measured(ctx, get_scraper(company_name), url)
+        ctx.scrape_ms = (time.monotonic() - started) * 1000
+
+    result = {'company': company_name, 'total_jobs': len(jobs), 'new_jobs': 0}
+    if ctx.partial:
+        result['partial'] = True
+
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        emit_company_metrics(ctx, result, get_platform(company_name))
+
+    lines = [line for line in stdout.getvalue().splitlines() if line.startswith('{"_aws"')]
+    assert len(lines) == 1, f"expected one EMF line, got {len(lines)}"
+    return json.loads(lines[0])
+
+def check_record(record: dict):
+    """The record must declare every metric and dimension it carries"""
+    directive = record['_aws']['CloudWatchMetrics'][0]
+    for dimension_set in directive['Dimensions']:
+        for dimension in dimension_set:
+            assert isinstance(record.get(dimension), str), f"dimension {dimension} missing"
+    declared = {metric['Name'] for metric in directive['Metrics']}
+    assert declared == {name for name, _ in METRICS}
+    for name in declared:
+        assert isinstance(record.get(name), (int, float)), f"metric {name} missing"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Validate the EMF metrics record of one company's scrape")
+    parser.add_argument('company', nargs='?', default='Anthropic')
+    parser.add_argument('url', nargs='?', help="Default: the URL the fixtures were recorded from")
+    parser.add_argument('--live', action='store_true', help="Scrape the real site instead of replaying benchmarks/fixtures")
+    args = parser.parse_args()
+
+    url = args.url or (read_manifest(args.company) or {}).get('url')
+    if url is None:
+        sys.exit(f"No fixtures for {args.company}; pass a URL with --live")
+
+    print(f"🧪 Scraping {args.company} ({'live' if args.live else 'replayed'}) and capturing its metrics record...")
+    record = capture_record(args.company, url, live=args.live)
+    check_record(record)
+    print(json.dumps({k: v for k, v in record.items() if k != '_aws'}, indent=2))
+    print(f"✅ {args.company}: valid EMF record")
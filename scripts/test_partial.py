@@ -0,0 +1,102 @@
+import json
+import os
+import sys
+from http.client import HTTPMessage
+from urllib.parse import urlsplit
+
+# Run from the repo root with the scraper requirements installed locally
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambdas', 'scraper'))
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from scrapers import http_client
+from scrapers.context import scrape_context
+from scrapers.token_cache import invalidate_token, put_token
+from scrapers.workday import scrape_workday
+
+NETLOC = 'example.wd1.myworkdayjobs.com'
+URL = f"https://{NETLOC}/External"
+JOBS = 5
+
+class WorkdaySite(BaseAdapter):
+    """
+    A Workday tenant in place of the network: the careers page sets a fresh
+    CSRF cookie, and the jobs API answers 401 to any other token, or
+    api_status for every page when given.
+    """
+
+    def __init__(self, api_status: int = 200):
+        super().__init__()
+        self.api_status = api_status
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(f"{request.method} {urlsplit(request.url).path}")
+        if request.method == 'GET':
+            return self.response(request, 200, '<html></html>', {'Set-Cookie': 'CALYPSO_CSRF_TOKEN=fresh; Path=/'})
+        if self.api_status != 200:
+            return self.response(request, self.api_status, '{}')
+        if request.headers.get('x-calypso-csrf-token') != 'fresh':
+            return self.response(request, 401, '{}')
+        offset = json.loads(request.body)['offset']
+        postings = [
+            {'title': f"Engineer {i}", 'externalPath': f"/job/Remote/Engineer_R{i}", 'locationsText': 'Remote', 'bulletFields': [f"R{i}"]}
+            for i in range(offset, min(offset + 20, JOBS))
+        ]
+        return self.response(request, 200, json.dumps({'total': JOBS if offset == 0 else 0, 'jobPostings': postings}))
+
+    def response(self, request, status_code: int, body: str, headers=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+        response._content = body.encode()
+        response.url = request.url
+        response.request = request
+        # The session reads Set-Cookie from the raw response, as it would from urllib3
+        response.raw = _Raw(response.headers)
+        return response
+
+    def close(self):
+        pass
+
+class _Raw:
+    """Just enough of a urllib3 response for requests' cookie extraction"""
+
+    def __init__(self, headers):
+        msg = HTTPMessage()
+        for name, value in headers.items():
+            msg[name] = value
+        self._original_response = type('OriginalResponse', (), {'msg': msg})()
+
+def scrape_with(site: WorkdaySite, cached_token: bool):
+    """Scrape the fake tenant, starting from a stale cached CSRF token or none; returns (jobs, ctx)"""
+    invalidate_token('workday', NETLOC)
+    if cached_token:
+        put_token('workday', NETLOC, {'cookies': {'CALYPSO_CSRF_TOKEN': 'stale'}})
+
+    adapter = http_client._adapter
+    http_client._adapter = site
+    try:
+        with scrape_context('Example') as ctx:
+            jobs = scrape_workday(URL)
+    finally:
+        http_client._adapter = adapter
+        invalidate_token('workday', NETLOC)
+    return jobs, ctx
+
+if __name__ == '__main__':
+    print("🧪 Stale cached token: 401, fresh handshake, retry...")
+    site = WorkdaySite()
+    jobs, ctx = scrape_with(site, cached_token=True)
+    assert site.requests[0].startswith('POST') and 'GET /External/' in site.requests, site.requests
+    assert len(jobs) == JOBS, jobs
+    assert not ctx.partial, ctx.partial_reasons
+    print(f"✅ {len(jobs)} jobs after refreshing the token; not partial")
+
+    print("🧪 Jobs API answering 404 for good...")
+    jobs, ctx = scrape_with(WorkdaySite(api_status=404), cached_token=False)
+    assert jobs == [], jobs
+    assert ctx.partial, "a page abandoned on a 404 must mark the company partial"
+    print(f"✅ Partial: {'; '.join(ctx.partial_reasons)}")
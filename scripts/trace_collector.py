@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for an OTLP collector. Run it, then run the scraper with
+#   TRACE_EXPORT=otlp TRACE_ENDPOINT=http://localhost:4318/v1/traces
+# It appends every span it receives to --out in the TRACE_EXPORT=jsonl format
+# and prints each batch as a tree. --show prints a JSON-lines file instead.
+
+
+def spans_from_otlp(payload: dict):
+    """OTLP/HTTP JSON (ExportTraceServiceRequest) to the flat span dicts of TRACE_EXPORT=jsonl"""
+    for resource_spans in payload.get('resourceSpans', []):
+        for scope_spans in resource_spans.get('scopeSpans', []):
+            for s in scope_spans.get('spans', []):
+                start_ns = int(s['startTimeUnixNano'])
+                end_ns = int(s['endTimeUnixNano'])
+                status = s.get('status') or {}
+                yield {
+                    'trace_id': s['traceId'],
+                    'span_id': s['spanId'],
+                    'parent_id': s.get('parentSpanId') or None,
+                    'name': s['name'],
+                    'start_ns': start_ns,
+                    'end_ns': end_ns,
+                    'duration_ms': round((end_ns - start_ns) / 1e6, 3),
+                    'attributes': {a['key']: next(iter(a['value'].values())) for a in s.get('attributes', [])},
+                    'error': status.get('message') if status.get('code') == 2 else None,
+                }
+
+def print_trees(spans):
+    """Each trace's spans, children indented under their parent, in start order"""
+    by_trace = defaultdict(list)
+    for s in spans:
+        by_trace[s['trace_id']].append(s)
+
+    for trace_id, trace_spans in by_trace.items():
+        ids = {s['span_id'] for s in trace_spans}
+        children = defaultdict(list)
+        for s in sorted(trace_spans, key=lambda s: s['start_ns']):
+            # Spans whose parent is not in this batch are shown as roots
+            children[s['parent_id'] if s['parent_id'] in ids else None].append(s)
+
+        print(f"trace {trace_id} ({len(trace_spans)} spans)")
+
+        def show(parent_id, depth):
+            for s in children.get(parent_id, []):
+                attributes = ' '.join(f"{k}={v}" for k, v in s['attributes'].items() if k != 'run_id' and v is not None)
+                error = f"  ERROR {s['error']}" if s.get('error') else ''
+                print(f"{'  ' * (depth + 1)}{s['name']:<24} {s['duration_ms']:>10.1f} ms  {attributes}{error}")
+                show(s['span_id'], depth + 1)
+
+        show(None, 0)
+
+def serve(port: int, out: str):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != '/v1/traces':
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            spans = list(spans_from_otlp(json.loads(body)))
+            with open(out, 'a') as f:
+                for s in spans:
+                    f.write(json.dumps(s) + '\n')
+            print_trees(spans)
+            sys.stdout.flush()
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, format, *args):
+            pass
+
+    print(f"📡 Collecting OTLP/HTTP JSON spans on http://localhost:{port}/v1/traces -> {out}")
+    ThreadingHTTPServer(('', port), Handler).serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OTLP collector stand-in and trace viewer for the scraper's spans")
+    parser.add_argument('--port', type=int, default=4318)
+    parser.add_argument('--out', default='traces.jsonl', help="JSON-lines file the received spans are appended to")
+    parser.add_argument('--show', metavar='FILE', help="Print the traces in a TRACE_EXPORT=jsonl file and exit")
+    args = parser.parse_args()
+
+    if args.show:
+        if not os.path.exists(args.show):
+            sys.exit(f"No such file: {args.show}")
+        with open(args.show) as f:
+            print_trees([json.loads(line) for line in f if line.strip()])
+    else:
+        serve(args.port, args.out)